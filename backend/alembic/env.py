@@ -28,6 +28,10 @@ import src.db.models.user             # noqa: F401
 import src.db.models.project          # noqa: F401
 import src.db.models.message          # noqa: F401
 import src.db.models.cv               # noqa: F401
+import src.db.models.access_log       # noqa: F401
+import src.db.models.access_rollup    # noqa: F401
+import src.db.models.health_probe     # noqa: F401
+import src.db.models.translation_memory  # noqa: F401
 
 # ---------------------------------------------------------------------------
 # Import settings to get the live database URL (sync URL for Alembic)
@@ -0,0 +1,106 @@
+"""Add pre-aggregated access-statistics rollups.
+
+Revision ID: 0008_access_rollups
+Revises: 0007_project_github_link
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+import hashlib
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0008_access_rollups"
+down_revision: Union[str, None] = "0007_project_github_link"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Frozen copies of what the backfill needs (the application code may change
+# later; the schema history must not): rollup constants and the HyperLogLog
+# register encoding as of this revision.
+ALL = "all"
+DAY = "day"
+ALL_TIME_BUCKET = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_HLL_PRECISION = 12
+_HASH_BITS = 64
+
+
+def _day_start(ts: datetime) -> datetime:
+    return ts.astimezone(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _hll_add(registers: bytearray, value: str) -> None:
+    h = int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+    idx = h >> (_HASH_BITS - _HLL_PRECISION)
+    rest_bits = _HASH_BITS - _HLL_PRECISION
+    rank = rest_bits - (h & ((1 << rest_bits) - 1)).bit_length() + 1
+    if rank > registers[idx]:
+        registers[idx] = rank
+
+
+def upgrade() -> None:
+    op.create_table(
+        "access_rollups",
+        sa.Column("granularity", sa.String(8), primary_key=True),
+        sa.Column("bucket_start", sa.DateTime(timezone=True), primary_key=True),
+        sa.Column("hits", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("visitors", sa.LargeBinary(), nullable=True),
+    )
+    op.create_table(
+        "access_country_rollups",
+        sa.Column("granularity", sa.String(8), primary_key=True),
+        sa.Column("bucket_start", sa.DateTime(timezone=True), primary_key=True),
+        sa.Column("country", sa.String(10), primary_key=True),
+        sa.Column("hits", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+
+    # ── Backfill from the existing raw log ──
+    conn = op.get_bind()
+    conn.execute(sa.text("""
+        INSERT INTO access_rollups (granularity, bucket_start, hits)
+        SELECT 'hour', date_trunc('hour', timestamp AT TIME ZONE 'UTC') AT TIME ZONE 'UTC', count(*)
+        FROM access_logs GROUP BY 1, 2
+        UNION ALL
+        SELECT 'day', date_trunc('day', timestamp AT TIME ZONE 'UTC') AT TIME ZONE 'UTC', count(*)
+        FROM access_logs GROUP BY 1, 2
+        UNION ALL
+        SELECT 'all', :all_time, count(*)
+        FROM access_logs HAVING count(*) > 0
+    """), {"all_time": ALL_TIME_BUCKET})
+    conn.execute(sa.text("""
+        INSERT INTO access_country_rollups (granularity, bucket_start, country, hits)
+        SELECT 'day', date_trunc('day', timestamp AT TIME ZONE 'UTC') AT TIME ZONE 'UTC', country, count(*)
+        FROM access_logs WHERE country IS NOT NULL GROUP BY 1, 2, 3
+        UNION ALL
+        SELECT 'all', :all_time, country, count(*)
+        FROM access_logs WHERE country IS NOT NULL GROUP BY 1, 2, 3
+    """), {"all_time": ALL_TIME_BUCKET})
+
+    # Unique-visitor sketches have to be built client-side
+    sketches: dict = {}
+    rows = conn.execution_options(stream_results=True).execute(
+        sa.text("SELECT ip_address, timestamp FROM access_logs")
+    )
+    for ip, ts in rows:
+        for key in ((DAY, _day_start(ts)), (ALL, ALL_TIME_BUCKET)):
+            if key not in sketches:
+                sketches[key] = bytearray(1 << _HLL_PRECISION)
+            _hll_add(sketches[key], ip)
+    if sketches:
+        conn.execute(
+            sa.text(
+                "UPDATE access_rollups SET visitors = :visitors "
+                "WHERE granularity = :granularity AND bucket_start = :bucket_start"
+            ),
+            [
+                {"granularity": granularity, "bucket_start": start, "visitors": bytes(registers)}
+                for (granularity, start), registers in sketches.items()
+            ],
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("access_country_rollups")
+    op.drop_table("access_rollups")
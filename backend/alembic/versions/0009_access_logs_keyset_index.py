@@ -0,0 +1,23 @@
+"""Add (timestamp, id) index for keyset pagination of access_logs.
+
+Revision ID: 0009_access_logs_keyset_index
+Revises: 0008_access_rollups
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0009_access_logs_keyset_index"
+down_revision: Union[str, None] = "0008_access_rollups"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_access_logs_timestamp_id", "access_logs", ["timestamp", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_access_logs_timestamp_id", table_name="access_logs")
@@ -0,0 +1,140 @@
+"""Convert access_logs into a monthly range-partitioned table.
+
+Revision ID: 0010_partition_access_logs
+Revises: 0009_access_logs_keyset_index
+Create Date: 2026-10-18 00:00:00.000000
+
+The existing rows are copied into monthly partitions covering their time
+range (plus the next few months and a default catch-all partition). The
+primary key becomes ``(id, timestamp)`` because PostgreSQL requires the
+partition key in every unique constraint; ids keep coming from the same
+sequence.
+"""
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0010_partition_access_logs"
+down_revision: Union[str, None] = "0009_access_logs_keyset_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_COLUMNS = (
+    "id, ip_address, city, region, country, latitude, longitude, "
+    "org, timezone, range_minutes, timestamp"
+)
+_MONTHS_AHEAD = 3
+
+# Frozen copies of the partition naming as of this revision (the migration
+# must not depend on application code that may change later)
+_PARTITION_PREFIX = "access_logs_y"
+DEFAULT_PARTITION = "access_logs_default"
+
+
+def month_start(ts: datetime, offset: int = 0) -> datetime:
+    ts = ts.astimezone(timezone.utc)
+    months = ts.year * 12 + ts.month - 1 + offset
+    return datetime(months // 12, months % 12 + 1, 1, tzinfo=timezone.utc)
+
+
+def partition_name(month: datetime) -> str:
+    return f"{_PARTITION_PREFIX}{month.year:04d}m{month.month:02d}"
+
+
+def _create_indexes() -> None:
+    op.create_index("ix_access_logs_ip_address", "access_logs", ["ip_address"])
+    op.create_index("ix_access_logs_timestamp", "access_logs", ["timestamp"])
+    op.create_index("ix_access_logs_timestamp_id", "access_logs", ["timestamp", "id"])
+
+
+def _drop_indexes() -> None:
+    op.drop_index("ix_access_logs_timestamp_id", table_name="access_logs")
+    op.drop_index("ix_access_logs_timestamp", table_name="access_logs")
+    op.drop_index("ix_access_logs_ip_address", table_name="access_logs")
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    # ── Move the old table out of the way (its sequence is reused) ──
+    _drop_indexes()
+    op.execute("ALTER TABLE access_logs RENAME TO access_logs_unpartitioned")
+    op.execute(
+        "ALTER TABLE access_logs_unpartitioned "
+        "RENAME CONSTRAINT access_logs_pkey TO access_logs_unpartitioned_pkey"
+    )
+    op.execute("ALTER SEQUENCE access_logs_id_seq OWNED BY NONE")
+
+    op.execute("""
+        CREATE TABLE access_logs (
+            id INTEGER NOT NULL DEFAULT nextval('access_logs_id_seq'),
+            ip_address VARCHAR(45) NOT NULL,
+            city VARCHAR(255),
+            region VARCHAR(255),
+            country VARCHAR(10),
+            latitude FLOAT,
+            longitude FLOAT,
+            org VARCHAR(512),
+            timezone VARCHAR(100),
+            range_minutes INTEGER NOT NULL DEFAULT 10,
+            timestamp TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+            CONSTRAINT access_logs_pkey PRIMARY KEY (id, timestamp)
+        ) PARTITION BY RANGE (timestamp)
+    """)
+    op.execute("ALTER SEQUENCE access_logs_id_seq OWNED BY access_logs.id")
+
+    # ── Monthly partitions from the oldest row up to a few months ahead ──
+    oldest = conn.scalar(sa.text("SELECT min(timestamp) FROM access_logs_unpartitioned"))
+    now = datetime.now(timezone.utc)
+    month = month_start(oldest or now)
+    last = month_start(now, _MONTHS_AHEAD)
+    while month <= last:
+        op.execute(
+            f"CREATE TABLE {partition_name(month)} PARTITION OF access_logs "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{month_start(month, 1).isoformat()}')"
+        )
+        month = month_start(month, 1)
+    op.execute(f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF access_logs DEFAULT")
+
+    op.execute(
+        f"INSERT INTO access_logs ({_COLUMNS}) "
+        f"SELECT {_COLUMNS} FROM access_logs_unpartitioned"
+    )
+    op.drop_table("access_logs_unpartitioned")
+    _create_indexes()
+
+
+def downgrade() -> None:
+    _drop_indexes()
+    op.execute("ALTER TABLE access_logs RENAME TO access_logs_partitioned")
+    op.execute(
+        "ALTER TABLE access_logs_partitioned "
+        "RENAME CONSTRAINT access_logs_pkey TO access_logs_partitioned_pkey"
+    )
+    op.execute("ALTER SEQUENCE access_logs_id_seq OWNED BY NONE")
+
+    op.execute("""
+        CREATE TABLE access_logs (
+            id INTEGER NOT NULL DEFAULT nextval('access_logs_id_seq') PRIMARY KEY,
+            ip_address VARCHAR(45) NOT NULL,
+            city VARCHAR(255),
+            region VARCHAR(255),
+            country VARCHAR(10),
+            latitude FLOAT,
+            longitude FLOAT,
+            org VARCHAR(512),
+            timezone VARCHAR(100),
+            range_minutes INTEGER NOT NULL DEFAULT 10,
+            timestamp TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now()
+        )
+    """)
+    op.execute("ALTER SEQUENCE access_logs_id_seq OWNED BY access_logs.id")
+    op.execute(
+        f"INSERT INTO access_logs ({_COLUMNS}) "
+        f"SELECT {_COLUMNS} FROM access_logs_partitioned"
+    )
+    # Dropping the parent drops every attached partition with it
+    op.drop_table("access_logs_partitioned")
+    _create_indexes()
@@ -0,0 +1,43 @@
+"""Create health_check_probes table.
+
+Revision ID: 0011_health_check_probes
+Revises: 0010_partition_access_logs
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0011_health_check_probes"
+down_revision: Union[str, None] = "0010_partition_access_logs"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "health_check_probes",
+        sa.Column("id", sa.BigInteger(), primary_key=True, autoincrement=True),
+        sa.Column("url", sa.String(2048), nullable=False),
+        sa.Column(
+            "checked_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+            index=True,
+        ),
+        sa.Column("ok", sa.Boolean(), nullable=False),
+        sa.Column("status_code", sa.Integer(), nullable=True),
+        sa.Column("ttfb_ms", sa.Float(), nullable=True),
+        sa.Column("total_ms", sa.Float(), nullable=True),
+        sa.Column("error", sa.String(64), nullable=True),
+    )
+    op.create_index(
+        "ix_health_check_probes_url_checked_at", "health_check_probes", ["url", "checked_at"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("health_check_probes")
@@ -0,0 +1,27 @@
+"""Add source_language / source_snapshot to cv_data.
+
+Revision ID: 0012_cv_source_snapshot
+Revises: 0011_health_check_probes
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = "0012_cv_source_snapshot"
+down_revision: Union[str, None] = "0011_health_check_probes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("cv_data", sa.Column("source_language", sa.String(10), nullable=True))
+    op.add_column("cv_data", sa.Column("source_snapshot", postgresql.JSONB(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("cv_data", "source_snapshot")
+    op.drop_column("cv_data", "source_language")
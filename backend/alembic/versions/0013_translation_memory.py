@@ -0,0 +1,43 @@
+"""Create translation_memory table.
+
+Revision ID: 0013_translation_memory
+Revises: 0012_cv_source_snapshot
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0013_translation_memory"
+down_revision: Union[str, None] = "0012_cv_source_snapshot"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "translation_memory",
+        sa.Column("key", sa.String(64), primary_key=True),
+        sa.Column("model", sa.String(100), nullable=False),
+        sa.Column("source_language", sa.String(10), nullable=False),
+        sa.Column("target_language", sa.String(10), nullable=False),
+        sa.Column("source_text", sa.Text(), nullable=False),
+        sa.Column("translated_text", sa.Text(), nullable=False),
+        sa.Column("hits", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()
+        ),
+        sa.Column(
+            "last_used_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+            index=True,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("translation_memory")
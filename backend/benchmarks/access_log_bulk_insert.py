@@ -0,0 +1,94 @@
+"""
+Benchmark: access-log ingestion rows/second, per-row vs. bulk insert.
+
+Writes synthetic resolved entries (TEST-NET-2 addresses, 198.51.100.0/24) into
+the configured PostgreSQL database via
+
+* ``per-row`` - ``create_access_log`` (add + commit + refresh per row)
+* ``bulk``    - ``create_access_logs_bulk`` (multi-row INSERT … RETURNING, one commit)
+
+and deletes them again afterwards. Needs a migrated database reachable with
+the regular ``DB_*`` settings.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.access_log_bulk_insert --sizes 10 1000 50000
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timezone
+
+from sqlalchemy import delete
+
+from src.db.crud import access_log as access_crud
+from src.db.models.access_log import AccessLog
+from src.db.session import AsyncSessionLocal, async_engine
+
+_IP_PREFIX = "198.51.100."
+
+
+def _entries(n: int) -> list[dict]:
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            "ip_address": f"{_IP_PREFIX}{i % 256}",
+            "city": "Munich",
+            "region": "Bavaria",
+            "country": "DE",
+            "latitude": 48.137,
+            "longitude": 11.575,
+            "org": "AS64496 Example",
+            "timezone": "Europe/Berlin",
+            "timestamp": now,
+        }
+        for i in range(n)
+    ]
+
+
+async def _per_row(entries: list[dict]) -> None:
+    async with AsyncSessionLocal() as db:
+        for entry in entries:
+            await access_crud.create_access_log(db, **entry)
+
+
+async def _bulk(entries: list[dict]) -> None:
+    async with AsyncSessionLocal() as db:
+        await access_crud.create_access_logs_bulk(db, entries)
+
+
+async def _cleanup() -> None:
+    async with AsyncSessionLocal() as db:
+        await db.execute(delete(AccessLog).where(AccessLog.ip_address.startswith(_IP_PREFIX)))
+        await db.commit()
+
+
+async def main(sizes: list[int], per_row_max: int) -> None:
+    print(f"{'rows':>8}{'method':>10}{'seconds':>12}{'rows/s':>14}")
+    try:
+        for n in sizes:
+            entries = _entries(n)
+            for name, fn in (("per-row", _per_row), ("bulk", _bulk)):
+                if name == "per-row" and n > per_row_max:
+                    print(f"{n:>8}{name:>10}{'skipped':>12}{'-':>14}")
+                    continue
+                start = time.perf_counter()
+                await fn(entries)
+                elapsed = time.perf_counter() - start
+                print(f"{n:>8}{name:>10}{elapsed:>12.3f}{n / elapsed:>14.0f}")
+                await _cleanup()
+    finally:
+        await _cleanup()
+        await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1000, 50000])
+    parser.add_argument(
+        "--per-row-max", type=int, default=50000,
+        help="skip the per-row method above this many rows (it is slow)",
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.sizes, args.per_row_max))
@@ -0,0 +1,70 @@
+"""
+Benchmark: per-call setup overhead of a Gemini (google-adk) call.
+
+Measures everything a translation call does *before* the model request:
+
+* ``per-call`` - build ``Agent`` + ``InMemorySessionService`` + ``Runner``
+                 and create the session on every call (the previous code path)
+* ``pooled``   - ``_get_runner`` from the model-keyed pool plus a fresh
+                 per-call session that is deleted afterwards (``_run_agent``)
+
+No request is sent to Gemini, so no API key is needed.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.adk_runner_pool --calls 1000 --prompts 8
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+
+from src.services import translation
+
+_MODEL = "gemini-2.5-flash"
+
+
+def _prompt(i: int) -> str:
+    return f"You are a professional translator. Translate from English to language #{i}."
+
+
+async def _per_call(prompt: str) -> None:
+    adk = translation._adk()
+    agent = translation._get_agent(prompt, _MODEL)
+    session_service = adk.InMemorySessionService()
+    await session_service.create_session(app_name="transl", user_id="system", session_id="cv_translation")
+    adk.Runner(agent=agent, app_name="transl", session_service=session_service)
+
+
+async def _pooled(prompt: str) -> None:
+    runner = translation._get_runner(prompt, _MODEL)
+    session_id = uuid.uuid4().hex
+    await runner.session_service.create_session(app_name="transl", user_id="system", session_id=session_id)
+    await runner.session_service.delete_session(app_name="transl", user_id="system", session_id=session_id)
+
+
+async def main(calls: int, prompts: int) -> None:
+    start = time.perf_counter()
+    translation._adk()
+    print(f"google-adk import (once): {(time.perf_counter() - start) * 1000:.1f} ms\n")
+
+    print(f"{'calls':>8}{'method':>10}{'total s':>10}{'µs/call':>12}")
+    for name, fn in (("per-call", _per_call), ("pooled", _pooled)):
+        translation._runners.clear()
+        start = time.perf_counter()
+        for i in range(calls):
+            await fn(_prompt(i % prompts))
+        elapsed = time.perf_counter() - start
+        print(f"{calls:>8}{name:>10}{elapsed:>10.3f}{elapsed / calls * 1e6:>12.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=1000)
+    parser.add_argument(
+        "--prompts", type=int, default=8,
+        help="distinct system prompts (≈ target languages) cycled through",
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.calls, args.prompts))
@@ -0,0 +1,168 @@
+"""
+Microbenchmark: per-request overhead of the IP-tracking middleware.
+
+Compares three stacks on the ``/`` and ``/projects/`` routes:
+
+* ``none``     - no tracking middleware (baseline)
+* ``legacy``   - the previous implementation: ``BaseHTTPMiddleware`` that
+                 awaits ``SET NX`` (+ ``SADD`` for a new IP) on Redis per request
+* ``asgi``     - the current pure-ASGI ``IPTrackingMiddleware`` with the
+                 buffered ``track_ip`` and its background flush task running
+
+Requests go through ``httpx.ASGITransport`` (no sockets, no DB), but both
+tracking variants talk to a real Redis. ``--redis-url`` must name an EMPTY
+database: the benchmark refuses to run otherwise, and between and after
+runs it deletes only the ``access:*`` keys it wrote itself.
+``/projects/`` returns a pre-serialized body like the snapshot cache does.
+With ``--unique-ips`` every request comes from a new public IP (every
+legacy request pays both round-trips); otherwise one repeat visitor is
+simulated.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.ip_tracking_middleware --requests 5000 --redis-url redis://localhost:6379/15
+"""
+
+import argparse
+import asyncio
+import ipaddress
+import statistics
+import time
+from datetime import datetime, timezone
+
+import httpx
+import redis.asyncio as aioredis
+from fastapi import FastAPI, Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from src.core.middleware import IPTrackingMiddleware
+from src.db import redis as redis_mod
+from src.services import access_log
+
+# Keys written by either tracking variant (dedup keys and the pending set)
+_OWN_KEYS = "access:*"
+
+_PROJECTS_BODY = (
+    '[{"id":1,"title":"Homepage","description":"Portfolio","link":"https://example.com",'
+    '"github_link":null,"status":"up","last_checked":null,"position":0,"language":"en",'
+    '"has_changes":false,"translation_group_id":1,"owner_id":1,"health_check_urls":[]}]'
+)
+
+# Public (non-private) address space for the simulated visitors
+_FIRST_IP = int(ipaddress.IPv4Address("11.0.0.1"))
+
+
+async def _legacy_track_ip(ip: str) -> bool:
+    """The previous awaited ``track_ip``: SET NX + EX, then SADD for a new IP."""
+    if access_log._is_private_ip(ip):
+        return False
+    client = aioredis.Redis(connection_pool=redis_mod.redis_pool)
+    now_iso = datetime.now(timezone.utc).isoformat()
+    was_set = await client.set(f"access:ip:{ip}", now_iso, nx=True, ex=600)
+    if was_set:
+        await client.sadd("access:pending", f"{ip}||{now_iso}")
+        return True
+    return False
+
+
+class _LegacyIPTrackingMiddleware(BaseHTTPMiddleware):
+    """The pre-ASGI implementation, kept here only for comparison."""
+
+    async def dispatch(self, request: Request, call_next):
+        forwarded = request.headers.get("x-forwarded-for")
+        if forwarded:
+            ip = forwarded.split(",")[0].strip()
+        else:
+            ip = request.client.host if request.client else "unknown"
+        if ip and ip != "unknown":
+            try:
+                await _legacy_track_ip(ip)
+            except Exception:
+                pass
+        return await call_next(request)
+
+
+def _build_app(variant: str) -> FastAPI:
+    app = FastAPI(redirect_slashes=False)
+    if variant == "legacy":
+        app.add_middleware(_LegacyIPTrackingMiddleware)
+    elif variant == "asgi":
+        app.add_middleware(IPTrackingMiddleware)
+
+    @app.get("/")
+    async def root():
+        return {"message": "Welcome to Homepage API. Docs at /docs"}
+
+    @app.get("/projects/")
+    async def projects():
+        return Response(content=_PROJECTS_BODY, media_type="application/json")
+
+    return app
+
+
+async def _measure(app: FastAPI, path: str, requests: int, unique_ips: bool) -> list[float]:
+    transport = httpx.ASGITransport(app=app, client=("10.0.0.2", 12345))
+    counter = 0
+
+    def headers() -> dict:
+        nonlocal counter
+        counter += 1
+        ip = ipaddress.IPv4Address(_FIRST_IP + (counter if unique_ips else 0))
+        return {"x-forwarded-for": f"{ip}, 10.0.0.2"}
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(min(200, requests)):  # warm-up
+            await client.get(path, headers=headers())
+        samples = []
+        for _ in range(requests):
+            request_headers = headers()
+            start = time.perf_counter()
+            await client.get(path, headers=request_headers)
+            samples.append((time.perf_counter() - start) * 1e6)
+    return samples
+
+
+async def _delete_own_keys(client: aioredis.Redis) -> None:
+    keys = [key async for key in client.scan_iter(match=_OWN_KEYS, count=1000)]
+    if keys:
+        await client.delete(*keys)
+
+
+async def main(requests: int, redis_url: str, unique_ips: bool) -> None:
+    redis_mod.redis_pool = aioredis.ConnectionPool.from_url(redis_url, decode_responses=True)
+    client = aioredis.Redis(connection_pool=redis_mod.redis_pool)
+    keys = await client.dbsize()
+    if keys:
+        await redis_mod.redis_pool.disconnect()
+        raise SystemExit(f"{redis_url} holds {keys} key(s); point --redis-url at an empty database.")
+    access_log.start_ip_tracking()
+    try:
+        print(f"{'route':<12}{'variant':<10}{'mean µs':>10}{'p50 µs':>10}{'p99 µs':>10}{'Δ mean':>10}")
+        for path in ("/", "/projects/"):
+            baseline = None
+            for variant in ("none", "legacy", "asgi"):
+                await _delete_own_keys(client)
+                access_log._seen_ips.clear()
+                samples = await _measure(_build_app(variant), path, requests, unique_ips)
+                samples.sort()
+                mean = statistics.fmean(samples)
+                p50 = samples[len(samples) // 2]
+                p99 = samples[int(len(samples) * 0.99) - 1]
+                baseline = mean if baseline is None else baseline
+                print(f"{path:<12}{variant:<10}{mean:>10.1f}{p50:>10.1f}{p99:>10.1f}{mean - baseline:>+10.1f}")
+    finally:
+        await access_log.stop_ip_tracking()
+        await _delete_own_keys(client)
+        await redis_mod.redis_pool.disconnect()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument(
+        "--redis-url", required=True,
+        help="an empty Redis database, e.g. redis://localhost:6379/15",
+    )
+    parser.add_argument("--unique-ips", action="store_true", help="a new visitor IP per request")
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.redis_url, args.unique_ips))
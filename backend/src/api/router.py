@@ -6,7 +6,7 @@ Imported by ``main.py`` and mounted on the FastAPI app.
 
 from fastapi import APIRouter
 
-from .routers import access_log, cv, internal, messages, projects, settings, storage, users
+from .routers import access_log, cv, internal, messages, projects, settings, storage, system, users
 
 api_router = APIRouter()
 
@@ -19,3 +19,4 @@ api_router.include_router(internal.router)
 api_router.include_router(access_log.router)
 api_router.include_router(settings.router)
 api_router.include_router(settings.public_router)
+api_router.include_router(system.router)
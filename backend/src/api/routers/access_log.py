@@ -1,17 +1,25 @@
 """Access-log endpoints – admin only."""
 
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional
+from typing import List, Literal, Optional
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import func, select
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...core.dependencies import get_current_admin_user, get_db
-from ...db.models.access_log import AccessLog
+from ...db.models.access_rollup import ALL, ALL_TIME_BUCKET, HOUR, bucket_start
 from ...db.models.user import User
 from ...db.crud import access_log as access_crud
-from ..schemas.access_log import AccessLogRead, AccessLogStats
+from ...db.crud import access_rollup as rollup_crud
+from ...utils.hyperloglog import HyperLogLog
+from ...services import access_log as access_service
+from ..schemas.access_log import (
+    AccessLogPage,
+    AccessLogRead,
+    AccessLogStats,
+    AccessTrackingStats,
+)
 
 router = APIRouter(prefix="/access", tags=["access"])
 
@@ -31,36 +39,62 @@ async def list_access_logs(
     return await access_crud.get_access_logs(db, skip=skip, limit=limit)
 
 
+@router.get("/page", response_model=AccessLogPage)
+async def page_access_logs(
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    limit: int = Query(200, ge=1, le=1000),
+    hours: Optional[int] = Query(None, ge=1, le=8760, description="Filter last N hours"),
+    db: AsyncSession = Depends(get_db),
+    _admin: User = Depends(get_current_admin_user),
+):
+    """Return access logs newest-first, paginated by an opaque keyset cursor."""
+    after = access_service.decode_cursor(cursor) if cursor else None
+    since = datetime.now(timezone.utc) - timedelta(hours=hours) if hours else None
+    items = await access_crud.get_access_logs_page(db, after=after, since=since, limit=limit)
+    next_cursor = None
+    if len(items) == limit:
+        last = items[-1]
+        next_cursor = access_service.encode_cursor(last.timestamp, last.id)
+    return AccessLogPage(items=items, next_cursor=next_cursor)
+
+
+@router.get("/export")
+async def export_access_logs(
+    format: Literal["ndjson", "csv"] = Query("ndjson"),
+    since: Optional[datetime] = Query(None, description="Only rows at or after this time"),
+    until: Optional[datetime] = Query(None, description="Only rows before this time"),
+    _admin: User = Depends(get_current_admin_user),
+):
+    """Stream all matching access logs (oldest first) as NDJSON or CSV."""
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    extension = "csv" if format == "csv" else "ndjson"
+    return StreamingResponse(
+        access_service.export_access_logs(format, since=since, until=until),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="access_logs.{extension}"'},
+    )
+
+
 @router.get("/stats", response_model=AccessLogStats)
 async def access_stats(
     db: AsyncSession = Depends(get_db),
     _admin: User = Depends(get_current_admin_user),
 ):
-    """Aggregated access statistics."""
-    total = await access_crud.count_access_logs(db)
+    """Aggregated access statistics.
 
-    # Unique IPs
-    result = await db.execute(
-        select(func.count(func.distinct(AccessLog.ip_address)))
-    )
-    unique_ips = result.scalar_one()
-
-    # Top countries
-    result = await db.execute(
-        select(AccessLog.country, func.count(AccessLog.id).label("cnt"))
-        .where(AccessLog.country.isnot(None))
-        .group_by(AccessLog.country)
-        .order_by(func.count(AccessLog.id).desc())
-        .limit(10)
-    )
-    top_countries = [{"country": row.country, "count": row.cnt} for row in result.all()]
+    Answered from the pre-aggregated rollups (maintained by the IP resolver
+    job), so the cost does not grow with the size of ``access_logs``.
+    ``unique_ips`` is a HyperLogLog estimate (~1.6 % error) and
+    ``recent_count`` covers the current hour plus the 23 before it.
+    """
+    all_time = await rollup_crud.get_rollup(db, granularity=ALL, start=ALL_TIME_BUCKET)
+    total = all_time.hits if all_time else 0
+    unique_ips = HyperLogLog.from_bytes(all_time.visitors).count() if all_time else 0
 
-    # Last 24h
-    since_24h = datetime.now(timezone.utc) - timedelta(hours=24)
-    result = await db.execute(
-        select(func.count(AccessLog.id)).where(AccessLog.timestamp >= since_24h)
-    )
-    recent_count = result.scalar_one()
+    top_countries = await rollup_crud.get_top_countries(db, limit=10)
+
+    since = bucket_start(datetime.now(timezone.utc) - timedelta(hours=23), HOUR)
+    recent_count = await rollup_crud.sum_hits_since(db, granularity=HOUR, since=since)
 
     return AccessLogStats(
         total=total,
@@ -68,3 +102,11 @@ async def access_stats(
         top_countries=top_countries,
         recent_count=recent_count,
     )
+
+
+@router.get("/tracking-stats", response_model=AccessTrackingStats)
+async def tracking_stats(
+    _admin: User = Depends(get_current_admin_user),
+):
+    """Hit/miss counters of the IP-tracking caches in the worker serving this request."""
+    return access_service.get_tracking_cache_stats()
@@ -1,6 +1,6 @@
 """CV (Curriculum Vitae) endpoints."""
 
-from fastapi import APIRouter, Depends, File, Form, UploadFile
+from fastapi import APIRouter, Depends, File, Form, Response, UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...core.dependencies import get_current_admin_user, get_db
@@ -16,8 +16,13 @@ async def read_cv(
     language: str = "en",
     db: AsyncSession = Depends(get_db),
 ):
-    """Public endpoint - returns the CV data without authentication."""
-    return await cv_service.get_cv_data(db, language=language)
+    """Public endpoint - returns the CV data without authentication.
+
+    The body is pre-serialized (and cached in Redis), so it is returned as-is
+    instead of being re-validated against ``CVData`` on every request.
+    """
+    body = await cv_service.get_cv_json(db, language=language)
+    return Response(content=body, media_type="application/json")
 
 
 @router.put("/", response_model=CVData)
@@ -1,17 +1,19 @@
 """Project management endpoints."""
 
-from typing import List
+from typing import List, Literal, Optional
 
-from fastapi import APIRouter, BackgroundTasks, Depends, status
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, Query, Response, status
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...core.dependencies import get_current_admin_user, get_db
 from ...db.models.user import User
 from ...services import project as project_service
+from ...utils.helpers import etag_matches
 from ..schemas.project import (
     ProjectCreate,
     ProjectGithubImportResponse,
+    ProjectHealthStats,
     ProjectListItem,
     ProjectRead,
     ProjectUpdate,
@@ -53,11 +55,21 @@ async def list_projects(
     skip: int = 0,
     limit: int = 100,
     language: str = "en",
+    if_none_match: Optional[str] = Header(None),
     db: AsyncSession = Depends(get_db),
 ):
-    """List projects (without image) for fast loading."""
-    projects = await project_service.list_projects(db, skip=skip, limit=limit, language=language)
-    return projects
+    """List projects (without image) for fast loading.
+
+    Served from a pre-serialized snapshot with a strong ``ETag``; clients that
+    send a matching ``If-None-Match`` get an empty ``304 Not Modified``.
+    """
+    snapshot = await project_service.get_project_list_snapshot(
+        db, skip=skip, limit=limit, language=language
+    )
+    headers = {"ETag": snapshot.etag, "Cache-Control": "no-cache"}
+    if etag_matches(if_none_match, snapshot.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=snapshot.body, media_type="application/json", headers=headers)
 
 
 @router.get("/{project_id}", response_model=ProjectRead)
@@ -121,6 +133,17 @@ async def trigger_health_check(
     return _project_to_read(project)
 
 
+@router.get("/{project_id}/health-stats", response_model=ProjectHealthStats)
+async def project_health_stats(
+    project_id: int,
+    window: Literal["1h", "24h", "7d", "30d"] = Query("24h"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user),
+):
+    """Uptime percentage and p50/p95/p99 latency of the project's health-check URLs."""
+    return await project_service.get_project_health_stats(db, project_id, window)
+
+
 # ---------------------------------------------------------------------------
 # AI-assisted GitHub import
 # ---------------------------------------------------------------------------
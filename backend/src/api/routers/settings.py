@@ -8,6 +8,8 @@ from ...core.dependencies import get_current_admin_user, get_db
 from ...db.crud import app_setting as settings_crud
 from ...db.crud import cv as cv_crud
 from ...db.crud import project as project_crud
+from ...services import cache as cache_service
+from ...services import translation_queue
 from ..schemas.settings import (
     AccentColorUpdate,
     AutoTranslationRead,
@@ -94,8 +96,8 @@ async def update_auto_translation(
     """Enable or disable automatic translation of CV & project edits. Admin only.
 
     Re-enabling deliberately does NOT build a queue: any changes flagged while
-    the feature was off are cleared so that only edits made *after* re-enabling
-    get translated.
+    the feature was off are cleared (and leftover queued jobs discarded) so
+    that only edits made *after* re-enabling get translated.
     """
     await settings_crud.set_setting(
         db,
@@ -105,6 +107,9 @@ async def update_auto_translation(
     if payload.enabled:
         await project_crud.clear_all_changes(db)
         await cv_crud.clear_all_changes(db)
+        await translation_queue.discard_pending()
+        # ``has_changes`` is part of the public project list payload
+        await cache_service.bump_projects_version()
     return AutoTranslationRead(enabled=payload.enabled)
 
 
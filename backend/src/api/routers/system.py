@@ -0,0 +1,32 @@
+"""Runtime diagnostics endpoints – admin only."""
+
+from fastapi import APIRouter, Depends
+
+from ...core.dependencies import get_current_admin_user
+from ...core.http import get_http_client_stats
+from ...services import translation_queue
+from ..schemas.system import HttpClientStats, TranslationQueueRequeued, TranslationQueueStats
+
+router = APIRouter(
+    prefix="/system",
+    tags=["system"],
+    dependencies=[Depends(get_current_admin_user)],
+)
+
+
+@router.get("/http-clients", response_model=HttpClientStats)
+async def http_client_stats():
+    """Request, new-connection and DNS-cache counters of the shared HTTP clients in this worker."""
+    return get_http_client_stats()
+
+
+@router.get("/translation-queue", response_model=TranslationQueueStats)
+async def translation_queue_stats():
+    """Queued, running, delayed (retry backoff) and dead-lettered translation jobs."""
+    return await translation_queue.get_queue_stats()
+
+
+@router.post("/translation-queue/requeue-dead", response_model=TranslationQueueRequeued)
+async def requeue_dead_translation_jobs():
+    """Put dead-lettered translation jobs back on the queue (stale revisions are dropped)."""
+    return TranslationQueueRequeued(requeued=await translation_queue.requeue_dead_letters())
@@ -22,8 +22,26 @@ class AccessLogRead(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class AccessLogPage(BaseModel):
+    items: list[AccessLogRead]
+    next_cursor: Optional[str] = None  # None on the last page
+
+
 class AccessLogStats(BaseModel):
     total: int
     unique_ips: int
     top_countries: list[dict]
     recent_count: int  # last 24h
+
+
+class CacheCounters(BaseModel):
+    hits: int
+    misses: int
+    size: int
+
+
+class AccessTrackingStats(BaseModel):
+    """Per-worker IP-tracking cache counters (each uvicorn worker reports its own)."""
+    seen_ips: CacheCounters
+    private_ip: CacheCounters
+    buffered: int
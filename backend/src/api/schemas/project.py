@@ -87,3 +87,22 @@ class ProjectListItem(BaseModel):
     health_check_urls: Optional[List[str]] = []
 
     model_config = {"from_attributes": True}
+
+
+class UrlHealthStats(BaseModel):
+    url: Optional[str] = None  # None for the project-wide aggregate
+    probes: int
+    uptime_percent: Optional[float] = None
+    p50_ms: Optional[float] = None
+    p95_ms: Optional[float] = None
+    p99_ms: Optional[float] = None
+    ttfb_p50_ms: Optional[float] = None
+    last_checked: Optional[datetime] = None
+
+
+class ProjectHealthStats(BaseModel):
+    """Uptime and latency percentiles over a time window (admin)."""
+    project_id: int
+    window: str
+    overall: UrlHealthStats
+    urls: List[UrlHealthStats]
@@ -0,0 +1,39 @@
+"""Schemas for admin runtime diagnostics."""
+
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class HttpClientCounters(BaseModel):
+    requests: int
+    sent: int  # reached a connection (failures before that are excluded)
+    reused_connections: int
+    new_connections: int
+    http2_requests: int
+    reuse_ratio: Optional[float] = None  # reused / sent; None until a request was sent
+
+
+class DnsCacheCounters(BaseModel):
+    hits: int
+    misses: int
+    size: int
+
+
+class HttpClientStats(BaseModel):
+    """Shared outbound HTTP client counters (each uvicorn worker reports its own)."""
+    clients: dict[str, HttpClientCounters]
+    dns_cache: DnsCacheCounters
+
+
+class TranslationQueueStats(BaseModel):
+    """Translation job queue (Redis stream) counters."""
+    available: bool  # False without Redis
+    queued: int
+    in_progress: int
+    delayed: int  # waiting for a retry
+    dead: int  # gave up after TRANSLATION_MAX_ATTEMPTS
+
+
+class TranslationQueueRequeued(BaseModel):
+    requeued: int
@@ -7,7 +7,7 @@ Application settings powered by pydantic-settings.
 """
 
 from functools import lru_cache
-from typing import List, Optional
+from typing import List, Literal, Optional
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -65,6 +65,16 @@ class RedisSettings(BaseSettings):
         return f"redis://{auth}{self.host}:{self.port}/{self.db}"
 
 
+class CacheSettings(BaseSettings):
+    """Redis response cache for hot public endpoints."""
+    model_config = SettingsConfigDict(env_prefix="CACHE_")
+
+    enabled: bool = True
+    # Safety-net TTL; entries are invalidated explicitly on every write
+    cv_ttl_seconds: int = 3600
+    projects_ttl_seconds: int = 3600
+
+
 class MinioSettings(BaseSettings):
     """S3-compatible object storage settings."""
     model_config = SettingsConfigDict(env_prefix="MINIO_")
@@ -128,14 +138,111 @@ class GeminiSettings(BaseSettings):
     model: str = "gemini-3.1-pro-preview"
 
 
+class GeminiLimitSettings(BaseSettings):
+    """Gemini request governor: concurrency, per-minute budgets, 429 cooldown."""
+    model_config = SettingsConfigDict(env_prefix="GEMINI_")
+
+    max_concurrency: int = 4  # in-flight Gemini calls per process
+    # Shared by all workers via Redis; 0 = unlimited
+    requests_per_minute: int = 60
+    tokens_per_minute: int = 1_000_000
+    # Part of each budget background translations may use (rest: imports)
+    background_share: float = 0.8
+    max_retries: int = 2  # per call on 429, after the cooldown
+    default_cooldown_seconds: float = 30  # when a 429 names no Retry-After
+    max_cooldown_seconds: float = 300
+
+
 class TranslationSettings(BaseSettings):
     """Automatic translation sync settings."""
     model_config = SettingsConfigDict(env_prefix="TRANSLATION_")
 
     enabled: bool = False
-    interval_minutes: int = 1
     supported_languages: List[str] = ["en", "de", "vi", "fr", "it", "zh", "ja", "es", "pt"]
 
+    # Redis-stream job queue (one job per entity × target language)
+    concurrency: int = 4  # jobs run at once per consumer process
+    max_attempts: int = 5  # then the job goes to the dead-letter list
+    retry_base_seconds: int = 30  # backoff doubles per attempt …
+    retry_max_seconds: int = 1800  # … up to this cap
+    claim_idle_seconds: int = 900  # take over jobs of a consumer that died
+    # Safety net: queue flagged records that have no jobs (also at startup)
+    reconcile_minutes: int = 60
+    # Reuse stored translations of identical text (translation_memory table)
+    memory_enabled: bool = True
+    # Full CV translations: sections (long lists in item slices) are sent in
+    # parallel chunks of about this many tokens
+    chunk_tokens: int = 2000
+
+
+class AccessLogSettings(BaseSettings):
+    """Visitor IP tracking / access-log settings."""
+    model_config = SettingsConfigDict(env_prefix="ACCESS_")
+
+    # In-process buffer flushed to Redis in pipelined batches
+    flush_interval_ms: int = 500
+    flush_batch_size: int = 200
+    max_buffer_size: int = 10000
+    # Per-worker caches in front of Redis / ipaddress parsing
+    seen_cache_size: int = 10000
+    private_ip_cache_size: int = 4096
+
+    # Offline geo database (.mmdb or sorted-range .csv); empty = IPinfo only
+    geo_database_path: str = ""
+    geo_asn_database_path: str = ""  # optional .mmdb with ASN data for ``org``
+    geo_ipinfo_fallback: bool = True  # ask IPinfo for IPs the local database misses
+
+    # Geolocation resolver (IPinfo)
+    geo_concurrency: int = 20
+    geo_rate_per_second: float = 50.0  # 0 disables rate limiting
+    geo_cache_ttl_days: int = 30
+
+    # Monthly partitions of access_logs
+    partitions_ahead: int = 3  # future months kept pre-created
+    retention_months: int = 0  # drop/detach partitions older than this; 0 keeps everything
+    retention_action: Literal["drop", "detach"] = "drop"  # detach keeps old months as standalone tables
+
+
+class HealthCheckSettings(BaseSettings):
+    """Project health-check sweep settings."""
+    model_config = SettingsConfigDict(env_prefix="HEALTH_")
+
+    # Adaptive schedule: the sweep runs every tick and probes only due URLs
+    tick_seconds: int = 60
+    min_interval_minutes: int = 2  # DOWN / flapping URLs
+    interval_minutes: int = 20  # backoff cap (UP and DOWN), the longest a URL goes unprobed
+    jitter: float = 0.2  # ± fraction applied to every interval
+
+    concurrency: int = 20  # URLs probed in parallel per sweep
+    per_host_concurrency: int = 4  # parallel probes against the same host
+    history_days: int = 30  # retention of the per-probe latency history
+
+
+class JobSettings(BaseSettings):
+    """Coordination of scheduled jobs across workers / containers."""
+    model_config = SettingsConfigDict(env_prefix="JOBS_")
+
+    # Run the scheduler inside the API processes; set to false when the
+    # dedicated worker (``python -m src.worker``) hosts the jobs instead
+    scheduler_enabled: bool = True
+    lease_ttl_seconds: int = 60  # renewed while a job runs; frees up if a worker dies
+
+
+class HttpClientSettings(BaseSettings):
+    """Shared outbound HTTP clients (health checks, GitHub, geolocation)."""
+    model_config = SettingsConfigDict(env_prefix="HTTP_")
+
+    http2: bool = True  # needs the ``h2`` package; falls back to HTTP/1.1 without it
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry_seconds: float = 60.0
+    dns_cache_ttl_seconds: int = 300  # 0 disables the resolver cache
+
+    # Per-purpose request timeouts
+    health_timeout_seconds: float = 10.0
+    github_timeout_seconds: float = 15.0
+    geo_timeout_seconds: float = 10.0
+
 
 class PasswordPolicySettings(BaseSettings):
     """Password complexity policy (enforced in NextJS; kept here for reference/validation)."""
@@ -185,12 +292,18 @@ class Settings(BaseSettings):
     # Sub-configs (populated from env with their respective prefixes)
     db: DatabaseSettings = DatabaseSettings()
     redis: RedisSettings = RedisSettings()
+    cache: CacheSettings = CacheSettings()
     minio: MinioSettings = MinioSettings()
     email: EmailSettings = EmailSettings()
     auth: AuthSettings = AuthSettings()
     admin: AdminSettings = AdminSettings()
     password_policy: PasswordPolicySettings = PasswordPolicySettings()
+    access_log: AccessLogSettings = AccessLogSettings()
+    http: HttpClientSettings = HttpClientSettings()
+    health: HealthCheckSettings = HealthCheckSettings()
+    jobs: JobSettings = JobSettings()
     gemini: GeminiSettings = GeminiSettings()
+    gemini_limits: GeminiLimitSettings = GeminiLimitSettings()
     translation: TranslationSettings = TranslationSettings()
 
 
@@ -0,0 +1,265 @@
+"""
+Shared outbound HTTP clients (``httpx.AsyncClient``), one per purpose.
+
+Provides:
+* ``init_http_clients()`` / ``close_http_clients()`` - lifespan hooks
+* ``get_http_client(purpose)`` - the pooled client for ``health``, ``github``
+  or ``geo`` requests
+* ``get_http_client_stats()``  - requests / new connections / DNS cache counters
+
+All clients share one tuned connection pool configuration (limits,
+keep-alive, optional HTTP/2) and a small TTL cache in front of
+``getaddrinfo``. Connection reuse is measured through httpcore's ``trace``
+request extension: a request counts as sent once its headers went out on a
+connection, and as reused if it did not open that connection itself, so
+the reuse ratio is ``reused / sent`` (requests that failed before reaching
+a connection are not counted either way).
+"""
+
+import asyncio
+import logging
+import socket
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+import httpcore
+import httpx
+
+from .config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+HEALTH = "health"
+GITHUB = "github"
+GEO = "geo"
+
+
+# ---------------------------------------------------------------------------
+# DNS cache
+# ---------------------------------------------------------------------------
+
+class _DNSCachingBackend(httpcore.AsyncNetworkBackend):
+    """Network backend that resolves host names once per *ttl* seconds.
+
+    TLS still uses the original host name for SNI / certificate checks —
+    httpcore passes it to ``start_tls`` separately from ``connect_tcp``.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self._backend = httpcore.AnyIOBackend()
+        self._ttl = ttl
+        self._cache: dict[tuple[str, int], tuple[float, list[str]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def _resolve(self, host: str, port: int) -> list[str]:
+        key = (host, port)
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            self.hits += 1
+            return cached[1]
+        self.misses += 1
+        infos = await asyncio.get_running_loop().getaddrinfo(
+            host, port, type=socket.SOCK_STREAM
+        )
+        addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        self._cache[key] = (time.monotonic() + self._ttl, addresses)
+        return addresses
+
+    async def connect_tcp(
+        self, host, port, timeout=None, local_address=None, socket_options=None
+    ) -> httpcore.AsyncNetworkStream:
+        try:
+            addresses = await self._resolve(host, port)
+        except OSError:
+            # Let the regular backend raise its usual ConnectError
+            addresses = [host]
+        last_exc: Optional[Exception] = None
+        for address in addresses:
+            try:
+                return await self._backend.connect_tcp(
+                    address, port, timeout=timeout,
+                    local_address=local_address, socket_options=socket_options,
+                )
+            except httpcore.ConnectError as exc:
+                last_exc = exc
+        self._cache.pop((host, port), None)
+        if last_exc is None:
+            raise httpcore.ConnectError(f"No addresses found for {host}")
+        raise last_exc
+
+    async def connect_unix_socket(self, path, timeout=None, socket_options=None):
+        return await self._backend.connect_unix_socket(
+            path, timeout=timeout, socket_options=socket_options
+        )
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class _PooledTransport(httpx.AsyncHTTPTransport):
+    """``AsyncHTTPTransport`` whose connection pool uses the DNS-caching backend.
+
+    httpx does not expose httpcore's ``network_backend`` argument, so the
+    pool built by the parent constructor is replaced with an equivalent one.
+    """
+
+    def __init__(
+        self, *, http2: bool, limits: httpx.Limits, network_backend: Optional[httpcore.AsyncNetworkBackend]
+    ) -> None:
+        super().__init__(http2=http2, limits=limits)
+        if network_backend is not None:
+            self._pool = httpcore.AsyncConnectionPool(
+                ssl_context=httpx.create_ssl_context(),
+                max_connections=limits.max_connections,
+                max_keepalive_connections=limits.max_keepalive_connections,
+                keepalive_expiry=limits.keepalive_expiry,
+                http1=True,
+                http2=http2,
+                network_backend=network_backend,
+            )
+
+
+# ---------------------------------------------------------------------------
+# Registry
+# ---------------------------------------------------------------------------
+
+@dataclass
+class _ClientCounters:
+    requests: int = 0
+    sent: int = 0  # requests whose headers went out on a connection
+    reused: int = 0  # … on a connection opened by an earlier request
+    connections: int = 0
+    http2_requests: int = 0
+
+
+@dataclass
+class _Registry:
+    clients: dict[str, httpx.AsyncClient] = field(default_factory=dict)
+    counters: dict[str, _ClientCounters] = field(default_factory=dict)
+    dns: Optional[_DNSCachingBackend] = None
+
+
+_registry: Optional[_Registry] = None
+
+
+def _timeouts() -> dict[str, float]:
+    cfg = settings.http
+    return {
+        HEALTH: cfg.health_timeout_seconds,
+        GITHUB: cfg.github_timeout_seconds,
+        GEO: cfg.geo_timeout_seconds,
+    }
+
+
+def _build_client(purpose: str, timeout: float, registry: _Registry) -> httpx.AsyncClient:
+    cfg = settings.http
+    counters = registry.counters.setdefault(purpose, _ClientCounters())
+
+    async def _on_request(request: httpx.Request) -> None:
+        counters.requests += 1
+        opened_connection = False
+
+        async def _trace(event_name: str, info: dict) -> None:
+            nonlocal opened_connection
+            if event_name == "connection.connect_tcp.complete":
+                opened_connection = True
+                counters.connections += 1
+            elif event_name.endswith(".send_request_headers.complete"):
+                counters.sent += 1
+                if not opened_connection:
+                    counters.reused += 1
+
+        request.extensions["trace"] = _trace
+
+    async def _on_response(response: httpx.Response) -> None:
+        if response.http_version == "HTTP/2":
+            counters.http2_requests += 1
+
+    http2 = cfg.http2 and _http2_available()
+    limits = httpx.Limits(
+        max_connections=cfg.max_connections,
+        max_keepalive_connections=cfg.max_keepalive_connections,
+        keepalive_expiry=cfg.keepalive_expiry_seconds,
+    )
+    return httpx.AsyncClient(
+        transport=_PooledTransport(http2=http2, limits=limits, network_backend=registry.dns),
+        timeout=timeout,
+        follow_redirects=purpose != GEO,
+        event_hooks={"request": [_on_request], "response": [_on_response]},
+    )
+
+
+def _get_registry() -> _Registry:
+    global _registry
+    if _registry is None:
+        ttl = settings.http.dns_cache_ttl_seconds
+        _registry = _Registry(dns=_DNSCachingBackend(ttl) if ttl > 0 else None)
+    return _registry
+
+
+async def init_http_clients() -> None:
+    """Create the shared clients. Call once during app startup."""
+    registry = _get_registry()
+    for purpose, timeout in _timeouts().items():
+        if purpose not in registry.clients:
+            registry.clients[purpose] = _build_client(purpose, timeout, registry)
+    if settings.http.http2 and not _http2_available():
+        logger.warning("[http] HTTP_HTTP2 is enabled but 'h2' is not installed - using HTTP/1.1.")
+    logger.info("[http] Shared HTTP clients ready: %s", ", ".join(registry.clients))
+
+
+async def close_http_clients() -> None:
+    """Close every shared client and its connections. Call during app shutdown."""
+    global _registry
+    if _registry is None:
+        return
+    for client in _registry.clients.values():
+        await client.aclose()
+    _registry = None
+
+
+def get_http_client(purpose: str) -> httpx.AsyncClient:
+    """Return the shared client for *purpose* (created on first use outside the app lifespan)."""
+    registry = _get_registry()
+    client = registry.clients.get(purpose)
+    if client is None:
+        timeout = _timeouts().get(purpose)
+        if timeout is None:
+            raise KeyError(f"Unknown HTTP client purpose: {purpose!r}")
+        client = registry.clients[purpose] = _build_client(purpose, timeout, registry)
+    return client
+
+
+def get_http_client_stats() -> dict:
+    """Per-client request / connection counters and DNS cache hits of this worker."""
+    registry = _get_registry()
+    clients = {}
+    for purpose, c in registry.counters.items():
+        clients[purpose] = {
+            "requests": c.requests,
+            "sent": c.sent,
+            "reused_connections": c.reused,
+            "new_connections": c.connections,
+            "http2_requests": c.http2_requests,
+            "reuse_ratio": round(c.reused / c.sent, 4) if c.sent else None,
+        }
+    dns = registry.dns
+    return {
+        "clients": clients,
+        "dns_cache": {
+            "hits": dns.hits if dns else 0,
+            "misses": dns.misses if dns else 0,
+            "size": len(dns._cache) if dns else 0,
+        },
+    }
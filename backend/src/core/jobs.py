@@ -0,0 +1,164 @@
+"""
+Cluster-wide coordination for scheduled jobs.
+
+Every uvicorn worker (and every container) runs its own APScheduler, so each
+job is wrapped with ``exclusive_job(name, interval_seconds)``. The wrapper
+makes the job run at most once per interval across all of them:
+
+* ``jobs:interval:<name>`` - ``SET NX PX`` claim that expires shortly before
+  the next interval; only the worker that sets it runs this interval.
+* ``jobs:lease:<name>``    - ``SET NX PX`` lease held (and heartbeat-renewed)
+  for the duration of the run, so a run that overshoots its interval never
+  overlaps with the next one. Released with a compare-and-delete script.
+  If a renewal finds the lease gone (expired or taken over), the running job
+  is cancelled rather than left to overlap with the new holder.
+
+Without Redis the wrapper falls back to a non-blocking PostgreSQL advisory
+lock, which still prevents concurrent runs (but not repeats per interval).
+"""
+
+import asyncio
+import functools
+import logging
+import uuid
+import zlib
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, Optional
+
+import redis.asyncio as aioredis
+from sqlalchemy import text
+
+from .config import get_settings
+from ..db import redis as redis_mod
+from ..db.session import async_engine
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+_INTERVAL_PREFIX = "jobs:interval:"
+_LEASE_PREFIX = "jobs:lease:"
+# The interval claim expires a bit early so clock jitter never skips a run
+_INTERVAL_CLAIM_FRACTION = 0.9
+
+_RENEW_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('pexpire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+_RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+# Identifies this process in the claim keys (handy when debugging in redis-cli)
+_WORKER_ID = uuid.uuid4().hex[:12]
+
+
+def _client() -> Optional[aioredis.Redis]:
+    if redis_mod.redis_pool is None:
+        return None
+    return aioredis.Redis(connection_pool=redis_mod.redis_pool)
+
+
+async def _heartbeat(
+    client: aioredis.Redis, key: str, token: str, ttl_ms: int, owner: asyncio.Task
+) -> None:
+    """Renew the lease until cancelled; cancel *owner* once the lease is lost."""
+    while True:
+        await asyncio.sleep(ttl_ms / 3000)
+        try:
+            renewed = await client.eval(_RENEW_SCRIPT, 1, key, token, ttl_ms)
+        except Exception as exc:
+            logger.warning("[jobs] Failed to renew lease %s: %s", key, exc)
+            continue
+        if not renewed:
+            logger.error("[jobs] Lost lease %s, cancelling the running job.", key)
+            owner.cancel()
+            return
+
+
+@asynccontextmanager
+async def _redis_lease(
+    client: aioredis.Redis, name: str, interval_seconds: float
+) -> AsyncIterator[bool]:
+    claim_ms = max(int(interval_seconds * 1000 * _INTERVAL_CLAIM_FRACTION), 1)
+    if not await client.set(f"{_INTERVAL_PREFIX}{name}", _WORKER_ID, nx=True, px=claim_ms):
+        yield False
+        return
+
+    lease_key = f"{_LEASE_PREFIX}{name}"
+    token = f"{_WORKER_ID}:{uuid.uuid4().hex}"
+    ttl_ms = settings.jobs.lease_ttl_seconds * 1000
+    if not await client.set(lease_key, token, nx=True, px=ttl_ms):
+        logger.info("[jobs] %s: previous run still holds the lease, skipping.", name)
+        yield False
+        return
+
+    owner = asyncio.current_task()
+    heartbeat = asyncio.create_task(_heartbeat(client, lease_key, token, ttl_ms, owner))
+    try:
+        yield True
+    except asyncio.CancelledError:
+        # Swallow only the cancellation the heartbeat issued, not a shutdown
+        if not heartbeat.done() or heartbeat.cancelled() or owner.uncancel() > 0:
+            raise
+        logger.warning("[jobs] %s aborted after losing its lease.", name)
+    finally:
+        heartbeat.cancel()
+        try:
+            await client.eval(_RELEASE_SCRIPT, 1, lease_key, token)
+        except Exception as exc:
+            logger.warning("[jobs] Failed to release lease %s: %s", lease_key, exc)
+
+
+@asynccontextmanager
+async def _advisory_lock(name: str) -> AsyncIterator[bool]:
+    # Dedicated connection: session-level advisory locks belong to one connection
+    lock_id = zlib.crc32(f"jobs:{name}".encode())
+    conn = await async_engine.connect()
+    try:
+        got_lock = await conn.scalar(text("SELECT pg_try_advisory_lock(:id)"), {"id": lock_id})
+        if not got_lock:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            await conn.execute(text("SELECT pg_advisory_unlock(:id)"), {"id": lock_id})
+    finally:
+        await conn.close()
+
+
+@asynccontextmanager
+async def job_lease(name: str, interval_seconds: float) -> AsyncIterator[bool]:
+    """Yield ``True`` if this worker should run job *name* for the current interval."""
+    client = _client()
+    if client is None:
+        async with _advisory_lock(name) as acquired:
+            yield acquired
+        return
+    async with _redis_lease(client, name, interval_seconds) as acquired:
+        yield acquired
+
+
+def exclusive_job(
+    name: str, interval_seconds: float
+) -> Callable[[Callable[..., Awaitable]], Callable[..., Awaitable]]:
+    """Decorator: run the wrapped coroutine function at most once per interval cluster-wide."""
+
+    def decorator(fn: Callable[..., Awaitable]) -> Callable[..., Awaitable]:
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            async with job_lease(name, interval_seconds) as acquired:
+                if not acquired:
+                    logger.debug("[jobs] %s already handled by another worker.", name)
+                    return None
+                logger.debug("[jobs] %s running on worker %s.", name, _WORKER_ID)
+                return await fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
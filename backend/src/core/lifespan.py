@@ -5,24 +5,23 @@ Lifespan context manager and startup/shutdown helpers for the FastAPI app.
 import logging
 from contextlib import asynccontextmanager
 
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from fastapi import FastAPI
 
 from .config import get_settings
+from .http import close_http_clients, init_http_clients
+from .scheduler import shutdown_scheduler, start_scheduler
 from .security import get_password_hash
 from ..db.minio import get_minio
 from ..db.redis import close_redis_pool, init_redis_pool
 from ..db.session import AsyncSessionLocal
 from ..db.crud import user as user_crud
 from ..services.cv import init_default_cv
-from ..services.project import check_all_projects_health
-from ..services.translation import run_translation_sync
-from ..services.access_log import resolve_pending_ips
+from ..services.access_log import start_ip_tracking, stop_ip_tracking
+from ..services.translation_queue import start_translation_consumer, stop_translation_consumer
 
 logger = logging.getLogger(__name__)
 
 settings = get_settings()
-scheduler = AsyncIOScheduler()
 
 
 # ---------------------------------------------------------------------------
@@ -63,20 +62,6 @@ async def _init_cv_data() -> None:
             await init_default_cv(db, admin.id)
 
 
-async def _scheduled_health_check() -> None:
-    """Periodic health check triggered by APScheduler."""
-    async with AsyncSessionLocal() as db:
-        await check_all_projects_health(db)
-
-
-async def _scheduled_translation_sync() -> None:
-    """Periodic translation sync triggered by APScheduler."""
-    try:
-        await run_translation_sync()
-    except Exception as exc:
-        logger.error("[translation] Scheduled sync failed: %s", exc)
-
-
 # ---------------------------------------------------------------------------
 # Lifespan (replaces deprecated on_event)
 # ---------------------------------------------------------------------------
@@ -86,56 +71,25 @@ async def lifespan(app: FastAPI):
     # ── Startup ──
     logger.info("[startup] Initialising resources…")
     await init_redis_pool()
+    await init_http_clients()
+    start_ip_tracking()
     get_minio()  # ensure bucket exists
 
     await _ensure_admin_exists()
     await _init_cv_data()
 
-    # Start periodic health-check scheduler
-    scheduler.add_job(
-        _scheduled_health_check,
-        "interval",
-        minutes=20,
-        id="health_check_all_projects",
-        replace_existing=True,
-        misfire_grace_time=60,
-    )
-
-    # Resolve pending IPs every 2 minutes
-    scheduler.add_job(
-        resolve_pending_ips,
-        "interval",
-        minutes=2,
-        id="resolve_pending_ips",
-        replace_existing=True,
-        misfire_grace_time=60,
-    )
-
-    scheduler.start()
-    logger.info("[startup] APScheduler started (health checks every 20 min, IP resolve every 2 min).")
-
-    # Start translation sync scheduler (if enabled)
-    if settings.translation.enabled and settings.gemini.api_key:
-        scheduler.add_job(
-            _scheduled_translation_sync,
-            "interval",
-            minutes=settings.translation.interval_minutes,
-            id="translation_sync",
-            replace_existing=True,
-            misfire_grace_time=60,
-        )
-        logger.info(
-            "[startup] Translation sync enabled (every %d min).",
-            settings.translation.interval_minutes,
-        )
+    if settings.jobs.scheduler_enabled:
+        start_scheduler()
+        start_translation_consumer()
     else:
-        logger.info("[startup] Translation sync disabled (TRANSLATION_ENABLED=false or no GOOGLE_API_KEY).")
+        logger.info("[startup] Scheduler disabled (JOBS_SCHEDULER_ENABLED=false) - jobs run in the worker.")
 
     yield  # ── Application runs ──
 
     # ── Shutdown ──
-    if scheduler.running:
-        scheduler.shutdown()
-        logger.info("[shutdown] APScheduler stopped.")
+    shutdown_scheduler()
+    await stop_translation_consumer()
+    await stop_ip_tracking()
+    await close_http_clients()
     await close_redis_pool()
     logger.info("[shutdown] Resources cleaned up.")
@@ -1,33 +1,48 @@
 import logging
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from ..services.access_log import track_ip
 
 logger = logging.getLogger(__name__)
 
 
-class IPTrackingMiddleware(BaseHTTPMiddleware):
+class IPTrackingMiddleware:
     """
     IP-tracking middleware – record visitor IPs (deduped via Redis)
+
+    Pure ASGI middleware: reads the client IP straight from the raw scope and
+    hands it to the (non-blocking) tracking buffer. Unlike ``BaseHTTPMiddleware``
+    it never wraps the request/response in extra tasks or memory streams, so
+    streaming responses pass through untouched.
     """
 
-    async def dispatch(self, request: Request, call_next):
-        # Extract real client IP (X-Forwarded-For from nginx/proxy, fallback to direct)
-        forwarded = request.headers.get("x-forwarded-for")
-        if forwarded:
-            ip = forwarded.split(",")[0].strip()
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            ip = _client_ip(scope)
+            if ip and ip != "unknown":
+                try:
+                    logger.debug("[middleware] tracking IP: %s", ip)
+                    track_ip(ip)  # buffered, flushed to Redis in the background
+                except Exception as e:
+                    logger.error("[middleware] failed to track IP %s: %s", ip, e)
+                    # never block a request because of tracking
+
+        await self.app(scope, receive, send)
+
+
+def _client_ip(scope: Scope) -> str:
+    """Extract the real client IP (X-Forwarded-For from nginx/proxy, fallback to direct)."""
+    for name, value in scope.get("headers", ()):
+        if name == b"x-forwarded-for":
+            ip = value.decode("latin-1").split(",")[0].strip()
             logger.debug("[middleware] extracted IP %s from x-forwarded-for", ip)
-        else:
-            ip = request.client.host if request.client else "unknown"
-            logger.debug("[middleware] extracted IP %s from direct client host", ip)
-
-        if ip and ip != "unknown":
-            try:
-                logger.debug("[middleware] tracking IP: %s", ip)
-                await track_ip(ip)
-            except Exception as e:
-                logger.error("[middleware] failed to track IP %s: %s", ip, e)
-                pass  # never block a request because of tracking
-
-        return await call_next(request)
+            return ip
+
+    client = scope.get("client")
+    ip = client[0] if client else "unknown"
+    logger.debug("[middleware] extracted IP %s from direct client host", ip)
+    return ip
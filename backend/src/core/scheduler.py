@@ -0,0 +1,117 @@
+"""
+Background scheduler (APScheduler) and the periodic jobs it runs.
+
+Started by the API lifespan (unless ``JOBS_SCHEDULER_ENABLED=false``) or by
+the dedicated worker process (``python -m src.worker``). Every job goes
+through ``exclusive_job``, so it runs once per interval no matter how many
+processes host a scheduler.
+"""
+
+import logging
+from datetime import datetime, timezone
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+from .config import get_settings
+from .jobs import exclusive_job
+from ..db.session import AsyncSessionLocal
+from ..services.access_log import maintain_access_log_partitions, resolve_pending_ips
+from ..services.project import check_all_projects_health
+from ..services.translation_queue import queue_enabled, reconcile_pending_translations
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+scheduler = AsyncIOScheduler()
+
+
+# ---------------------------------------------------------------------------
+# Jobs
+# ---------------------------------------------------------------------------
+
+async def _scheduled_health_check() -> None:
+    """Periodic health check triggered by APScheduler."""
+    async with AsyncSessionLocal() as db:
+        await check_all_projects_health(db)
+
+
+async def _scheduled_partition_maintenance() -> None:
+    """Daily access-log partition maintenance triggered by APScheduler."""
+    try:
+        await maintain_access_log_partitions()
+    except Exception as exc:
+        logger.error("[access] Partition maintenance failed: %s", exc)
+
+
+async def _scheduled_translation_reconcile() -> None:
+    """Queue flagged records that have no translation jobs (safety net for the queue)."""
+    try:
+        await reconcile_pending_translations()
+    except Exception as exc:
+        logger.error("[translation] Reconcile failed: %s", exc)
+
+
+def _add_interval_job(func, job_id: str, *, seconds: int, **kwargs) -> None:
+    """Schedule *func* every *seconds*, leased so one worker runs it per interval."""
+    kwargs.setdefault("misfire_grace_time", 60)
+    scheduler.add_job(
+        exclusive_job(job_id, seconds)(func),
+        "interval",
+        seconds=seconds,
+        id=job_id,
+        replace_existing=True,
+        **kwargs,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Start / stop
+# ---------------------------------------------------------------------------
+
+def start_scheduler() -> None:
+    """Register every periodic job and start the scheduler on the running loop."""
+    # Start periodic health-check scheduler
+    _add_interval_job(
+        _scheduled_health_check,
+        "health_check_all_projects",
+        seconds=settings.health.tick_seconds,
+    )
+
+    # Resolve pending IPs every 2 minutes
+    _add_interval_job(resolve_pending_ips, "resolve_pending_ips", seconds=120)
+
+    # Create upcoming access-log partitions / prune expired ones (also at startup)
+    _add_interval_job(
+        _scheduled_partition_maintenance,
+        "access_log_partitions",
+        seconds=24 * 3600,
+        misfire_grace_time=3600,
+        next_run_time=datetime.now(timezone.utc),
+    )
+
+    # Translations run from the Redis job queue; this only re-queues records
+    # whose jobs got lost (also at startup)
+    if queue_enabled():
+        _add_interval_job(
+            _scheduled_translation_reconcile,
+            "translation_reconcile",
+            seconds=settings.translation.reconcile_minutes * 60,
+            next_run_time=datetime.now(timezone.utc),
+        )
+        logger.info(
+            "[scheduler] Translation reconcile enabled (every %d min).",
+            settings.translation.reconcile_minutes,
+        )
+
+    scheduler.start()
+    logger.info(
+        "[scheduler] APScheduler started (health sweep every %d s, IP resolve every 2 min, "
+        "partition maintenance daily); jobs run once per interval across all workers.",
+        settings.health.tick_seconds,
+    )
+
+
+def shutdown_scheduler() -> None:
+    if scheduler.running:
+        scheduler.shutdown()
+        logger.info("[shutdown] APScheduler stopped.")
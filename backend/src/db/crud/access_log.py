@@ -2,13 +2,14 @@
 CRUD operations for the AccessLog model.
 """
 
+from collections.abc import AsyncIterator
 from datetime import datetime
 from typing import Optional, Sequence
 
-from sqlalchemy import select, func, desc
+from sqlalchemy import insert, select, func, desc, text, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..models.access_log import AccessLog
+from ..models.access_log import DEFAULT_PARTITION, PARTITION_PREFIX, AccessLog, month_start, partition_name
 
 
 async def create_access_log(
@@ -44,6 +45,44 @@ async def create_access_log(
     return log
 
 
+async def create_access_logs_bulk(
+    db: AsyncSession,
+    entries: Sequence[dict],
+    *,
+    commit: bool = True,
+) -> list[int]:
+    """Insert many resolved access-log entries at once. Returns the new row ids.
+
+    Each entry carries ``ip_address`` and ``timestamp`` plus the optional geo
+    columns. Rows go out as multi-row ``INSERT … RETURNING`` statements
+    (SQLAlchemy "insertmanyvalues") with a single commit, instead of the
+    add/commit/refresh round-trips per row of ``create_access_log``. With
+    ``commit=False`` the caller commits.
+    """
+    if not entries:
+        return []
+    rows = [
+        {
+            "ip_address": entry["ip_address"],
+            "city": entry.get("city"),
+            "region": entry.get("region"),
+            "country": entry.get("country"),
+            "latitude": entry.get("latitude"),
+            "longitude": entry.get("longitude"),
+            "org": entry.get("org"),
+            "timezone": entry.get("timezone"),
+            "range_minutes": entry.get("range_minutes", 10),
+            "timestamp": entry["timestamp"],
+        }
+        for entry in entries
+    ]
+    result = await db.execute(insert(AccessLog).returning(AccessLog.id), rows)
+    ids = list(result.scalars().all())
+    if commit:
+        await db.commit()
+    return ids
+
+
 async def get_access_logs(
     db: AsyncSession,
     *,
@@ -76,3 +115,137 @@ async def get_access_logs_since(
         .limit(limit)
     )
     return result.scalars().all()
+
+
+async def get_access_logs_page(
+    db: AsyncSession,
+    *,
+    after: Optional[tuple[datetime, int]] = None,
+    since: Optional[datetime] = None,
+    limit: int = 200,
+) -> Sequence[AccessLog]:
+    """Newest-first keyset page: rows strictly older than the ``(timestamp, id)`` *after*.
+
+    Served from the ``(timestamp, id)`` index, so deep pages cost the same
+    as the first one (unlike ``OFFSET``).
+    """
+    stmt = select(AccessLog)
+    if since is not None:
+        stmt = stmt.where(AccessLog.timestamp >= since)
+    if after is not None:
+        key = tuple_(AccessLog.timestamp, AccessLog.id)
+        stmt = stmt.where(key < tuple_(*after, types=[AccessLog.timestamp.type, AccessLog.id.type]))
+    result = await db.execute(
+        stmt.order_by(desc(AccessLog.timestamp), desc(AccessLog.id)).limit(limit)
+    )
+    return result.scalars().all()
+
+
+async def stream_access_logs(
+    db: AsyncSession,
+    *,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    batch_size: int = 1000,
+) -> AsyncIterator[AccessLog]:
+    """Yield access logs oldest-first through a server-side cursor.
+
+    Rows are fetched *batch_size* at a time and expunged once yielded, so
+    memory stays flat regardless of how many rows match.
+    """
+    stmt = select(AccessLog)
+    if since is not None:
+        stmt = stmt.where(AccessLog.timestamp >= since)
+    if until is not None:
+        stmt = stmt.where(AccessLog.timestamp < until)
+    stmt = stmt.order_by(AccessLog.timestamp, AccessLog.id).execution_options(yield_per=batch_size)
+
+    result = await db.stream_scalars(stmt)
+    async for log in result:
+        yield log
+        db.expunge(log)
+
+
+# ---------------------------------------------------------------------------
+# Monthly partitions
+# ---------------------------------------------------------------------------
+
+async def list_access_log_partitions(db: AsyncSession) -> list[str]:
+    """Names of the attached monthly partitions, oldest first (default partition excluded)."""
+    result = await db.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relname = :parent AND c.relname LIKE :prefix "
+            "ORDER BY c.relname"
+        ),
+        {"parent": AccessLog.__tablename__, "prefix": f"{PARTITION_PREFIX}%"},
+    )
+    return list(result.scalars().all())
+
+
+async def list_default_partition_months(db: AsyncSession) -> list[datetime]:
+    """Start of every month that has rows stranded in the default partition."""
+    exists = await db.scalar(text("SELECT to_regclass(:name)"), {"name": DEFAULT_PARTITION})
+    if exists is None:
+        return []
+    result = await db.execute(
+        text(
+            "SELECT DISTINCT date_trunc('month', timestamp AT TIME ZONE 'UTC') AT TIME ZONE 'UTC' "
+            f"FROM {DEFAULT_PARTITION}"
+        )
+    )
+    return sorted(month_start(month) for month in result.scalars().all())
+
+
+async def create_access_log_partition(db: AsyncSession, *, month: datetime) -> int:
+    """Create the partition for the month starting at *month* (no-op if it exists).
+
+    ``CREATE TABLE … PARTITION OF`` fails for good once the default
+    partition holds rows of that month (e.g. when maintenance missed a
+    month boundary). So the partition is built as a standalone table, the
+    month's rows are moved over from the default partition, and the table
+    is then attached, all in one transaction. Returns the number of rows
+    moved out of the default partition.
+    """
+    name = partition_name(month)
+    parent = AccessLog.__tablename__
+    if await db.scalar(text("SELECT to_regclass(:name)"), {"name": name}) is not None:
+        return 0
+    bounds = f"FROM ('{month.isoformat()}') TO ('{month_start(month, 1).isoformat()}')"
+
+    has_default = await db.scalar(text("SELECT to_regclass(:name)"), {"name": DEFAULT_PARTITION})
+    if has_default is None:
+        await db.execute(text(f"CREATE TABLE {name} PARTITION OF {parent} FOR VALUES {bounds}"))
+        await db.commit()
+        return 0
+
+    # ATTACH needs this lock on the default partition anyway; taking it first
+    # also keeps new rows from landing there between the move and the attach.
+    await db.execute(text(f"LOCK TABLE {DEFAULT_PARTITION} IN ACCESS EXCLUSIVE MODE"))
+    await db.execute(text(f"CREATE TABLE {name} (LIKE {parent} INCLUDING DEFAULTS)"))
+    moved = await db.execute(
+        text(
+            f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} "
+            "WHERE timestamp >= :start AND timestamp < :end RETURNING *) "
+            f"INSERT INTO {name} SELECT * FROM moved"
+        ),
+        {"start": month, "end": month_start(month, 1)},
+    )
+    await db.execute(text(f"ALTER TABLE {parent} ATTACH PARTITION {name} FOR VALUES {bounds}"))
+    await db.commit()
+    return max(moved.rowcount, 0)
+
+
+async def drop_access_log_partition(
+    db: AsyncSession, *, name: str, detach_only: bool = False
+) -> None:
+    """Drop a monthly partition, or only detach it (keeping it as a standalone archive table)."""
+    if not name.startswith(PARTITION_PREFIX):
+        raise ValueError(f"Not an access-log partition: {name!r}")
+    if detach_only:
+        await db.execute(text(f"ALTER TABLE {AccessLog.__tablename__} DETACH PARTITION {name}"))
+    else:
+        await db.execute(text(f"DROP TABLE IF EXISTS {name}"))
+    await db.commit()
@@ -0,0 +1,142 @@
+"""
+CRUD operations for the access-statistics rollups.
+"""
+
+from datetime import datetime
+from typing import Iterable, Optional
+
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...utils.hyperloglog import HyperLogLog
+from ..models.access_rollup import (
+    ALL,
+    ALL_TIME_BUCKET,
+    DAY,
+    HOUR,
+    AccessCountryRollup,
+    AccessRollup,
+    bucket_start,
+)
+
+# Buckets that carry a unique-visitor sketch (hourly ones only count hits)
+_SKETCHED = (DAY, ALL)
+
+
+# ---------------------------------------------------------------------------
+# Write (incremental)
+# ---------------------------------------------------------------------------
+
+async def add_to_rollups(
+    db: AsyncSession,
+    entries: Iterable[tuple[str, datetime, Optional[str]]],
+    *,
+    commit: bool = True,
+) -> None:
+    """Fold ``(ip, timestamp, country)`` access entries into every rollup.
+
+    Hit counters are incremented with ``INSERT … ON CONFLICT DO UPDATE``;
+    visitor sketches are merged under ``SELECT … FOR UPDATE`` so concurrent
+    resolver runs never lose an update. With ``commit=False`` the caller
+    commits, e.g. together with the raw log rows.
+    """
+    hits: dict[tuple[str, datetime], int] = {}
+    sketches: dict[tuple[str, datetime], HyperLogLog] = {}
+    country_hits: dict[tuple[str, datetime, str], int] = {}
+
+    for ip, ts, country in entries:
+        for granularity in (HOUR, DAY, ALL):
+            key = (granularity, bucket_start(ts, granularity))
+            hits[key] = hits.get(key, 0) + 1
+            if granularity in _SKETCHED:
+                sketches.setdefault(key, HyperLogLog()).add(ip)
+            if country and granularity in (DAY, ALL):
+                ckey = (*key, country)
+                country_hits[ckey] = country_hits.get(ckey, 0) + 1
+
+    if not hits:
+        return
+
+    keys = sorted(hits)  # consistent lock order across concurrent runs
+    await db.execute(
+        pg_insert(AccessRollup)
+        .values([{"granularity": g, "bucket_start": b, "hits": 0} for g, b in keys])
+        .on_conflict_do_nothing()
+    )
+    result = await db.execute(
+        select(AccessRollup)
+        .where(tuple_(AccessRollup.granularity, AccessRollup.bucket_start).in_(keys))
+        .order_by(AccessRollup.granularity, AccessRollup.bucket_start)
+        .with_for_update()
+    )
+    for row in result.scalars():
+        key = (row.granularity, row.bucket_start)
+        row.hits += hits[key]
+        if key in sketches:
+            sketch = HyperLogLog.from_bytes(row.visitors)
+            sketch.merge(sketches[key])
+            row.visitors = sketch.to_bytes()
+
+    if country_hits:
+        stmt = pg_insert(AccessCountryRollup).values(
+            [
+                {"granularity": g, "bucket_start": b, "country": c, "hits": n}
+                for (g, b, c), n in sorted(country_hits.items())
+            ]
+        )
+        await db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["granularity", "bucket_start", "country"],
+                set_={"hits": AccessCountryRollup.hits + stmt.excluded.hits},
+            )
+        )
+
+    if commit:
+        await db.commit()
+
+
+# ---------------------------------------------------------------------------
+# Read
+# ---------------------------------------------------------------------------
+
+async def get_rollup(
+    db: AsyncSession, *, granularity: str = ALL, start: datetime = ALL_TIME_BUCKET
+) -> Optional[AccessRollup]:
+    result = await db.execute(
+        select(AccessRollup).where(
+            AccessRollup.granularity == granularity,
+            AccessRollup.bucket_start == start,
+        )
+    )
+    return result.scalar_one_or_none()
+
+
+async def sum_hits_since(db: AsyncSession, *, granularity: str, since: datetime) -> int:
+    """Total hits of all *granularity* buckets starting at or after *since*."""
+    result = await db.execute(
+        select(func.coalesce(func.sum(AccessRollup.hits), 0)).where(
+            AccessRollup.granularity == granularity,
+            AccessRollup.bucket_start >= since,
+        )
+    )
+    return int(result.scalar_one())
+
+
+async def get_top_countries(
+    db: AsyncSession,
+    *,
+    granularity: str = ALL,
+    start: datetime = ALL_TIME_BUCKET,
+    limit: int = 10,
+) -> list[dict]:
+    result = await db.execute(
+        select(AccessCountryRollup.country, AccessCountryRollup.hits)
+        .where(
+            AccessCountryRollup.granularity == granularity,
+            AccessCountryRollup.bucket_start == start,
+        )
+        .order_by(AccessCountryRollup.hits.desc())
+        .limit(limit)
+    )
+    return [{"country": row.country, "count": row.hits} for row in result.all()]
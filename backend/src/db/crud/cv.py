@@ -53,6 +53,12 @@ async def clear_all_changes(db: AsyncSession) -> int:
     return result.rowcount or 0
 
 
+async def clear_changes(db: AsyncSession, *, language: str) -> None:
+    """Reset has_changes on the CV of *language* (its translations are done)."""
+    await db.execute(update(CV).where(CV.language == language).values(has_changes=False))
+    await db.commit()
+
+
 # ---------------------------------------------------------------------------
 # Create / Update (upsert)
 # ---------------------------------------------------------------------------
@@ -64,18 +70,33 @@ async def upsert_cv(
     owner_id: int,
     language: str = "en",
     has_changes: bool = False,
+    source_language: Optional[str] = None,
+    source_snapshot: Optional[dict] = None,
 ) -> CV:
-    """Create or update the CV record for a given language."""
+    """Create or update the CV record for a given language.
+
+    ``source_language`` / ``source_snapshot`` are only set for translated
+    copies; any other write clears them.
+    """
     existing = await get_cv(db, language=language)
     if existing:
         existing.data = data
         existing.owner_id = owner_id
         existing.has_changes = has_changes
+        existing.source_language = source_language
+        existing.source_snapshot = source_snapshot
         await db.commit()
         await db.refresh(existing)
         return existing
 
-    cv = CV(data=data, owner_id=owner_id, language=language, has_changes=has_changes)
+    cv = CV(
+        data=data,
+        owner_id=owner_id,
+        language=language,
+        has_changes=has_changes,
+        source_language=source_language,
+        source_snapshot=source_snapshot,
+    )
     db.add(cv)
     await db.commit()
     await db.refresh(cv)
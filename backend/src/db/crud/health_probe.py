@@ -0,0 +1,60 @@
+"""
+CRUD operations for the HealthCheckProbe model.
+"""
+
+from datetime import datetime
+from typing import Sequence
+
+from sqlalchemy import Integer, cast, delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.health_probe import HealthCheckProbe
+
+
+async def create_probes_bulk(db: AsyncSession, probes: Sequence[dict]) -> None:
+    """Insert many probe results (``HealthCheckProbe`` column dicts) with one commit."""
+    if not probes:
+        return
+    await db.execute(insert(HealthCheckProbe), list(probes))
+    await db.commit()
+
+
+async def delete_probes_before(db: AsyncSession, *, before: datetime) -> int:
+    result = await db.execute(delete(HealthCheckProbe).where(HealthCheckProbe.checked_at < before))
+    await db.commit()
+    return result.rowcount or 0
+
+
+def _percentile(fraction: float):
+    return func.percentile_cont(fraction).within_group(HealthCheckProbe.total_ms)
+
+
+async def get_probe_stats(
+    db: AsyncSession,
+    *,
+    urls: Sequence[str],
+    since: datetime,
+    per_url: bool = True,
+) -> list[dict]:
+    """Probe count, uptime and latency percentiles for *urls* since *since*.
+
+    Returns one dict per URL (``per_url``) or a single overall dict with
+    ``url=None``. Percentiles only consider probes that got a response.
+    """
+    columns = [
+        func.count().label("probes"),
+        func.coalesce(func.sum(cast(HealthCheckProbe.ok, Integer)), 0).label("ok_probes"),
+        _percentile(0.50).label("p50_ms"),
+        _percentile(0.95).label("p95_ms"),
+        _percentile(0.99).label("p99_ms"),
+        func.percentile_cont(0.50).within_group(HealthCheckProbe.ttfb_ms).label("ttfb_p50_ms"),
+        func.max(HealthCheckProbe.checked_at).label("last_checked"),
+    ]
+    if per_url:
+        stmt = select(HealthCheckProbe.url, *columns).group_by(HealthCheckProbe.url)
+    else:
+        stmt = select(*columns)
+    stmt = stmt.where(HealthCheckProbe.url.in_(urls), HealthCheckProbe.checked_at >= since)
+    result = await db.execute(stmt)
+    return [{"url": None, **row} for row in result.mappings()]
+
@@ -4,7 +4,7 @@ CRUD operations for the Project model.
 
 from typing import Optional, Sequence
 
-from sqlalchemy import func, select, update
+from sqlalchemy import case, func, literal, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models.project import Project, ProjectStatus
@@ -41,6 +41,14 @@ async def get_all_projects(db: AsyncSession) -> Sequence[Project]:
     return result.scalars().all()
 
 
+async def get_projects_by_group(db: AsyncSession, translation_group_id: int) -> Sequence[Project]:
+    """Return every language copy of a translation group."""
+    result = await db.execute(
+        select(Project).where(Project.translation_group_id == translation_group_id)
+    )
+    return result.scalars().all()
+
+
 async def get_next_position(db: AsyncSession) -> int:
     result = await db.execute(select(func.max(Project.position)))
     max_pos = result.scalar_one_or_none() or 0
@@ -145,6 +153,12 @@ async def clear_all_changes(db: AsyncSession) -> int:
     return result.rowcount or 0
 
 
+async def clear_changes(db: AsyncSession, *, project_id: int) -> None:
+    """Reset has_changes on one project (its translations are done)."""
+    await db.execute(update(Project).where(Project.id == project_id).values(has_changes=False))
+    await db.commit()
+
+
 async def update_project(
     db: AsyncSession,
     project: Project,
@@ -171,6 +185,45 @@ async def set_project_status(
     return project
 
 
+def _bulk_status_update(key_column, statuses: dict[int, ProjectStatus]):
+    """``UPDATE projects SET status = CASE <key> …`` for all rows whose key is in *statuses*."""
+    return (
+        update(Project)
+        .where(key_column.in_(statuses))
+        .values(
+            status=case(
+                {key: literal(status, Project.status.type) for key, status in statuses.items()},
+                value=key_column,
+            ),
+            last_checked=func.now(),
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def set_group_statuses(
+    db: AsyncSession,
+    statuses: dict[int, ProjectStatus],
+    *,
+    ungrouped: Optional[dict[int, ProjectStatus]] = None,
+) -> int:
+    """Fan statuses out to every language copy of each translation group.
+
+    *statuses* is keyed by ``translation_group_id``; *ungrouped* by project id
+    for rows without a group. One UPDATE per kind, one commit. Returns the
+    number of rows updated.
+    """
+    count = 0
+    if statuses:
+        result = await db.execute(_bulk_status_update(Project.translation_group_id, statuses))
+        count += result.rowcount or 0
+    if ungrouped:
+        result = await db.execute(_bulk_status_update(Project.id, ungrouped))
+        count += result.rowcount or 0
+    await db.commit()
+    return count
+
+
 # ---------------------------------------------------------------------------
 # Delete
 # ---------------------------------------------------------------------------
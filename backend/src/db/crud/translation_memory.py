@@ -0,0 +1,46 @@
+"""
+CRUD operations for the TranslationMemory model.
+"""
+
+from typing import Sequence
+
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import func
+
+from ..models.translation_memory import TranslationMemory
+
+
+async def get_translations(db: AsyncSession, keys: Sequence[str]) -> dict[str, str]:
+    """Return ``{key: translated_text}`` for every key in memory and count the hits."""
+    if not keys:
+        return {}
+    result = await db.execute(
+        select(TranslationMemory.key, TranslationMemory.translated_text).where(
+            TranslationMemory.key.in_(keys)
+        )
+    )
+    found = dict(result.all())
+    if found:
+        await db.execute(
+            update(TranslationMemory)
+            .where(TranslationMemory.key.in_(found))
+            .values(hits=TranslationMemory.hits + 1, last_used_at=func.now())
+        )
+        await db.commit()
+    return found
+
+
+async def store_translations(db: AsyncSession, rows: Sequence[dict]) -> None:
+    """Insert ``TranslationMemory`` column dicts; existing keys get the new translation."""
+    if not rows:
+        return
+    stmt = pg_insert(TranslationMemory).values(list(rows))
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=["key"],
+            set_={"translated_text": stmt.excluded.translated_text, "last_used_at": func.now()},
+        )
+    )
+    await db.commit()
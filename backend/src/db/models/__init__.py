@@ -7,3 +7,6 @@ from .message import Message  # noqa: F401
 from .cv import CV  # noqa: F401
 from .access_log import AccessLog  # noqa: F401
 from .app_setting import AppSetting  # noqa: F401
+from .access_rollup import AccessCountryRollup, AccessRollup  # noqa: F401
+from .health_probe import HealthCheckProbe  # noqa: F401
+from .translation_memory import TranslationMemory  # noqa: F401
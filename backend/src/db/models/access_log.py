@@ -1,16 +1,45 @@
-"""Access log ORM model – stores geolocated visitor access records."""
+"""Access log ORM model – stores geolocated visitor access records.
 
-from sqlalchemy import DateTime, Float, Integer, String
+``access_logs`` is range-partitioned by ``timestamp`` into monthly
+partitions named ``access_logs_yYYYYmMM`` (plus ``access_logs_default`` as a
+catch-all). Partitions are created ahead of time and pruned by the
+``maintain_access_log_partitions`` job (see ``services/access_log.py``).
+"""
+
+from datetime import datetime, timezone
+
+from sqlalchemy import DateTime, Float, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
 from ..base import Base
 
+PARTITION_PREFIX = "access_logs_y"
+DEFAULT_PARTITION = "access_logs_default"
+
+
+def month_start(ts: datetime, offset: int = 0) -> datetime:
+    """First instant (UTC) of the month containing *ts*, shifted by *offset* months."""
+    ts = ts.astimezone(timezone.utc)
+    months = ts.year * 12 + ts.month - 1 + offset
+    return datetime(months // 12, months % 12 + 1, 1, tzinfo=timezone.utc)
+
+
+def partition_name(month: datetime) -> str:
+    """Name of the monthly partition that starts at *month*."""
+    return f"{PARTITION_PREFIX}{month.year:04d}m{month.month:02d}"
+
 
 class AccessLog(Base):
     __tablename__ = "access_logs"
+    __table_args__ = (
+        # Keyset pagination / export order
+        Index("ix_access_logs_timestamp_id", "timestamp", "id"),
+        {"postgresql_partition_by": "RANGE (timestamp)"},
+    )
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    # The partition key has to be part of the primary key
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     ip_address: Mapped[str] = mapped_column(String(45), nullable=False, index=True)
     city: Mapped[str | None] = mapped_column(String(255), nullable=True)
     region: Mapped[str | None] = mapped_column(String(255), nullable=True)
@@ -21,7 +50,8 @@ class AccessLog(Base):
     timezone: Mapped[str | None] = mapped_column(String(100), nullable=True)
     range_minutes: Mapped[int] = mapped_column(Integer, default=10)
     timestamp: Mapped[str] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False, index=True
+        DateTime(timezone=True), server_default=func.now(), nullable=False,
+        primary_key=True, index=True,
     )
 
     def __repr__(self) -> str:
@@ -0,0 +1,51 @@
+"""Access-statistics rollup ORM models – pre-aggregated visit counts."""
+
+from datetime import datetime, timezone
+
+from sqlalchemy import BigInteger, DateTime, LargeBinary, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..base import Base
+
+# Rollup granularities. ``all`` is a single all-time bucket (ALL_TIME_BUCKET).
+HOUR = "hour"
+DAY = "day"
+ALL = "all"
+ALL_TIME_BUCKET = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def bucket_start(ts: datetime, granularity: str) -> datetime:
+    """Start of the UTC bucket of *granularity* that contains *ts*."""
+    if granularity == ALL:
+        return ALL_TIME_BUCKET
+    ts = ts.astimezone(timezone.utc).replace(minute=0, second=0, microsecond=0)
+    if granularity == DAY:
+        ts = ts.replace(hour=0)
+    return ts
+
+
+class AccessRollup(Base):
+    """Visits per time bucket plus a HyperLogLog sketch of the distinct IPs."""
+    __tablename__ = "access_rollups"
+
+    granularity: Mapped[str] = mapped_column(String(8), primary_key=True)
+    bucket_start: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+    hits: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    # Serialized HyperLogLog registers (day / all buckets only)
+    visitors: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<AccessRollup {self.granularity} {self.bucket_start} hits={self.hits}>"
+
+
+class AccessCountryRollup(Base):
+    """Visits per time bucket and country."""
+    __tablename__ = "access_country_rollups"
+
+    granularity: Mapped[str] = mapped_column(String(8), primary_key=True)
+    bucket_start: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+    country: Mapped[str] = mapped_column(String(10), primary_key=True)
+    hits: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"<AccessCountryRollup {self.granularity} {self.bucket_start} {self.country}={self.hits}>"
@@ -1,5 +1,7 @@
 """CV (Curriculum Vitae) ORM model - stores structured JSON data."""
 
+from typing import Optional
+
 from sqlalchemy import Boolean, ForeignKey, Integer, String
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -17,6 +19,10 @@ class CV(Base):
     owner_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"))
     # Translation tracking: True when content was manually edited and needs translation
     has_changes: Mapped[bool] = mapped_column(Boolean, default=False, server_default="false")
+    # Machine-translated copies: the source CV this copy was translated from,
+    # so the next sync only translates what changed. None for edited records.
+    source_language: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)
+    source_snapshot: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
 
     owner: Mapped["User"] = relationship(back_populates="cv_data", lazy="selectin")
 
@@ -0,0 +1,31 @@
+"""Health-check probe ORM model – one row per probed URL per check."""
+
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Boolean, DateTime, Float, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from ..base import Base
+
+
+class HealthCheckProbe(Base):
+    __tablename__ = "health_check_probes"
+    __table_args__ = (
+        Index("ix_health_check_probes_url_checked_at", "url", "checked_at"),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    url: Mapped[str] = mapped_column(String(2048), nullable=False)
+    checked_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False, index=True
+    )
+    ok: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    status_code: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    ttfb_ms: Mapped[float | None] = mapped_column(Float, nullable=True)
+    total_ms: Mapped[float | None] = mapped_column(Float, nullable=True)
+    # Exception class for transport failures (e.g. "ConnectTimeout"), else None
+    error: Mapped[str | None] = mapped_column(String(64), nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<HealthCheckProbe {self.url!r} ok={self.ok} {self.total_ms}ms>"
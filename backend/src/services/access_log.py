@@ -2,22 +2,41 @@
 Access-log service.
 
 Responsibilities:
-* Track IPs in Redis with 10-minute deduplication
-* Resolve IPs via IPinfo API to get geolocation
-* Scheduled background task to flush pending IPs to PostgreSQL
+* Track IPs in Redis with 10-minute deduplication (buffered, pipelined batches)
+* Per-worker LRU caches for private-IP classification and recently-seen IPs
+* Resolve IPs to geolocation via the configured providers (local geo
+  database and/or IPinfo, see ``services/geo.py``), backed by a persistent
+  Redis geo cache
+* Scheduled background task to flush pending IPs to PostgreSQL and fold
+  them into the hourly / daily / all-time statistics rollups
+* Keyset-pagination cursors and streaming NDJSON / CSV export
+* Scheduled maintenance of the monthly ``access_logs`` partitions
 """
 
+import asyncio
+import base64
+import csv
+import io
+import ipaddress
+import json
 import logging
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Optional
 
-import httpx
 import redis.asyncio as aioredis
+from fastapi import HTTPException, status
 
 from ..core.config import get_settings
 from ..db.crud import access_log as access_crud
+from ..db.crud import access_rollup as rollup_crud
+from ..db.models.access_log import month_start, partition_name
 from ..db import redis as redis_mod
 from ..db.session import AsyncSessionLocal
+from . import geo as geo_service
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -25,19 +44,231 @@ settings = get_settings()
 # Redis key prefixes
 _DEDUP_PREFIX = "access:ip:"
 _PENDING_SET = "access:pending"
+_GEO_PREFIX = "access:geo:"
 _DEDUP_TTL = 600  # 10 minutes in seconds
 
 
+# ---------------------------------------------------------------------------
+# Local caches
+# ---------------------------------------------------------------------------
+
+class _TTLCache:
+    """Bounded LRU set whose entries expire after *ttl* seconds, with hit/miss counters."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: OrderedDict[str, float] = OrderedDict()  # key → expiry (monotonic)
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, key: str) -> bool:
+        expires = self._entries.get(key)
+        if expires is not None and expires > time.monotonic():
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True
+        if expires is not None:
+            del self._entries[key]
+        self.misses += 1
+        return False
+
+    def add(self, key: str) -> None:
+        self._entries[key] = time.monotonic() + self._ttl
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def discard(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# IPs this worker already queued within the dedup window. Repeat visitors are
+# answered from here without a Redis SET NX. The window starts at this worker's
+# first sighting, so it can outlast a key set earlier by another worker by at
+# most _DEDUP_TTL - an acceptable skew for visit counting. An IP only enters
+# the cache once the tracking buffer accepted it, and leaves it again if the
+# buffer has to drop it, so a dropped IP is tracked on its next request.
+_seen_ips = _TTLCache(settings.access_log.seen_cache_size, _DEDUP_TTL)
+
+
+def get_tracking_cache_stats() -> dict:
+    """Hit/miss counters of the per-worker tracking caches."""
+    private = _is_private_ip.cache_info()
+    return {
+        "seen_ips": {
+            "hits": _seen_ips.hits,
+            "misses": _seen_ips.misses,
+            "size": len(_seen_ips),
+        },
+        "private_ip": {
+            "hits": private.hits,
+            "misses": private.misses,
+            "size": private.currsize,
+        },
+        "buffered": _tracking_buffer.size,
+    }
+
+
 # ---------------------------------------------------------------------------
 # Redis dedup helpers
 # ---------------------------------------------------------------------------
+#
+# Tracking never sits on the request path: the middleware only drops the IP
+# into an in-process buffer, and a background task flushes the buffer to Redis
+# every ``flush_interval_ms`` (or earlier once ``flush_batch_size`` IPs are
+# queued). Each flush costs one pipelined round-trip for the whole batch
+# instead of two round-trips per request.
+
+# SET NX (dedup window) and the pending-set SADD happen together, so a batch
+# retried after a failed flush never finds an IP deduplicated but not queued.
+# KEYS: dedup key, pending set; ARGV: timestamp, pending member, ttl
+_TRACK_SCRIPT = """
+if redis.call('set', KEYS[1], ARGV[1], 'NX', 'EX', ARGV[3]) then
+    redis.call('sadd', KEYS[2], ARGV[2])
+    return 1
+end
+return 0
+"""
+
+
+class _IPTrackingBuffer:
+    """In-process buffer of visitor IPs, flushed to Redis in pipelined batches."""
+
+    def __init__(self) -> None:
+        cfg = settings.access_log
+        self._interval = cfg.flush_interval_ms / 1000
+        self._batch_size = cfg.flush_batch_size
+        self._max_size = cfg.max_buffer_size
+        # ip → ISO timestamp of its first hit since the last flush
+        self._pending: dict[str, str] = {}
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    def add(self, ip: str) -> bool:
+        """Queue *ip* for the next flush (non-blocking). Returns False if the buffer is full."""
+        if ip in self._pending:
+            return True
+        if len(self._pending) >= self._max_size:
+            logger.debug("[access] Tracking buffer full, dropping IP %s", ip)
+            return False
+        self._pending[ip] = datetime.now(timezone.utc).isoformat()
+        if len(self._pending) >= self._batch_size:
+            self._wakeup.set()
+        return True
 
-async def track_ip(ip: str) -> bool:
+    @property
+    def size(self) -> int:
+        return len(self._pending)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._stopping = False
+            self._task = asyncio.create_task(self._run(), name="ip-tracking-flush")
+
+    async def stop(self) -> None:
+        """Stop the flush loop and flush whatever is still buffered."""
+        if self._task is not None:
+            # Wake the loop and let it exit instead of cancelling it: a
+            # cancellation racing the wake-up inside ``wait_for`` can be
+            # swallowed on Python 3.11, which left shutdown hanging.
+            self._stopping = True
+            self._wakeup.set()
+            await self._task
+            self._task = None
+        await self.flush()
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self._interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            if self._stopping:
+                return
+            try:
+                await self.flush()
+            except Exception as exc:
+                logger.error("[access] Failed to flush tracked IPs: %s", exc)
+
+    def _restore(self, batch: dict[str, str]) -> int:
+        """Put a batch that could not be flushed back in front of newer IPs.
+
+        The buffer stays bounded by ``max_buffer_size``; returns how many IPs
+        did not fit and were dropped.
+        """
+        merged = dict(batch)
+        for ip, first_seen in self._pending.items():
+            merged.setdefault(ip, first_seen)
+        kept = list(merged.items())
+        self._pending = dict(kept[: self._max_size])
+        for ip, _ in kept[self._max_size:]:
+            _seen_ips.discard(ip)
+        return max(len(kept) - self._max_size, 0)
+
+    async def flush(self) -> int:
+        """Write all buffered IPs to Redis. Returns the number of new IPs.
+
+        If Redis fails, the batch goes back into the buffer for the next
+        flush and the error is re-raised.
+        """
+        if not self._pending:
+            return 0
+        batch, self._pending = self._pending, {}
+
+        pool = redis_mod.redis_pool
+        if pool is None:
+            logger.warning("[access] Redis pool not initialised, dropping %d tracked IP(s)", len(batch))
+            for ip in batch:
+                _seen_ips.discard(ip)
+            return 0
+
+        entries = list(batch.items())
+
+        # One script call per IP: SET NX (= not seen in last 10 min) and, if
+        # new, add it to the pending set for the resolver job
+        try:
+            client = aioredis.Redis(connection_pool=pool)
+            track = client.register_script(_TRACK_SCRIPT)
+            async with client.pipeline(transaction=False) as pipe:
+                for ip, now_iso in entries:
+                    await track(
+                        keys=[f"{_DEDUP_PREFIX}{ip}", _PENDING_SET],
+                        args=[now_iso, f"{ip}||{now_iso}", _DEDUP_TTL],
+                        client=pipe,
+                    )
+                results = await pipe.execute()
+        except Exception:
+            dropped = self._restore(batch)
+            if dropped:
+                logger.warning("[access] Tracking buffer full, dropped %d IP(s) of a failed flush", dropped)
+            raise
+
+        new_count = sum(1 for was_set in results if was_set)
+        if new_count:
+            logger.info("[access] %d new IP(s) tracked", new_count)
+        logger.debug("[access] Flushed %d buffered IP(s)", len(entries))
+        return new_count
+
+
+_tracking_buffer = _IPTrackingBuffer()
+
+
+def track_ip(ip: str) -> bool:
     """
-    Track an IP access in Redis.
+    Record an IP access without blocking the caller.
 
-    Returns True if this is a **new** access (not seen in the last 10 min).
-    Uses SET NX + EX for atomic dedup.
+    Returns True if the IP was queued for deduplication in Redis (SET NX + EX,
+    flushed in batches by the background task), False if it was ignored, the
+    buffer was full, or this worker already saw it within the dedup window.
     """
     # Ignore internal infrastructure traffic (Docker network, health checks,
     # localhost): these reach the backend without a forwarded client IP and are
@@ -46,76 +277,109 @@ async def track_ip(ip: str) -> bool:
         logger.debug("[access] Ignoring internal/private IP %s", ip)
         return False
 
-    pool = redis_mod.redis_pool
-    if pool is None:
-        logger.warning("[access] Redis pool not initialised, skipping IP tracking")
+    if ip in _seen_ips:
+        logger.debug("[access] IP %s already tracked recently (local cache).", ip)
         return False
 
-    client = aioredis.Redis(connection_pool=pool)
-    key = f"{_DEDUP_PREFIX}{ip}"
-    now_iso = datetime.now(timezone.utc).isoformat()
-    logger.debug("[access] Attempting to track IP %s with key %s", ip, key)
-
-    # SET NX: only set if key doesn't exist (= not seen in last 10 min)
-    was_set = await client.set(key, now_iso, nx=True, ex=_DEDUP_TTL)
-    if was_set:
-        # Add to pending set so the background job can pick it up
-        await client.sadd(_PENDING_SET, f"{ip}||{now_iso}")
-        logger.info("[access] New IP tracked: %s", ip)
-        return True
-    
-    logger.debug("[access] IP %s already tracked recently.", ip)
-    return False
+    if not _tracking_buffer.add(ip):
+        return False
+    _seen_ips.add(ip)
+    return True
+
+
+def start_ip_tracking() -> None:
+    """Start the background flush task. Call once during app startup."""
+    _tracking_buffer.start()
+
+
+async def stop_ip_tracking() -> None:
+    """Stop the flush task and flush remaining IPs. Call before closing Redis."""
+    await _tracking_buffer.stop()
 
 
 # ---------------------------------------------------------------------------
-# IPinfo geolocation
+# Persistent geo cache (Redis, one key per IP with TTL)
 # ---------------------------------------------------------------------------
 
-async def _lookup_ip(ip: str) -> dict:
-    """Call IPinfo API to resolve an IP to geolocation data."""
-    logger.debug("[access] Looking up IP geolocation: %s", ip)
-    token = settings.ipinfo_token
-    url = f"https://ipinfo.io/{ip}/json"
-    params = {}
-    if token:
-        params["token"] = token
+async def _get_cached_geo(client: aioredis.Redis, ips: list[str]) -> dict[str, dict]:
+    """Return ``{ip: geo_fields}`` for every IP already in the geo cache."""
+    if not ips:
+        return {}
+    values = await client.mget([f"{_GEO_PREFIX}{ip}" for ip in ips])
+    return {ip: json.loads(value) for ip, value in zip(ips, values) if value}
 
-    try:
-        async with httpx.AsyncClient(timeout=10) as client:
-            logger.debug("[access] Sending request to %s", url)
-            resp = await client.get(url, params=params)
-            logger.debug("[access] IPinfo response status for %s: %s", ip, resp.status_code)
-            if resp.status_code == 200:
-                data = resp.json()
-                logger.debug("[access] Geodata received for %s: %s", ip, data)
-                return data
-            logger.warning("[access] IPinfo returned %s for %s", resp.status_code, ip)
-    except Exception as exc:
-        logger.error("[access] IPinfo lookup failed for %s: %s", ip, exc)
-
-    return {}
-
-
-def _parse_loc(loc_str: Optional[str]) -> tuple[Optional[float], Optional[float]]:
-    """Parse IPinfo 'loc' field like '52.5200,13.4050' → (lat, lng)."""
-    if not loc_str:
-        return None, None
-    try:
-        parts = loc_str.split(",")
-        return float(parts[0]), float(parts[1])
-    except (ValueError, IndexError):
-        return None, None
+
+async def _store_cached_geo(client: aioredis.Redis, geo_by_ip: dict[str, dict]) -> None:
+    if not geo_by_ip:
+        return
+    ttl = settings.access_log.geo_cache_ttl_days * 86400
+    async with client.pipeline(transaction=False) as pipe:
+        for ip, geo in geo_by_ip.items():
+            pipe.set(f"{_GEO_PREFIX}{ip}", json.dumps(geo), ex=ttl)
+        await pipe.execute()
 
 
 # ---------------------------------------------------------------------------
 # Background routine – resolve pending IPs and store in PostgreSQL
 # ---------------------------------------------------------------------------
 
+def _parse_pending_entry(entry) -> tuple[str, datetime]:
+    """Split an ``"<ip>||<iso-timestamp>"`` pending-set member."""
+    entry_str = entry if isinstance(entry, str) else entry.decode()
+    parts = entry_str.split("||", 1)
+    ts_iso = parts[1] if len(parts) > 1 else None
+    ts = datetime.fromisoformat(ts_iso) if ts_iso else datetime.now(timezone.utc)
+    return parts[0], ts
+
+
+async def _write_access_logs(db, rows: list[dict]) -> None:
+    """Insert *rows* and fold them into the rollups in one transaction."""
+    await access_crud.create_access_logs_bulk(db, rows, commit=False)
+    await rollup_crud.add_to_rollups(
+        db, ((row["ip_address"], row["timestamp"], row.get("country")) for row in rows), commit=False
+    )
+    await db.commit()
+
+
+async def _store_access_logs(rows: list[dict]) -> list[dict]:
+    """Store *rows* (log rows plus rollups) in one transaction, or row by row if that fails.
+
+    Returns the rows that were stored; a row that fails on its own is
+    logged and skipped, so one bad entry no longer costs the whole batch.
+    The raw log and the statistics rollups are always written together, so
+    ``/access/stats`` never drifts from ``access_logs``.
+    """
+    if not rows:
+        return []
+    async with AsyncSessionLocal() as db:
+        try:
+            await _write_access_logs(db, rows)
+            logger.debug("[access] Stored %d access log row(s)", len(rows))
+            return rows
+        except Exception as exc:
+            await db.rollback()
+            logger.warning(
+                "[access] Bulk insert of %d access log row(s) failed, retrying row by row: %s",
+                len(rows), exc,
+            )
+
+        stored = []
+        for row in rows:
+            try:
+                await _write_access_logs(db, [row])
+                stored.append(row)
+            except Exception as exc:
+                await db.rollback()
+                logger.error("[access] Failed to store access log for %s: %s", row["ip_address"], exc)
+        return stored
+
+
 async def resolve_pending_ips() -> None:
     """
     Pop all pending IPs from Redis, geolocate them, and store in PostgreSQL.
 
+    IPs seen before are answered from the Redis geo cache; the rest go to
+    the configured geo provider chain (local database first, IPinfo fallback).
     Called periodically by APScheduler.
     """
     pool = redis_mod.redis_pool
@@ -140,55 +404,178 @@ async def resolve_pending_ips() -> None:
 
     logger.info("[access] Resolving %d pending IP(s)…", len(members))
 
-    async with AsyncSessionLocal() as db:
-        for entry in members:
-            try:
-                entry_str = entry if isinstance(entry, str) else entry.decode()
-                parts = entry_str.split("||", 1)
-                ip = parts[0]
-                ts_iso = parts[1] if len(parts) > 1 else None
-                ts = (
-                    datetime.fromisoformat(ts_iso)
-                    if ts_iso
-                    else datetime.now(timezone.utc)
-                )
-
-                logger.debug("[access] Resolving pending IP entry: %s", ip)
-
-                # Skip private/local IPs entirely — internal infrastructure
-                # traffic is not a real visitor and must not pollute the log.
-                if _is_private_ip(ip):
-                    logger.debug("[access] IP %s is private/internal, skipping.", ip)
-                    continue
-
-                logger.debug("[access] Performing geo lookup for %s", ip)
-                geo = await _lookup_ip(ip)
-                lat, lng = _parse_loc(geo.get("loc"))
-                logger.debug("[access] Storing geodata in DB for %s", ip)
-
-                await access_crud.create_access_log(
-                    db,
-                    ip_address=ip,
-                    city=geo.get("city"),
-                    region=geo.get("region"),
-                    country=geo.get("country"),
-                    latitude=lat,
-                    longitude=lng,
-                    org=geo.get("org"),
-                    timezone=geo.get("timezone"),
-                    timestamp=ts,
-                )
-            except Exception as exc:
-                logger.error("[access] Failed to resolve IP entry %s: %s", entry, exc)
+    entries: list[tuple[str, datetime]] = []
+    kept_members = []
+    for entry in members:
+        try:
+            ip, ts = _parse_pending_entry(entry)
+        except ValueError as exc:
+            logger.error("[access] Failed to parse pending IP entry %s: %s", entry, exc)
+            continue
+        # Skip private/local IPs entirely — internal infrastructure
+        # traffic is not a real visitor and must not pollute the log.
+        if _is_private_ip(ip):
+            logger.debug("[access] IP %s is private/internal, skipping.", ip)
+            continue
+        entries.append((ip, ts))
+        kept_members.append(entry)
+
+    unique_ips = list(dict.fromkeys(ip for ip, _ in entries))
+    geo_by_ip = await _get_cached_geo(client, unique_ips)
+    missing = [ip for ip in unique_ips if ip not in geo_by_ip]
+    logger.info(
+        "[access] Geo cache: %d hit(s), %d IP(s) to look up", len(geo_by_ip), len(missing)
+    )
+
+    resolved = await geo_service.get_geo_provider().lookup_many(missing)
+    # Only cache successful lookups so failures are retried next time
+    await _store_cached_geo(client, {ip: geo for ip, geo in resolved.items() if geo.get("country")})
+    geo_by_ip.update(resolved)
+
+    rows = [
+        {"ip_address": ip, "timestamp": ts, **geo_by_ip.get(ip, {})}
+        for ip, ts in entries
+    ]
+    stored = await _store_access_logs(rows)
+    if rows and not stored:
+        # Nothing could be written (database down): keep the batch for the
+        # next run instead of losing every visitor in it.
+        await client.sadd(_PENDING_SET, *kept_members)
+        logger.error("[access] Re-queued %d pending IP(s) after a failed insert", len(kept_members))
+        return
 
     logger.info("[access] Finished resolving pending IPs.")
 
 
+@lru_cache(maxsize=settings.access_log.private_ip_cache_size)
 def _is_private_ip(ip: str) -> bool:
-    """Check if an IP is a private/local address."""
-    import ipaddress
+    """Check if an IP is a private/local address (memoised per worker)."""
     try:
         addr = ipaddress.ip_address(ip)
         return addr.is_private or addr.is_loopback or addr.is_reserved
     except ValueError:
         return False
+
+
+# ---------------------------------------------------------------------------
+# Keyset pagination & streaming export
+# ---------------------------------------------------------------------------
+
+EXPORT_COLUMNS = (
+    "id", "ip_address", "city", "region", "country", "latitude", "longitude",
+    "org", "timezone", "range_minutes", "timestamp",
+)
+
+
+def encode_cursor(timestamp: datetime, log_id: int) -> str:
+    """Opaque page cursor for the ``(timestamp, id)`` of the last row on a page."""
+    raw = f"{timestamp.isoformat()}|{log_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Inverse of ``encode_cursor``; raises 400 for malformed cursors."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        ts_iso, log_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(ts_iso), int(log_id)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor.")
+
+
+def _export_record(log) -> dict:
+    record = {column: getattr(log, column) for column in EXPORT_COLUMNS}
+    record["timestamp"] = log.timestamp.isoformat()
+    return record
+
+
+async def export_access_logs(
+    fmt: str,
+    *,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> AsyncIterator[str]:
+    """Yield the matching access logs as NDJSON lines or CSV rows, oldest first.
+
+    Uses its own session (the request's ``get_db`` session is closed before a
+    streaming body is sent) and a server-side cursor, so the export never
+    holds more than one fetch batch in memory.
+    """
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_COLUMNS)
+
+    def _csv_line(record: Optional[dict] = None) -> str:
+        if record is None:
+            writer.writeheader()
+        else:
+            writer.writerow(record)
+        line = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return line
+
+    if fmt == "csv":
+        yield _csv_line()
+
+    async with AsyncSessionLocal() as db:
+        async for log in access_crud.stream_access_logs(db, since=since, until=until):
+            record = _export_record(log)
+            if fmt == "csv":
+                yield _csv_line(record)
+            else:
+                yield json.dumps(record) + "\n"
+
+
+# ---------------------------------------------------------------------------
+# Partition maintenance – scheduled daily
+# ---------------------------------------------------------------------------
+
+async def maintain_access_log_partitions() -> None:
+    """
+    Pre-create the monthly ``access_logs`` partitions for the next
+    ``ACCESS_PARTITIONS_AHEAD`` months and prune the ones older than
+    ``ACCESS_RETENTION_MONTHS`` (dropped, or detached when
+    ``ACCESS_RETENTION_ACTION=detach``). Rows a missed run left in the
+    default partition are moved into their month's new partition. The
+    statistics rollups are not touched, so totals keep counting pruned
+    months.
+    """
+    cfg = settings.access_log
+    now = datetime.now(timezone.utc)
+
+    async with AsyncSessionLocal() as db:
+        existing = set(await access_crud.list_access_log_partitions(db))
+        # Upcoming months, plus any month whose rows ended up in the default
+        # partition because a run missed its boundary
+        months = {month_start(now, offset) for offset in range(cfg.partitions_ahead + 1)}
+        months.update(await access_crud.list_default_partition_months(db))
+        for month in sorted(months):
+            name = partition_name(month)
+            if name in existing:
+                continue
+            try:
+                moved = await access_crud.create_access_log_partition(db, month=month)
+                existing.add(name)
+                logger.info(
+                    "[access] Created partition %s (%d row(s) moved from the default partition)",
+                    name, moved,
+                )
+            except Exception as exc:
+                await db.rollback()
+                logger.error("[access] Failed to create partition %s: %s", name, exc)
+
+        if cfg.retention_months <= 0:
+            return
+        # Partition names sort chronologically (access_logs_yYYYYmMM)
+        cutoff = partition_name(month_start(now, -cfg.retention_months))
+        for name in sorted(existing):
+            if name >= cutoff:
+                break
+            try:
+                await access_crud.drop_access_log_partition(
+                    db, name=name, detach_only=cfg.retention_action == "detach"
+                )
+                logger.info("[access] Pruned partition %s (%s)", name, cfg.retention_action)
+            except Exception as exc:
+                await db.rollback()
+                logger.error("[access] Failed to prune partition %s: %s", name, exc)
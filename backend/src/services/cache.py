@@ -0,0 +1,198 @@
+"""
+Response cache service - Redis-backed read-through cache for hot public endpoints.
+
+Responsibilities:
+* Store already-serialized JSON bodies so public reads skip PostgreSQL
+  and Pydantic validation entirely
+* Versioned project-list snapshots carrying a strong ETag for 304 revalidation
+* Explicit invalidation from every write path (admin edits, health checks,
+  translation sync)
+
+The cache is strictly best-effort: any Redis problem is logged and the caller
+falls back to the database, so a cache outage never fails a request.
+"""
+
+import logging
+import uuid
+from dataclasses import dataclass
+from typing import Optional
+
+import redis.asyncio as aioredis
+
+from ..core.config import get_settings
+from ..db import redis as redis_mod
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Redis key prefixes
+_CV_PREFIX = "cache:cv:"
+_PROJECTS_PREFIX = "cache:projects:"
+_PROJECTS_VERSION_KEY = "cache:projects:version"
+
+
+def _client() -> Optional[aioredis.Redis]:
+    """Return a Redis client bound to the shared pool, or ``None`` if unavailable."""
+    if not settings.cache.enabled or redis_mod.redis_pool is None:
+        return None
+    return aioredis.Redis(connection_pool=redis_mod.redis_pool)
+
+
+# ---------------------------------------------------------------------------
+# CV
+# ---------------------------------------------------------------------------
+
+#
+# ``invalidate_cv`` replaces the language's generation token
+# (``cache:cv:gen:<lang>``) along with deleting the body. A rebuilt body is
+# only stored if the generation it was read under is still current, so a
+# database read that raced an admin edit never lands in the cache.
+
+_CV_GEN_PREFIX = "cache:cv:gen:"
+
+# KEYS: body, generation; ARGV: expected generation ('' = none), body, ttl
+_SET_CV_SCRIPT = """
+local current = redis.call('get', KEYS[2]) or ''
+if current ~= ARGV[1] then return 0 end
+redis.call('set', KEYS[1], ARGV[2], 'EX', ARGV[3])
+return 1
+"""
+
+
+def _cv_key(language: str) -> str:
+    return f"{_CV_PREFIX}{language}"
+
+
+def _cv_gen_key(language: str) -> str:
+    return f"{_CV_GEN_PREFIX}{language}"
+
+
+async def get_cv_json(language: str) -> tuple[Optional[str], Optional[str]]:
+    """Return ``(body, generation)`` for *language*.
+
+    ``body`` is ``None`` on a miss. ``generation`` is the token to pass to
+    ``set_cv_json`` for a rebuilt body, or ``None`` if the cache is
+    unavailable (then nothing should be stored).
+    """
+    client = _client()
+    if client is None:
+        return None, None
+    try:
+        body, generation = await client.mget(_cv_key(language), _cv_gen_key(language))
+        return body, generation or ""
+    except Exception as exc:
+        logger.warning("[cache] CV read failed for '%s': %s", language, exc)
+        return None, None
+
+
+async def set_cv_json(language: str, generation: str, body: str) -> None:
+    """Store the serialized CV JSON for *language* unless it was invalidated meanwhile."""
+    client = _client()
+    if client is None:
+        return
+    try:
+        stored = await client.eval(
+            _SET_CV_SCRIPT, 2, _cv_key(language), _cv_gen_key(language),
+            generation, body, settings.cache.cv_ttl_seconds,
+        )
+        if not stored:
+            logger.debug("[cache] Skipped stale CV write for '%s'", language)
+    except Exception as exc:
+        logger.warning("[cache] CV write failed for '%s': %s", language, exc)
+
+
+async def invalidate_cv(*languages: str) -> None:
+    """Drop the cached CV JSON for the given languages."""
+    client = _client()
+    if client is None or not languages:
+        return
+    try:
+        async with client.pipeline(transaction=True) as pipe:
+            for lang in languages:
+                pipe.delete(_cv_key(lang))
+                pipe.set(_cv_gen_key(lang), uuid.uuid4().hex)
+            await pipe.execute()
+        logger.debug("[cache] Invalidated CV cache for %s", ", ".join(languages))
+    except Exception as exc:
+        logger.warning("[cache] CV invalidation failed for %s: %s", languages, exc)
+
+
+# ---------------------------------------------------------------------------
+# Project list snapshots
+# ---------------------------------------------------------------------------
+#
+# Every write replaces ``cache:projects:version`` with a fresh random token
+# instead of deleting individual snapshots. A snapshot is only served while the
+# version it was built under is still current, so one SET invalidates all
+# languages / pages at once. Random tokens (rather than INCR) stay safe when
+# the allkeys-lru policy evicts the version key.
+
+@dataclass
+class ProjectListSnapshot:
+    """Serialized project list plus its strong ETag."""
+    body: str
+    etag: str
+
+
+def _projects_key(language: str, skip: int, limit: int) -> str:
+    return f"{_PROJECTS_PREFIX}{language}:{skip}:{limit}"
+
+
+async def get_projects_snapshot(
+    language: str, skip: int, limit: int
+) -> tuple[Optional[ProjectListSnapshot], Optional[str]]:
+    """Return ``(snapshot, version)`` for the requested page.
+
+    ``snapshot`` is ``None`` when missing or built under an outdated version.
+    ``version`` is the current list version to tag a rebuilt snapshot with, or
+    ``None`` if the cache is unavailable (then nothing should be stored).
+    """
+    client = _client()
+    if client is None:
+        return None, None
+    try:
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.get(_PROJECTS_VERSION_KEY)
+            pipe.hgetall(_projects_key(language, skip, limit))
+            version, cached = await pipe.execute()
+
+        if version is None:
+            # First use (or evicted): establish a version; losing a race is fine.
+            await client.set(_PROJECTS_VERSION_KEY, uuid.uuid4().hex, nx=True)
+            return None, await client.get(_PROJECTS_VERSION_KEY)
+
+        if cached and cached.get("version") == version:
+            return ProjectListSnapshot(body=cached["body"], etag=cached["etag"]), version
+        return None, version
+    except Exception as exc:
+        logger.warning("[cache] Project snapshot read failed for '%s': %s", language, exc)
+        return None, None
+
+
+async def set_projects_snapshot(
+    language: str, skip: int, limit: int, version: str, snapshot: ProjectListSnapshot
+) -> None:
+    """Store *snapshot* tagged with the list *version* it was built under."""
+    client = _client()
+    if client is None:
+        return
+    key = _projects_key(language, skip, limit)
+    try:
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping={"version": version, "etag": snapshot.etag, "body": snapshot.body})
+            pipe.expire(key, settings.cache.projects_ttl_seconds)
+            await pipe.execute()
+    except Exception as exc:
+        logger.warning("[cache] Project snapshot write failed for '%s': %s", language, exc)
+
+
+async def bump_projects_version() -> None:
+    """Invalidate every project-list snapshot (all languages and pages)."""
+    client = _client()
+    if client is None:
+        return
+    try:
+        await client.set(_PROJECTS_VERSION_KEY, uuid.uuid4().hex)
+        logger.debug("[cache] Project list version bumped")
+    except Exception as exc:
+        logger.warning("[cache] Project list version bump failed: %s", exc)
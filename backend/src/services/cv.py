@@ -12,7 +12,9 @@ from ..api.schemas.cv import CVData
 from ..core.config import get_settings
 from ..db.crud import app_setting as app_setting_crud
 from ..db.crud import cv as cv_crud
+from . import cache as cache_service
 from . import translation as translation_service
+from . import translation_queue
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -38,6 +40,27 @@ async def get_cv_data(db: AsyncSession, *, language: str = "en") -> CVData:
     return CVData.model_validate(cv.data)
 
 
+async def get_cv_json(db: AsyncSession, *, language: str = "en") -> str:
+    """Return the serialized CV for *language*, served from Redis when cached.
+
+    On a miss the record is validated once and the resulting JSON is cached,
+    so repeat page views neither touch PostgreSQL nor re-run validation.
+    Languages without a CV record get the empty defaults and are not cached,
+    so arbitrary ``language`` values cannot fill Redis.
+    """
+    cached, generation = await cache_service.get_cv_json(language)
+    if cached is not None:
+        return cached
+
+    cv = await cv_crud.get_cv(db, language=language)
+    if cv is None:
+        return CVData().model_dump_json()
+    body = CVData.model_validate(cv.data).model_dump_json()
+    if generation is not None:
+        await cache_service.set_cv_json(language, generation, body)
+    return body
+
+
 async def update_cv_data(
     db: AsyncSession,
     *,
@@ -74,6 +97,11 @@ async def update_cv_data(
         db, data=data.model_dump(), owner_id=owner_id,
         language=language, has_changes=auto_translate,
     )
+    await cache_service.invalidate_cv(language)
+    if auto_translate:
+        await translation_queue.enqueue_translation(
+            translation_service.CV_JOB, language, language
+        )
     return CVData.model_validate(cv.data)
 
 
@@ -174,4 +202,5 @@ async def init_default_cv(db: AsyncSession, owner_id: int) -> None:
         },
     }
     await cv_crud.upsert_cv(db, data=default_data, owner_id=owner_id)
+    await cache_service.invalidate_cv("en")
     logger.info("Initialised default CV data for owner %d", owner_id)
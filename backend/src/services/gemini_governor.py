@@ -0,0 +1,310 @@
+"""
+Gemini request governor - every Gemini call in this process goes through it.
+
+* Priority lanes: ``INTERACTIVE`` (admin CV / GitHub imports) and
+  ``BACKGROUND`` (queued translations). The per-process concurrency slots
+  (``GEMINI_MAX_CONCURRENCY``) are handed to waiting interactive calls
+  first, and background calls may only use ``GEMINI_BACKGROUND_SHARE`` of
+  the per-minute budgets, so an import never queues behind a burst of
+  translations.
+* Requests / tokens per minute: one-minute windows in Redis
+  (``gemini:rpm:<minute>`` / ``gemini:tpm:<minute>``) shared by all workers,
+  checked and reserved in one script once the call holds a concurrency
+  slot. A call waiting for budget (or a cooldown) hands its slot back while
+  it sleeps, so it never blocks a lane whose budget is free. Token use is estimated up front and corrected with the response's
+  ``usage_metadata`` afterwards.
+* 429s: the provider's ``Retry-After`` / ``retryDelay`` (else
+  ``GEMINI_DEFAULT_COOLDOWN_SECONDS``) starts a shared cooldown
+  (``gemini:cooldown``) that holds back every worker; the call itself is
+  retried up to ``GEMINI_MAX_RETRIES`` times, with the rejected attempt's
+  reservation given back first.
+
+Without Redis the windows and the cooldown are tracked per process.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import random
+import re
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Optional, TypeVar
+
+import redis.asyncio as aioredis
+
+from ..core.config import get_settings
+from ..db import redis as redis_mod
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+T = TypeVar("T")
+
+INTERACTIVE = 0
+BACKGROUND = 1
+_LANE_NAMES = {INTERACTIVE: "interactive", BACKGROUND: "background"}
+
+_COOLDOWN_KEY = "gemini:cooldown"
+_RPM_PREFIX = "gemini:rpm:"
+_TPM_PREFIX = "gemini:tpm:"
+_WINDOW_TTL_MS = 120_000
+
+# Returns 0 once the request is reserved, else the milliseconds to wait.
+# A request larger than the whole token budget still runs in an empty window.
+_RESERVE_SCRIPT = """
+local cooldown = redis.call('pttl', KEYS[1])
+if cooldown > 0 then return cooldown end
+local rpm_limit, tpm_limit, tokens = tonumber(ARGV[1]), tonumber(ARGV[2]), tonumber(ARGV[3])
+local rpm = tonumber(redis.call('get', KEYS[2]) or '0')
+local tpm = tonumber(redis.call('get', KEYS[3]) or '0')
+if (rpm_limit > 0 and rpm + 1 > rpm_limit) or (tpm_limit > 0 and tpm > 0 and tpm + tokens > tpm_limit) then
+    return tonumber(ARGV[4])
+end
+redis.call('incr', KEYS[2])
+redis.call('pexpire', KEYS[2], ARGV[5])
+redis.call('incrby', KEYS[3], tokens)
+redis.call('pexpire', KEYS[3], ARGV[5])
+return 0
+"""
+
+_RETRY_DELAY_RE = re.compile(r"retry_?delay['\"]?\s*[:=]\s*['\"]?(\d+(?:\.\d+)?)s", re.IGNORECASE)
+
+
+def _client() -> Optional[aioredis.Redis]:
+    if redis_mod.redis_pool is None:
+        return None
+    return aioredis.Redis(connection_pool=redis_mod.redis_pool)
+
+
+def estimate_tokens(*texts: str) -> int:
+    """Rough token count (~4 characters per token) of the given texts."""
+    return max(sum(len(text) for text in texts) // 4, 1)
+
+
+def rate_limit_delay(exc: BaseException) -> Optional[float]:
+    """Seconds to back off if *exc* is a rate-limit error (429), else ``None``."""
+    response = getattr(exc, "response", None)
+    if (
+        getattr(exc, "code", None) != 429
+        and getattr(response, "status_code", None) != 429
+        and "RESOURCE_EXHAUSTED" not in str(exc)
+    ):
+        return None
+
+    header = getattr(response, "headers", {}).get("retry-after") if response is not None else None
+    if header:
+        try:
+            return max(float(header), 0.0)
+        except ValueError:
+            try:
+                return max(parsedate_to_datetime(header).timestamp() - time.time(), 0.0)
+            except (TypeError, ValueError):
+                pass
+    match = _RETRY_DELAY_RE.search(str(exc))
+    if match:
+        return float(match.group(1))
+    return settings.gemini_limits.default_cooldown_seconds
+
+
+# ---------------------------------------------------------------------------
+# Priority concurrency gate (per process)
+# ---------------------------------------------------------------------------
+
+class _PriorityGate:
+    """Semaphore that hands a freed slot to the waiter of the lowest lane first."""
+
+    def __init__(self, slots: int) -> None:
+        self._free = slots
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+
+    async def acquire(self, lane: int) -> None:
+        if self._free > 0 and not self._waiters:
+            self._free -= 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (lane, next(self._seq), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release()  # the slot was already handed to us
+            raise
+
+    def release(self) -> None:
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._free += 1
+
+    @property
+    def waiting(self) -> int:
+        return sum(1 for _, _, future in self._waiters if not future.done())
+
+
+# ---------------------------------------------------------------------------
+# Per-minute budgets + cooldown (Redis, per-process fallback)
+# ---------------------------------------------------------------------------
+
+@dataclass
+class _Reservation:
+    minute: int
+    tokens: int
+    # Reserved in the per-process windows (Redis was unavailable)
+    local: bool = False
+
+
+class _LocalWindows:
+    """Per-process stand-in for the Redis windows and cooldown."""
+
+    def __init__(self) -> None:
+        self.cooldown_until = 0.0
+        self.windows: dict[int, list[int]] = {}
+
+    def reserve(self, minute: int, rpm_limit: int, tpm_limit: int, tokens: int, wait_ms: int) -> int:
+        remaining = self.cooldown_until - time.time()
+        if remaining > 0:
+            return int(remaining * 1000)
+        for old in [m for m in self.windows if m < minute - 1]:
+            del self.windows[old]
+        rpm, tpm = self.windows.setdefault(minute, [0, 0])
+        if (rpm_limit > 0 and rpm + 1 > rpm_limit) or (tpm_limit > 0 and tpm > 0 and tpm + tokens > tpm_limit):
+            return wait_ms
+        self.windows[minute] = [rpm + 1, tpm + tokens]
+        return 0
+
+
+class _Governor:
+    def __init__(self) -> None:
+        cfg = settings.gemini_limits
+        self._gate = _PriorityGate(max(cfg.max_concurrency, 1))
+        self._local = _LocalWindows()
+
+    def _limits(self, lane: int) -> tuple[int, int]:
+        cfg = settings.gemini_limits
+        share = 1.0 if lane == INTERACTIVE else cfg.background_share
+        return int(cfg.requests_per_minute * share), int(cfg.tokens_per_minute * share)
+
+    async def _try_reserve(self, lane: int, tokens: int) -> tuple[int, int, bool]:
+        now = time.time()
+        minute = int(now // 60)
+        wait_ms = int((60 - now % 60) * 1000) + random.randint(0, 500)
+        rpm_limit, tpm_limit = self._limits(lane)
+        client = _client()
+        if client is not None:
+            try:
+                keys = (_COOLDOWN_KEY, f"{_RPM_PREFIX}{minute}", f"{_TPM_PREFIX}{minute}")
+                waited = await client.eval(
+                    _RESERVE_SCRIPT, 3, *keys, rpm_limit, tpm_limit, tokens, wait_ms, _WINDOW_TTL_MS
+                )
+                return minute, int(waited), False
+            except Exception as exc:
+                logger.warning("[gemini] Redis rate window unavailable, using local limits: %s", exc)
+        return minute, self._local.reserve(minute, rpm_limit, tpm_limit, tokens, wait_ms), True
+
+    async def _acquire(self, lane: int, tokens: int) -> _Reservation:
+        """Take a concurrency slot plus a budget reservation; release the slot when done."""
+        max_wait = settings.gemini_limits.max_cooldown_seconds
+        while True:
+            await self._gate.acquire(lane)
+            try:
+                minute, wait_ms, local = await self._try_reserve(lane, tokens)
+            except BaseException:
+                self._gate.release()
+                raise
+            if wait_ms <= 0:
+                return _Reservation(minute=minute, tokens=tokens, local=local)
+            self._gate.release()
+            logger.info(
+                "[gemini] %s request waits %.1f s for the rate budget.", _LANE_NAMES[lane], wait_ms / 1000
+            )
+            await asyncio.sleep(min(wait_ms / 1000, max_wait))
+
+    async def _adjust(self, reservation: _Reservation, requests: int, tokens: int) -> None:
+        """Add *requests* / *tokens* (may be negative) to the reservation's window."""
+        client = None if reservation.local else _client()
+        if client is None:
+            window = self._local.windows.get(reservation.minute)
+            if window is not None:
+                window[0] += requests
+                window[1] += tokens
+            return
+        try:
+            async with client.pipeline(transaction=True) as pipe:
+                for prefix, delta in ((_RPM_PREFIX, requests), (_TPM_PREFIX, tokens)):
+                    if delta:
+                        key = f"{prefix}{reservation.minute}"
+                        pipe.incrby(key, delta)
+                        pipe.pexpire(key, _WINDOW_TTL_MS)
+                await pipe.execute()
+        except Exception as exc:
+            logger.warning("[gemini] Failed to update the rate window: %s", exc)
+
+    async def _correct(self, reservation: _Reservation, used_tokens: Optional[int]) -> None:
+        if used_tokens is None or used_tokens == reservation.tokens:
+            return
+        await self._adjust(reservation, 0, used_tokens - reservation.tokens)
+
+    async def _refund(self, reservation: _Reservation) -> None:
+        """Give back a reservation whose request the provider rejected."""
+        await self._adjust(reservation, -1, -reservation.tokens)
+
+    async def _start_cooldown(self, seconds: float) -> None:
+        seconds = min(max(seconds, 1.0), settings.gemini_limits.max_cooldown_seconds)
+        self._local.cooldown_until = max(self._local.cooldown_until, time.time() + seconds)
+        client = _client()
+        if client is None:
+            return
+        try:
+            ttl = await client.pttl(_COOLDOWN_KEY)
+            if ttl < seconds * 1000:
+                await client.set(_COOLDOWN_KEY, "1", px=int(seconds * 1000))
+        except Exception as exc:
+            logger.warning("[gemini] Failed to store cooldown: %s", exc)
+
+    async def run(
+        self,
+        lane: int,
+        estimated_tokens: int,
+        call: Callable[[], Awaitable[tuple[T, Optional[int]]]],
+    ) -> T:
+        """Run *call* (returning ``(result, used_tokens)``) within the lane's limits."""
+        max_retries = settings.gemini_limits.max_retries
+        for attempt in range(max_retries + 1):
+            reservation = await self._acquire(lane, estimated_tokens)
+            try:
+                result, used_tokens = await call()
+            except Exception as exc:
+                delay = rate_limit_delay(exc)
+                if delay is None:
+                    raise
+                await self._refund(reservation)
+                await self._start_cooldown(delay)
+                if attempt >= max_retries:
+                    raise
+                logger.warning(
+                    "[gemini] 429 on %s request, cooling down %.0f s (retry %d/%d).",
+                    _LANE_NAMES[lane], delay, attempt + 1, max_retries,
+                )
+                continue
+            finally:
+                self._gate.release()
+            await self._correct(reservation, used_tokens)
+            return result
+        raise AssertionError("unreachable")
+
+
+_governor: Optional[_Governor] = None
+
+
+def get_governor() -> _Governor:
+    """Return the process-wide governor (built on first use)."""
+    global _governor
+    if _governor is None:
+        _governor = _Governor()
+    return _governor
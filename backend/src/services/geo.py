@@ -0,0 +1,377 @@
+"""
+Geolocation providers for the access log.
+
+Every provider resolves IPs to the ``AccessLog`` geo columns (city, region,
+country, latitude, longitude, org, timezone):
+
+* ``IPinfoProvider``     - ipinfo.io HTTP API (online, rate-limited)
+* ``MMDBProvider``       - local MaxMind / DB-IP ``.mmdb`` file, memory-mapped
+* ``RangeTableProvider`` - compact sorted IP-range CSV, searched with ``bisect``
+* ``ChainProvider``      - asks providers in order; later ones only see misses
+
+``get_geo_provider()`` builds the configured chain once per process: the local
+database (``ACCESS_GEO_DATABASE_PATH``) first, IPinfo as fallback.
+"""
+
+import asyncio
+import csv
+import ipaddress
+import logging
+from abc import ABC, abstractmethod
+from bisect import bisect_right
+from pathlib import Path
+from typing import Iterable, Optional
+
+import httpx
+import maxminddb
+
+from ..core.config import get_settings
+from ..core.http import GEO, get_http_client
+from ..utils.rate_limit import TokenBucket
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+GEO_FIELDS = ("city", "region", "country", "latitude", "longitude", "org", "timezone")
+
+
+def empty_geo() -> dict:
+    """A geo record with every column unset (= not resolved)."""
+    return dict.fromkeys(GEO_FIELDS)
+
+
+class GeoProvider(ABC):
+    """Base class: resolve many IPs at once to ``{ip: geo_fields}``.
+
+    IPs the provider cannot resolve are simply absent from the result.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    async def lookup_many(self, ips: list[str]) -> dict[str, dict]:
+        ...
+
+    def close(self) -> None:
+        """Release file handles / memory maps (no-op by default)."""
+
+
+# ---------------------------------------------------------------------------
+# IPinfo (online)
+# ---------------------------------------------------------------------------
+
+def _parse_loc(loc_str: Optional[str]) -> tuple[Optional[float], Optional[float]]:
+    """Parse IPinfo 'loc' field like '52.5200,13.4050' → (lat, lng)."""
+    if not loc_str:
+        return None, None
+    try:
+        parts = loc_str.split(",")
+        return float(parts[0]), float(parts[1])
+    except (ValueError, IndexError):
+        return None, None
+
+
+def _ipinfo_fields(data: dict) -> dict:
+    """Map an IPinfo response onto the ``AccessLog`` geo columns."""
+    lat, lng = _parse_loc(data.get("loc"))
+    return {
+        "city": data.get("city"),
+        "region": data.get("region"),
+        "country": data.get("country"),
+        "latitude": lat,
+        "longitude": lng,
+        "org": data.get("org"),
+        "timezone": data.get("timezone"),
+    }
+
+
+class IPinfoProvider(GeoProvider):
+    """ipinfo.io lookups over the shared ``geo`` client, concurrent under a
+    semaphore and a token-bucket rate limit."""
+
+    name = "ipinfo"
+
+    def __init__(self, token: str = "", concurrency: int = 20, rate_per_second: float = 50.0) -> None:
+        self._token = token
+        self._concurrency = concurrency
+        self._rate = rate_per_second
+
+    async def _lookup(self, client: httpx.AsyncClient, ip: str) -> dict:
+        """Call IPinfo API to resolve an IP to geolocation data."""
+        url = f"https://ipinfo.io/{ip}/json"
+        params = {"token": self._token} if self._token else {}
+        try:
+            logger.debug("[geo] Sending request to %s", url)
+            resp = await client.get(url, params=params)
+            logger.debug("[geo] IPinfo response status for %s: %s", ip, resp.status_code)
+            if resp.status_code == 200:
+                return resp.json()
+            logger.warning("[geo] IPinfo returned %s for %s", resp.status_code, ip)
+        except Exception as exc:
+            logger.error("[geo] IPinfo lookup failed for %s: %s", ip, exc)
+        return {}
+
+    async def lookup_many(self, ips: list[str]) -> dict[str, dict]:
+        if not ips:
+            return {}
+        semaphore = asyncio.Semaphore(self._concurrency)
+        bucket = TokenBucket(self._rate)
+        client = get_http_client(GEO)
+
+        async def _one(ip: str) -> tuple[str, dict]:
+            async with semaphore:
+                await bucket.acquire()
+                return ip, await self._lookup(client, ip)
+
+        results = await asyncio.gather(*(_one(ip) for ip in ips))
+        return {ip: _ipinfo_fields(data) for ip, data in results if data}
+
+
+# ---------------------------------------------------------------------------
+# MMDB (offline, memory-mapped)
+# ---------------------------------------------------------------------------
+
+def _name(node: Optional[dict]) -> Optional[str]:
+    """English name of a MaxMind ``{"names": {...}}`` node, or a plain string."""
+    if isinstance(node, dict):
+        return (node.get("names") or {}).get("en")
+    return node
+
+
+def _mmdb_fields(record: dict) -> dict:
+    """Map a MaxMind/DB-IP City (or flat IPinfo-style) record onto the geo columns."""
+    geo = empty_geo()
+    location = record.get("location") or {}
+    subdivisions = record.get("subdivisions") or []
+    country = record.get("country")
+
+    geo["city"] = _name(record.get("city"))
+    geo["region"] = _name(subdivisions[0]) if subdivisions else _name(record.get("region"))
+    geo["country"] = (
+        country.get("iso_code") if isinstance(country, dict)
+        else record.get("country_code") or country
+    )
+    geo["latitude"] = location.get("latitude", record.get("latitude"))
+    geo["longitude"] = location.get("longitude", record.get("longitude"))
+    geo["timezone"] = location.get("time_zone", record.get("timezone"))
+    geo["org"] = _asn_org(record)
+    return geo
+
+
+def _asn_org(record: dict) -> Optional[str]:
+    """IPinfo-style ``"AS64496 Example Org"`` from a MaxMind/IPinfo ASN record."""
+    number = record.get("autonomous_system_number") or record.get("asn")
+    org = record.get("autonomous_system_organization") or record.get("as_name")
+    if number and org:
+        number = str(number)
+        return f"{number if number.startswith('AS') else 'AS' + number} {org}"
+    return org or record.get("org")
+
+
+class MMDBProvider(GeoProvider):
+    """Lookups in a local ``.mmdb`` database opened in memory-mapped mode.
+
+    An optional second ASN database fills ``org`` when the city database
+    has no ASN data (e.g. GeoLite2-City + GeoLite2-ASN).
+    """
+
+    name = "mmdb"
+
+    def __init__(self, path: str, asn_path: str = "") -> None:
+        self._reader = maxminddb.open_database(path, maxminddb.MODE_MMAP)
+        self._asn_reader = (
+            maxminddb.open_database(asn_path, maxminddb.MODE_MMAP) if asn_path else None
+        )
+
+    def lookup(self, ip: str) -> Optional[dict]:
+        try:
+            record = self._reader.get(ip)
+        except ValueError:
+            return None
+        if not record:
+            return None
+        geo = _mmdb_fields(record)
+        if geo["org"] is None and self._asn_reader is not None:
+            asn_record = self._asn_reader.get(ip)
+            if asn_record:
+                geo["org"] = _asn_org(asn_record)
+        return geo if geo["country"] else None
+
+    async def lookup_many(self, ips: list[str]) -> dict[str, dict]:
+        results = {}
+        for ip in ips:
+            geo = self.lookup(ip)
+            if geo is not None:
+                results[ip] = geo
+        return results
+
+    def close(self) -> None:
+        self._reader.close()
+        if self._asn_reader is not None:
+            self._asn_reader.close()
+
+
+# ---------------------------------------------------------------------------
+# Sorted range table (offline, bisect)
+# ---------------------------------------------------------------------------
+
+class RangeTableProvider(GeoProvider):
+    """Lookups in a sorted IP-range table loaded from CSV.
+
+    Expected header (IP2Location-/DB-IP-lite style)::
+
+        start_ip,end_ip,country,region,city,latitude,longitude,org,timezone
+
+    ``start_ip`` / ``end_ip`` may be dotted/colon notation or integers. IPv4
+    and IPv6 ranges are kept in separate tables; a lookup is one
+    ``bisect_right`` over the range starts.
+
+    The family of integer addresses is decided per file, not per number:
+    once any integer exceeds 32 bits the file is an IPv6 table and all its
+    integers are IPv6 (so low ranges such as ``::/96`` stay IPv6). IPv4
+    ranges such tables carry in IPv4-mapped form (``::ffff:0:0/96``) go to
+    the IPv4 table.
+    """
+
+    name = "range_table"
+
+    def __init__(self, path: str) -> None:
+        self._tables: dict[int, tuple[list[int], list[int], list[tuple]]] = {4: ([], [], []), 6: ([], [], [])}
+        with open(path, newline="", encoding="utf-8") as fh:
+            raw = [
+                (row["start_ip"].strip(), row["end_ip"].strip(), self._record(row))
+                for row in csv.DictReader(fh)
+            ]
+        integer_v6 = any(
+            value.isdigit() and int(value) > 0xFFFFFFFF for start, end, _ in raw for value in (start, end)
+        )
+        rows = []
+        for start_value, end_value, record in raw:
+            start = self._parse_ip(start_value, integer_v6)
+            end = self._parse_ip(end_value, integer_v6)
+            if start.version == 6 and start.ipv4_mapped and end.ipv4_mapped:
+                start, end = start.ipv4_mapped, end.ipv4_mapped
+            if start.version != end.version:
+                logger.warning("[geo] Skipping range %s-%s in %s: mixed address families", start, end, path)
+                continue
+            rows.append((start.version, int(start), int(end), record))
+        rows.sort(key=lambda r: (r[0], r[1]))
+        for version, start, end, record in rows:
+            starts, ends, records = self._tables[version]
+            starts.append(start)
+            ends.append(end)
+            records.append(record)
+        logger.info("[geo] Loaded %d IP ranges from %s", len(rows), path)
+
+    @staticmethod
+    def _parse_ip(value: str, integer_v6: bool):
+        if value.isdigit():
+            number = int(value)
+            return ipaddress.IPv6Address(number) if integer_v6 else ipaddress.IPv4Address(number)
+        return ipaddress.ip_address(value)
+
+    @staticmethod
+    def _record(row: dict) -> tuple:
+        def _float(value: Optional[str]) -> Optional[float]:
+            try:
+                return float(value) if value not in (None, "") else None
+            except ValueError:
+                return None
+
+        return (
+            row.get("city") or None,
+            row.get("region") or None,
+            row.get("country") or None,
+            _float(row.get("latitude")),
+            _float(row.get("longitude")),
+            row.get("org") or None,
+            row.get("timezone") or None,
+        )
+
+    def lookup(self, ip: str) -> Optional[dict]:
+        try:
+            addr = ipaddress.ip_address(ip)
+        except ValueError:
+            return None
+        starts, ends, records = self._tables[addr.version]
+        value = int(addr)
+        idx = bisect_right(starts, value) - 1
+        if idx < 0 or value > ends[idx]:
+            return None
+        return dict(zip(GEO_FIELDS, records[idx]))
+
+    async def lookup_many(self, ips: list[str]) -> dict[str, dict]:
+        results = {}
+        for ip in ips:
+            geo = self.lookup(ip)
+            if geo is not None:
+                results[ip] = geo
+        return results
+
+
+# ---------------------------------------------------------------------------
+# Chain + factory
+# ---------------------------------------------------------------------------
+
+class ChainProvider(GeoProvider):
+    """Ask each provider in turn; later providers only see the previous misses."""
+
+    name = "chain"
+
+    def __init__(self, providers: Iterable[GeoProvider]) -> None:
+        self.providers = list(providers)
+
+    async def lookup_many(self, ips: list[str]) -> dict[str, dict]:
+        results: dict[str, dict] = {}
+        remaining = list(ips)
+        for provider in self.providers:
+            if not remaining:
+                break
+            found = await provider.lookup_many(remaining)
+            logger.debug("[geo] %s resolved %d/%d IP(s)", provider.name, len(found), len(remaining))
+            results.update(found)
+            remaining = [ip for ip in remaining if ip not in found]
+        return results
+
+    def close(self) -> None:
+        for provider in self.providers:
+            provider.close()
+
+
+def _build_provider() -> GeoProvider:
+    cfg = settings.access_log
+    providers: list[GeoProvider] = []
+
+    if cfg.geo_database_path:
+        suffix = Path(cfg.geo_database_path).suffix.lower()
+        if suffix == ".mmdb":
+            providers.append(MMDBProvider(cfg.geo_database_path, cfg.geo_asn_database_path))
+        elif suffix == ".csv":
+            providers.append(RangeTableProvider(cfg.geo_database_path))
+        else:
+            raise RuntimeError(
+                f"Unsupported geo database '{cfg.geo_database_path}' (expected .mmdb or .csv)"
+            )
+
+    if cfg.geo_ipinfo_fallback or not providers:
+        providers.append(
+            IPinfoProvider(
+                token=settings.ipinfo_token,
+                concurrency=cfg.geo_concurrency,
+                rate_per_second=cfg.geo_rate_per_second,
+            )
+        )
+
+    logger.info("[geo] Using geo providers: %s", " → ".join(p.name for p in providers))
+    return providers[0] if len(providers) == 1 else ChainProvider(providers)
+
+
+_provider: Optional[GeoProvider] = None
+
+
+def get_geo_provider() -> GeoProvider:
+    """Return the process-wide configured geo provider (built on first use)."""
+    global _provider
+    if _provider is None:
+        _provider = _build_provider()
+    return _provider
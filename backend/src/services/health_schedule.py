@@ -0,0 +1,144 @@
+"""
+Adaptive health-check scheduling.
+
+Responsibilities:
+* Per-URL probe state (last status, streak, flap score, next due time,
+  HTTP validators, HEAD support) kept in one Redis hash so every worker
+  sees the same schedule; falls back to an in-process dict without Redis
+* Interval policy: changed / flapping URLs are re-probed after
+  ``HEALTH_MIN_INTERVAL_MINUTES`` and URLs in a stable state back off
+  exponentially, capped at ``HEALTH_INTERVAL_MINUTES`` (the former fixed
+  sweep interval), so an outage is never noticed later than it used to be.
+  Every interval gets ±``HEALTH_JITTER`` jitter so probes against the same
+  host spread out; jitter never pushes an interval past the cap.
+"""
+
+import json
+import logging
+import random
+import time
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+import redis.asyncio as aioredis
+
+from ..core.config import get_settings
+from ..db import redis as redis_mod
+from ..db.models.project import ProjectStatus
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+_STATE_KEY = "health:state"
+# Flap score above which a URL is treated as flapping (≈ two recent flips)
+_FLAP_THRESHOLD = 1.0
+_FLAP_DECAY = 0.7
+
+# Used when Redis is unavailable (per-worker schedule)
+_local_state: dict[str, str] = {}
+
+
+@dataclass
+class UrlState:
+    status: str = ProjectStatus.UNKNOWN.value
+    streak: int = 0  # consecutive probes with the same status
+    flap_score: float = 0.0  # decaying count of status changes
+    next_due: float = 0.0  # unix time
+    interval: float = 0.0  # seconds, last scheduled interval
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    head_supported: Optional[bool] = None  # None = not tried yet
+
+    @property
+    def is_due(self) -> bool:
+        return self.next_due <= time.time()
+
+
+def _client() -> Optional[aioredis.Redis]:
+    if redis_mod.redis_pool is None:
+        return None
+    return aioredis.Redis(connection_pool=redis_mod.redis_pool)
+
+
+async def load_states(urls: list[str]) -> dict[str, UrlState]:
+    """Return the stored state of every URL (a fresh, due state if none yet)."""
+    if not urls:
+        return {}
+    client = _client()
+    raw: list[Optional[str]]
+    if client is None:
+        raw = [_local_state.get(url) for url in urls]
+    else:
+        try:
+            raw = await client.hmget(_STATE_KEY, urls)
+        except Exception as exc:
+            logger.warning("[health] Failed to load probe schedule: %s", exc)
+            raw = [None] * len(urls)
+    states = {}
+    for url, value in zip(urls, raw):
+        try:
+            states[url] = UrlState(**json.loads(value)) if value else UrlState()
+        except (TypeError, ValueError):
+            states[url] = UrlState()
+    return states
+
+
+async def save_states(states: dict[str, UrlState]) -> None:
+    if not states:
+        return
+    mapping = {url: json.dumps(asdict(state)) for url, state in states.items()}
+    client = _client()
+    if client is None:
+        _local_state.update(mapping)
+        return
+    try:
+        await client.hset(_STATE_KEY, mapping=mapping)
+    except Exception as exc:
+        logger.warning("[health] Failed to store probe schedule: %s", exc)
+
+
+async def forget_urls(urls: list[str]) -> None:
+    """Drop the schedule of URLs no project uses anymore."""
+    if not urls:
+        return
+    client = _client()
+    if client is None:
+        for url in urls:
+            _local_state.pop(url, None)
+        return
+    try:
+        await client.hdel(_STATE_KEY, *urls)
+    except Exception as exc:
+        logger.warning("[health] Failed to prune probe schedule: %s", exc)
+
+
+async def known_urls() -> list[str]:
+    client = _client()
+    if client is None:
+        return list(_local_state)
+    try:
+        return list(await client.hkeys(_STATE_KEY))
+    except Exception as exc:
+        logger.warning("[health] Failed to list probe schedule: %s", exc)
+        return []
+
+
+def next_interval(state: UrlState, status: ProjectStatus) -> float:
+    """Record a probe outcome in *state* and return the seconds until the next probe."""
+    cfg = settings.health
+    changed = status.value != state.status
+    state.flap_score = state.flap_score * _FLAP_DECAY + (1.0 if changed else 0.0)
+    state.streak = 0 if changed else state.streak + 1
+    state.status = status.value
+
+    minimum = cfg.min_interval_minutes * 60
+    cap = max(cfg.interval_minutes * 60, minimum)
+    if changed or state.flap_score > _FLAP_THRESHOLD:
+        interval = minimum
+    else:
+        interval = min(minimum * 2 ** state.streak, cap)
+
+    interval = min(interval * (1 + random.uniform(-cfg.jitter, cfg.jitter)), cap)
+    state.interval = interval
+    state.next_due = time.time() + interval
+    return interval
@@ -7,19 +7,30 @@ Orchestrates: CRUD, health-checking, MinIO image handling.
 import asyncio
 import logging
 import re
-from typing import Optional, Sequence
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Sequence
+from urllib.parse import urlsplit
 
 import httpx
 from fastapi import HTTPException, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..api.schemas.project import ProjectCreate, ProjectUpdate
+from ..api.schemas.project import ProjectCreate, ProjectListItem, ProjectUpdate
 from ..core.config import get_settings
+from ..core.http import GITHUB, HEALTH, get_http_client
 from ..db.crud import app_setting as app_setting_crud
+from ..db.crud import health_probe as health_probe_crud
 from ..db.crud import project as project_crud
 from ..db.minio import get_minio
 from ..db.models.project import Project, ProjectStatus
+from ..utils.helpers import make_etag
+from . import cache as cache_service
+from . import health_schedule
 from . import translation as translation_service
+from . import translation_queue
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -27,6 +38,8 @@ settings = get_settings()
 # Max README size to pass to Gemini (100 KB)
 _MAX_README_SIZE = 100 * 1024
 
+_PROJECT_LIST_ADAPTER = TypeAdapter(List[ProjectListItem])
+
 # ---------------------------------------------------------------------------
 # GitHub README import
 # ---------------------------------------------------------------------------
@@ -59,57 +72,57 @@ async def _fetch_readme(github_url: str) -> tuple[str, str]:
     """
     raw_url = _to_raw_github_url(github_url.strip())
 
-    async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
-        if raw_url.startswith("__repo__"):
-            repo = raw_url[len("__repo__"):]
-            canonical_url = f"https://github.com/{repo}"
-            for branch in ("main", "master"):
-                for filename in ("README.md", "readme.md", "README.rst", "README.txt"):
-                    try_url = f"https://raw.githubusercontent.com/{repo}/{branch}/{filename}"
-                    try:
-                        resp = await client.get(try_url)
-                        if resp.status_code == 200:
-                            content = resp.text
-                            if len(content.encode()) > _MAX_README_SIZE:
-                                content = content[: _MAX_README_SIZE]
-                            return content, canonical_url
-                    except httpx.RequestError:
-                        continue
+    client = get_http_client(GITHUB)
+    if raw_url.startswith("__repo__"):
+        repo = raw_url[len("__repo__"):]
+        canonical_url = f"https://github.com/{repo}"
+        for branch in ("main", "master"):
+            for filename in ("README.md", "readme.md", "README.rst", "README.txt"):
+                try_url = f"https://raw.githubusercontent.com/{repo}/{branch}/{filename}"
+                try:
+                    resp = await client.get(try_url)
+                    if resp.status_code == 200:
+                        content = resp.text
+                        if len(content.encode()) > _MAX_README_SIZE:
+                            content = content[: _MAX_README_SIZE]
+                        return content, canonical_url
+                except httpx.RequestError:
+                    continue
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Could not find a README for this repository. Try pasting the direct README link.",
+        )
+    else:
+        # Determine canonical repo URL from raw URL
+        raw_repo_match = re.match(
+            r"https?://raw\.githubusercontent\.com/([^/]+/[^/]+)/", raw_url
+        )
+        canonical_url = (
+            f"https://github.com/{raw_repo_match.group(1)}"
+            if raw_repo_match
+            else github_url
+        )
+        try:
+            resp = await client.get(raw_url)
+        except httpx.RequestError as exc:
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Could not find a README for this repository. Try pasting the direct README link.",
+                status_code=status.HTTP_502_BAD_GATEWAY,
+                detail=f"Failed to fetch README: {exc}",
             )
-        else:
-            # Determine canonical repo URL from raw URL
-            raw_repo_match = re.match(
-                r"https?://raw\.githubusercontent\.com/([^/]+/[^/]+)/", raw_url
+        if resp.status_code == 404:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="README not found at that URL. Check the link and try again.",
             )
-            canonical_url = (
-                f"https://github.com/{raw_repo_match.group(1)}"
-                if raw_repo_match
-                else github_url
+        if resp.status_code != 200:
+            raise HTTPException(
+                status_code=status.HTTP_502_BAD_GATEWAY,
+                detail=f"GitHub returned HTTP {resp.status_code} when fetching the README.",
             )
-            try:
-                resp = await client.get(raw_url)
-            except httpx.RequestError as exc:
-                raise HTTPException(
-                    status_code=status.HTTP_502_BAD_GATEWAY,
-                    detail=f"Failed to fetch README: {exc}",
-                )
-            if resp.status_code == 404:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="README not found at that URL. Check the link and try again.",
-                )
-            if resp.status_code != 200:
-                raise HTTPException(
-                    status_code=status.HTTP_502_BAD_GATEWAY,
-                    detail=f"GitHub returned HTTP {resp.status_code} when fetching the README.",
-                )
-            content = resp.text
-            if len(content.encode()) > _MAX_README_SIZE:
-                content = content[: _MAX_README_SIZE]
-            return content, canonical_url
+        content = resp.text
+        if len(content.encode()) > _MAX_README_SIZE:
+            content = content[: _MAX_README_SIZE]
+        return content, canonical_url
 
 
 async def import_project_from_github(
@@ -161,55 +174,309 @@ async def import_project_from_github(
 # Health check helpers
 # ---------------------------------------------------------------------------
 
-async def _check_url(url: str) -> ProjectStatus:
-    """Check a single URL and return UP / DOWN / UNKNOWN."""
+@dataclass
+class _Probe:
+    """Outcome of one URL probe, as recorded in ``health_check_probes``."""
+    url: str
+    status: ProjectStatus
+    status_code: Optional[int] = None
+    ttfb_ms: Optional[float] = None
+    total_ms: Optional[float] = None
+    error: Optional[str] = None
+    checked_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+    def as_row(self) -> dict:
+        return {
+            "url": self.url,
+            "checked_at": self.checked_at,
+            "ok": self.status == ProjectStatus.UP,
+            "status_code": self.status_code,
+            "ttfb_ms": self.ttfb_ms,
+            "total_ms": self.total_ms,
+            "error": self.error,
+        }
+
+
+# Statuses meaning "HEAD not supported here" - always use GET from now on
+_HEAD_UNSUPPORTED = {405, 501}
+# ``Range: bytes=0-0`` on an empty resource - the server is up
+_RANGE_NOT_SATISFIABLE = 416
+# Read at most this much of a GET body (servers that ignore Range)
+_MAX_PROBE_BODY = 64 * 1024
+
+
+async def _probe_request(
+    client: httpx.AsyncClient, method: str, url: str, headers: dict, probe: _Probe, start: float
+) -> httpx.Response:
+    """Send one probe request, filling in TTFB / total latency on *probe*."""
+    async with client.stream(method, url, headers=headers) as resp:
+        probe.ttfb_ms = (time.perf_counter() - start) * 1000
+        read = 0
+        async for chunk in resp.aiter_raw():
+            read += len(chunk)
+            if read >= _MAX_PROBE_BODY:
+                break
+        probe.total_ms = (time.perf_counter() - start) * 1000
+    return resp
+
+
+def _is_up(status_code: int) -> bool:
+    return 200 <= status_code < 400 or status_code == _RANGE_NOT_SATISFIABLE
+
+
+async def _check_url(url: str, state: Optional[health_schedule.UrlState] = None) -> _Probe:
+    """Probe a single URL: UP / DOWN / UNKNOWN plus status code and timings.
+
+    Uses ``HEAD`` where the target supports it; otherwise a ranged,
+    conditional ``GET`` (``Range: bytes=0-0`` plus the ETag / Last-Modified
+    validators remembered in *state*), so no full page is downloaded.
+    Any 4xx answer to ``HEAD`` is double-checked with ``GET`` (many servers
+    and CDNs reject ``HEAD`` with 403 / 404 while serving ``GET``); when
+    ``GET`` then succeeds, the URL is probed with ``GET`` from then on.
+    ``304 Not Modified``, ``206 Partial Content`` and ``416 Range Not
+    Satisfiable`` (an empty resource) count as UP. TTFB is taken when the
+    response headers arrive.
+    """
+    state = state or health_schedule.UrlState()
+    client = get_http_client(HEALTH)
+    probe = _Probe(url=url, status=ProjectStatus.UNKNOWN)
+    start = time.perf_counter()
     try:
-        async with httpx.AsyncClient(timeout=10.0, follow_redirects=True) as client:
-            resp = await client.get(url)
-            if 200 <= resp.status_code < 400:
-                return ProjectStatus.UP
+        resp = None
+        head_rejected = False
+        if state.head_supported is not False:
+            resp = await _probe_request(client, "HEAD", url, {}, probe, start)
+            if resp.status_code in _HEAD_UNSUPPORTED:
+                state.head_supported = False
+                resp = None
+            elif 400 <= resp.status_code < 500:
+                head_rejected = True
+                resp = None
+            else:
+                state.head_supported = True
+        if resp is None:
+            headers = {"Range": "bytes=0-0"}
+            if state.etag:
+                headers["If-None-Match"] = state.etag
+            if state.last_modified:
+                headers["If-Modified-Since"] = state.last_modified
+            start = time.perf_counter()
+            resp = await _probe_request(client, "GET", url, headers, probe, start)
+            if head_rejected and _is_up(resp.status_code):
+                state.head_supported = False
+
+        state.etag = resp.headers.get("etag") or state.etag
+        state.last_modified = resp.headers.get("last-modified") or state.last_modified
+        probe.status_code = resp.status_code
+        if _is_up(resp.status_code):
+            probe.status = ProjectStatus.UP
+        else:
             logger.warning("Health check for %s: HTTP %s", url, resp.status_code)
-            return ProjectStatus.DOWN
+            probe.status = ProjectStatus.DOWN
     except httpx.RequestError as exc:
         logger.error("Health check error for %s: %s", url, exc)
-        return ProjectStatus.DOWN
+        probe.status = ProjectStatus.DOWN
+        probe.error = type(exc).__name__
     except Exception as exc:
         logger.error("Unexpected error checking %s: %s", url, exc)
-        return ProjectStatus.UNKNOWN
+        probe.error = type(exc).__name__
+    return probe
+
+
+async def _record_probes(db: AsyncSession, probes: Sequence[_Probe]) -> None:
+    """Append probe results to the health history (best-effort)."""
+    try:
+        await health_probe_crud.create_probes_bulk(db, [probe.as_row() for probe in probes])
+    except Exception as exc:
+        await db.rollback()
+        logger.error("Failed to record %d health probe(s): %s", len(probes), exc)
+
+
+def _combine_statuses(statuses: Sequence[ProjectStatus]) -> ProjectStatus:
+    """A project is UP only if ALL its URLs are UP; any DOWN makes it DOWN."""
+    if all(s == ProjectStatus.UP for s in statuses):
+        return ProjectStatus.UP
+    if any(s == ProjectStatus.DOWN for s in statuses):
+        return ProjectStatus.DOWN
+    return ProjectStatus.UNKNOWN
+
+
+def _project_urls(project: Project) -> list[str]:
+    urls = [str(project.link)]
+    urls.extend(u for u in (project.health_check_urls or []) if u and u.strip())
+    return urls
+
+
+def _group_key(project: Project) -> tuple[str, int]:
+    """Health-check unit: the translation group, or the project itself if ungrouped."""
+    if project.translation_group_id is not None:
+        return "group", project.translation_group_id
+    return "project", project.id
+
+
+def _pick_representative(projects: Sequence[Project]) -> Project:
+    """Language copy whose URLs stand for the whole group.
+
+    Siblings carry identical URLs once translated; while an edit is still
+    pending, the edited copy (``has_changes``) has the current ones.
+    """
+    return min(projects, key=lambda p: (not p.has_changes, p.id))
+
+
+async def _store_group_statuses(
+    db: AsyncSession, statuses: dict[tuple[str, int], ProjectStatus]
+) -> None:
+    await project_crud.set_group_statuses(
+        db,
+        {key: s for (kind, key), s in statuses.items() if kind == "group"},
+        ungrouped={key: s for (kind, key), s in statuses.items() if kind == "project"},
+    )
+    await cache_service.bump_projects_version()
 
 
 async def check_project_health(db: AsyncSession, project: Project) -> Project:
     """
     Check the main link AND all health_check_urls concurrently.
-    Project is UP only if ALL URLs are UP.
+    Project is UP only if ALL URLs are UP. The result is written to every
+    language copy of the project's translation group.
     """
-    await project_crud.set_project_status(db, project, ProjectStatus.CHECKING)
+    key = _group_key(project)
+    await _store_group_statuses(db, {key: ProjectStatus.CHECKING})
+
+    urls = list(dict.fromkeys(_project_urls(project)))
+    states = await health_schedule.load_states(urls)
+    probes = await asyncio.gather(*[_check_url(u, states[u]) for u in urls])
+    logger.info(
+        "Health check results for project %d: %s",
+        project.id, [(p.url, p.status) for p in probes],
+    )
+    for probe in probes:
+        health_schedule.next_interval(states[probe.url], probe.status)
+    await health_schedule.save_states(states)
+    await _record_probes(db, probes)
 
-    urls = [str(project.link)]
-    urls.extend(u for u in (project.health_check_urls or []) if u and u.strip())
+    await _store_group_statuses(db, {key: _combine_statuses([p.status for p in probes])})
+    await db.refresh(project)
+    return project
 
-    statuses = await asyncio.gather(*[_check_url(u) for u in urls])
-    logger.info("Health check results for project %d: %s", project.id, list(zip(urls, statuses)))
 
-    if all(s == ProjectStatus.UP for s in statuses):
-        new_status = ProjectStatus.UP
-    elif any(s == ProjectStatus.DOWN for s in statuses):
-        new_status = ProjectStatus.DOWN
-    else:
-        new_status = ProjectStatus.UNKNOWN
+async def _check_urls_bounded(
+    urls: Sequence[str], states: dict[str, health_schedule.UrlState]
+) -> dict[str, _Probe]:
+    """Probe each distinct URL once, under a global and a per-host concurrency limit."""
+    cfg = settings.health
+    global_limit = asyncio.Semaphore(cfg.concurrency)
+    host_limits: dict[str, asyncio.Semaphore] = {}
+
+    async def _one(url: str) -> tuple[str, _Probe]:
+        host = urlsplit(url).netloc.lower()
+        host_limit = host_limits.setdefault(host, asyncio.Semaphore(cfg.per_host_concurrency))
+        async with host_limit, global_limit:
+            return url, await _check_url(url, states.get(url))
 
-    return await project_crud.set_project_status(db, project, new_status)
+    return dict(await asyncio.gather(*(_one(url) for url in dict.fromkeys(urls))))
 
 
 async def check_all_projects_health(db: AsyncSession) -> None:
-    """Run health checks for all projects (called by scheduler)."""
+    """Run due health checks for all projects concurrently (called by scheduler).
+
+    Checks run per translation group - every language copy shares the same
+    URLs - with each distinct URL probed once per sweep, and all resulting
+    statuses are fanned out to the sibling rows in a single UPDATE.
+
+    Only URLs whose adaptive schedule is due are probed (see
+    ``health_schedule``); a group's status combines those fresh results
+    with the last known status of its other URLs.
+    """
     projects = await project_crud.get_all_projects(db)
-    logger.info("Scheduler: checking %d projects", len(projects))
+    groups: dict[tuple[str, int], list[Project]] = {}
     for project in projects:
-        try:
-            await check_project_health(db, project)
-        except Exception as exc:
-            logger.error("Health check failed for project %d: %s", project.id, exc)
+        groups.setdefault(_group_key(project), []).append(project)
+    urls_by_group = {
+        key: _project_urls(_pick_representative(members)) for key, members in groups.items()
+    }
+    all_urls = list(dict.fromkeys(url for urls in urls_by_group.values() for url in urls))
+
+    stale = set(await health_schedule.known_urls()) - set(all_urls)
+    await health_schedule.forget_urls(list(stale))
+
+    states = await health_schedule.load_states(all_urls)
+    due = [url for url in all_urls if states[url].is_due]
+    logger.info(
+        "Scheduler: %d projects in %d groups, %d/%d URLs due",
+        len(projects), len(groups), len(due), len(all_urls),
+    )
+    if not due:
+        return
+
+    results = await _check_urls_bounded(due, states)
+    for url, probe in results.items():
+        health_schedule.next_interval(states[url], probe.status)
+    await health_schedule.save_states({url: states[url] for url in results})
+    await _record_probes(db, list(results.values()))
+
+    statuses = {
+        key: _combine_statuses([
+            results[url].status if url in results else ProjectStatus(states[url].status)
+            for url in urls
+        ])
+        for key, urls in urls_by_group.items()
+        if any(url in results for url in urls)
+    }
+    try:
+        await _store_group_statuses(db, statuses)
+    except Exception as exc:
+        logger.error("Health check sweep failed to store %d statuses: %s", len(statuses), exc)
+
+    # Trim the probe history
+    cutoff = datetime.now(timezone.utc) - timedelta(days=settings.health.history_days)
+    try:
+        await health_probe_crud.delete_probes_before(db, before=cutoff)
+    except Exception as exc:
+        await db.rollback()
+        logger.error("Failed to trim health probe history: %s", exc)
+
+
+# ---------------------------------------------------------------------------
+# Health history statistics
+# ---------------------------------------------------------------------------
+
+HEALTH_WINDOWS = {
+    "1h": timedelta(hours=1),
+    "24h": timedelta(hours=24),
+    "7d": timedelta(days=7),
+    "30d": timedelta(days=30),
+}
+
+
+def _stats_entry(row: dict) -> dict:
+    probes = row["probes"]
+    return {
+        "url": row["url"],
+        "probes": probes,
+        "uptime_percent": round(100 * row["ok_probes"] / probes, 2) if probes else None,
+        "p50_ms": row["p50_ms"],
+        "p95_ms": row["p95_ms"],
+        "p99_ms": row["p99_ms"],
+        "ttfb_p50_ms": row["ttfb_p50_ms"],
+        "last_checked": row["last_checked"],
+    }
+
+
+async def get_project_health_stats(db: AsyncSession, project_id: int, window: str) -> dict:
+    """Uptime and latency percentiles of a project's URLs over *window* (see ``HEALTH_WINDOWS``)."""
+    project = await get_project(db, project_id)
+    urls = list(dict.fromkeys(_project_urls(project)))
+    since = datetime.now(timezone.utc) - HEALTH_WINDOWS[window]
+
+    per_url = await health_probe_crud.get_probe_stats(db, urls=urls, since=since)
+    overall = await health_probe_crud.get_probe_stats(db, urls=urls, since=since, per_url=False)
+    return {
+        "project_id": project.id,
+        "window": window,
+        "overall": _stats_entry(overall[0]),
+        "urls": [_stats_entry(row) for row in per_url],
+    }
 
 
 # ---------------------------------------------------------------------------
@@ -226,6 +493,31 @@ async def list_projects(
     return await project_crud.get_projects(db, skip=skip, limit=limit, language=language)
 
 
+async def get_project_list_snapshot(
+    db: AsyncSession,
+    *,
+    skip: int = 0,
+    limit: int = 100,
+    language: str = "en",
+) -> cache_service.ProjectListSnapshot:
+    """Return the serialized project list with its ETag, built once per list version.
+
+    Served straight from Redis while no project has been written since the
+    snapshot was taken; otherwise rebuilt from PostgreSQL and cached.
+    """
+    snapshot, version = await cache_service.get_projects_snapshot(language, skip, limit)
+    if snapshot is not None:
+        return snapshot
+
+    projects = await list_projects(db, skip=skip, limit=limit, language=language)
+    items = _PROJECT_LIST_ADAPTER.validate_python(projects, from_attributes=True)
+    body = _PROJECT_LIST_ADAPTER.dump_json(items).decode()
+    snapshot = cache_service.ProjectListSnapshot(body=body, etag=make_etag(body))
+    if version is not None:
+        await cache_service.set_projects_snapshot(language, skip, limit, version, snapshot)
+    return snapshot
+
+
 async def get_project(db: AsyncSession, project_id: int) -> Project:
     project = await project_crud.get_project_by_id(db, project_id)
     if project is None:
@@ -252,6 +544,11 @@ async def create_project(
         health_check_urls=data.health_check_urls or [],
         has_changes=auto_translate,
     )
+    await cache_service.bump_projects_version()
+    if auto_translate:
+        await translation_queue.enqueue_translation(
+            translation_service.PROJECT_JOB, project.id, project.language
+        )
     # Fire-and-forget health check (handled in router via BackgroundTasks)
     return project
 
@@ -307,6 +604,11 @@ async def update_project(
     changes["has_changes"] = auto_translate
 
     updated = await project_crud.update_project(db, project, **changes)
+    await cache_service.bump_projects_version()
+    if auto_translate:
+        await translation_queue.enqueue_translation(
+            translation_service.PROJECT_JOB, updated.id, updated.language
+        )
     return updated, link_changed
 
 
@@ -337,6 +639,7 @@ async def delete_project(db: AsyncSession, project_id: int) -> None:
         # Fallback deletion
         await db.delete(project)
         await db.commit()
+    await cache_service.bump_projects_version()
 
 
 def get_project_image_url(project: Project) -> Optional[str]:
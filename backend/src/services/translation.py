@@ -2,23 +2,34 @@
 Translation service – automatic translation of CV and Project content
 using Google Gemini API.
 
-Called periodically by the APScheduler job.  When a CV or project is
-saved by the admin, ``has_changes`` is set to True.  This routine
-picks up those records, translates them into every other supported
-language, and resets the flag.
+When a CV or project is saved by the admin, ``has_changes`` is set to True
+and one job per target language is queued (see ``translation_queue``). Each
+job translates the current source record into its language; the flag is
+reset once every target language is done.
 """
 
+import asyncio
+import functools
+import hashlib
 import json
 import logging
-import asyncio
 import os
-from typing import Dict, List, Optional, Sequence
-
-from sqlalchemy import text
+import re
+import unicodedata
+import uuid
+from collections import OrderedDict
+from types import SimpleNamespace
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
 
 from ..core.config import get_settings
 from ..db.crud import cv as cv_crud, project as project_crud, app_setting as app_setting_crud
-from ..db.session import AsyncSessionLocal, async_engine
+from ..db.crud import translation_memory as memory_crud
+from ..db.session import AsyncSessionLocal
+from ..utils.json_chunks import Piece, pack_pieces, reassemble, split_sections
+from ..utils.json_diff import Path, apply_translations, count_text_leaves, plan_patch
+from ..utils.json_stream import SectionStream
+from . import cache as cache_service
+from .gemini_governor import BACKGROUND, INTERACTIVE, estimate_tokens, get_governor
 
 logger = logging.getLogger(__name__)
 
@@ -56,11 +67,34 @@ async def get_active_model(db) -> str:
     return stored or settings.gemini.model
 
 
-def _get_agent(system_instruction: str, model: str, output_schema: type = None):
-    """Initialise a google-adk Agent."""
+_APP_NAME = "transl"
+_USER_ID = "system"
+# Runners are keyed by (model, instruction); instructions embed the language
+# pair, so a few dozen cover every prompt in use.
+_RUNNER_POOL_SIZE = 64
+_runners: "OrderedDict[tuple, Any]" = OrderedDict()
+
+
+@functools.lru_cache(maxsize=1)
+def _adk() -> SimpleNamespace:
+    """Import google-adk / google-genai once, on first use (slow, kept out of startup)."""
     from google.adk.agents.llm_agent import Agent
+    from google.adk.agents.run_config import RunConfig, StreamingMode
+    from google.adk.runners import Runner
+    from google.adk.sessions import InMemorySessionService
     from google.genai import types
 
+    return SimpleNamespace(
+        Agent=Agent, Runner=Runner, InMemorySessionService=InMemorySessionService, types=types,
+        RunConfig=RunConfig, StreamingMode=StreamingMode,
+    )
+
+
+def _get_agent(system_instruction: str, model: str, output_schema: type = None):
+    """Initialise a google-adk Agent."""
+    adk = _adk()
+    types = adk.types
+
     kwargs = {
         "name": "translator_agent",
         "model": model,
@@ -73,21 +107,146 @@ def _get_agent(system_instruction: str, model: str, output_schema: type = None):
         kwargs["generate_content_config"] = types.GenerateContentConfig(
             response_mime_type="application/json"
         )
-        
-    return Agent(**kwargs)
+
+    return adk.Agent(**kwargs)
+
+
+def _get_runner(system_instruction: str, model: str):
+    """Return the pooled Runner (agent + in-memory session service) for this prompt."""
+    key = (model, system_instruction)
+    runner = _runners.get(key)
+    if runner is not None:
+        _runners.move_to_end(key)
+        return runner
+    adk = _adk()
+    runner = adk.Runner(
+        agent=_get_agent(system_instruction, model),
+        app_name=_APP_NAME,
+        session_service=adk.InMemorySessionService(),
+    )
+    _runners[key] = runner
+    if len(_runners) > _RUNNER_POOL_SIZE:
+        _runners.popitem(last=False)
+    return runner
+
+
+# Token estimate for non-text parts (uploaded CV files)
+_FILE_PART_TOKENS = 2000
+
+
+async def _run_agent(
+    system_instruction: str,
+    model: str,
+    message: Union[str, list],
+    *,
+    lane: int = BACKGROUND,
+    on_text: Optional[Callable[[str], Awaitable[None]]] = None,
+) -> str:
+    """Send *message* (text or a list of ``types.Part``) and return the final response text.
+
+    Every call runs in its own throw-away session, so concurrent calls on
+    the same pooled runner never share conversation history. Calls go
+    through the Gemini governor in *lane* (``INTERACTIVE`` for admin imports).
+
+    With *on_text* the response is streamed: it is awaited with the text
+    received so far after every chunk (and with the final text), so callers
+    can use the finished parts of a response before it is complete. After a
+    retried request the text starts over.
+    """
+    adk = _adk()
+    types = adk.types
+    runner = _get_runner(system_instruction, model)
+    parts = [types.Part(text=message)] if isinstance(message, str) else message
+    # Prompt plus a response of about the same size (translations, extractions)
+    prompt_tokens = estimate_tokens(system_instruction, *(p.text or "" for p in parts))
+    prompt_tokens += _FILE_PART_TOKENS * sum(1 for p in parts if p.text is None)
+
+    async def _call() -> tuple[str, Optional[int]]:
+        session_id = uuid.uuid4().hex
+        await runner.session_service.create_session(
+            app_name=_APP_NAME, user_id=_USER_ID, session_id=session_id
+        )
+        final_text = ""
+        streamed = ""
+        used_tokens: Optional[int] = None
+        run_config = None
+        if on_text is not None:
+            run_config = adk.RunConfig(streaming_mode=adk.StreamingMode.SSE)
+        try:
+            async for event in runner.run_async(
+                user_id=_USER_ID,
+                session_id=session_id,
+                new_message=types.Content(role="user", parts=parts),
+                run_config=run_config,
+            ):
+                if event.partial:
+                    # Streamed chunk; the aggregated final event follows
+                    if on_text is not None and event.content and event.content.parts:
+                        streamed += "".join(p.text or "" for p in event.content.parts)
+                        await on_text(streamed)
+                    continue
+                usage = event.usage_metadata
+                if usage is not None and usage.total_token_count:
+                    used_tokens = (used_tokens or 0) + usage.total_token_count
+                if event.is_final_response() and event.content and event.content.parts:
+                    final_text = (event.content.parts[0].text or "").strip()
+            if on_text is not None and final_text:
+                await on_text(final_text)
+        finally:
+            await runner.session_service.delete_session(
+                app_name=_APP_NAME, user_id=_USER_ID, session_id=session_id
+            )
+        return final_text, used_tokens
+
+    final_text = await get_governor().run(lane, prompt_tokens * 2, _call)
+    if not final_text:
+        raise ValueError("No final response text received from ADK runner.")
+    return final_text
+
+
+def _parse_json_response(text: str) -> Any:
+    """Parse a JSON model response, tolerating a ```json fence around it."""
+    stripped_text = text.strip()
+    if stripped_text.startswith("```json"):
+        stripped_text = stripped_text[7:]
+    if stripped_text.endswith("```"):
+        stripped_text = stripped_text[:-3]
+    return json.loads(stripped_text.strip())
 
 
 # Removed OutputTranslatedCV because Gemini doesn't support additionalProperties for Dict[str, Any]
 
+# Requests per CV translation: the first one plus re-requests of the
+# sections a truncated or failed response did not deliver
+_CV_SECTION_ROUNDS = 3
+
+
+def _same_shape(source: Any, translated: Any) -> bool:
+    """Whether a translated CV section can stand in for the *source* section."""
+    if isinstance(source, list):
+        return isinstance(translated, list) and len(translated) == len(source)
+    if isinstance(source, dict):
+        return isinstance(translated, dict)
+    if isinstance(source, str):
+        return isinstance(translated, str)
+    return True
+
+
 async def translate_cv_data(
     source_data: dict,
     source_lang: str,
     target_lang: str,
     model: str,
+    *,
+    on_section: Optional[Callable[[str, Any], Awaitable[None]]] = None,
 ) -> dict:
-    """Translate the full CV JSON blob from *source_lang* → *target_lang*."""
-    # ADK uses different typing if needed
+    """Translate the full CV JSON blob from *source_lang* → *target_lang*.
 
+    The response is streamed and parsed per top-level section (``summary``,
+    ``experience``, …): each section is checked against the source's shape
+    as soon as it is complete and handed to *on_section*. Sections missing
+    from a truncated or failed response are requested again on their own.
+    """
     src = _LANG_NAMES.get(source_lang, source_lang)
     tgt = _LANG_NAMES.get(target_lang, target_lang)
 
@@ -106,56 +265,125 @@ async def translate_cv_data(
         "Please return a valid JSON object with exactly one key 'cv_data', containing the fully translated dictionary."
     )
 
-    logger.info(f"[translation] [Gemini ADK] Initiating async run for CV {source_lang} -> {target_lang}")
-    agent = _get_agent(system_prompt, model) # Use raw JSON mime-type instead of schema constraint
+    # Empty sections have nothing to translate
+    translated = {key: value for key, value in source_data.items() if value in ("", [], {}, None)}
+    pending = {key: value for key, value in source_data.items() if key not in translated}
+
+    for round_no in range(1, _CV_SECTION_ROUNDS + 1):
+        if not pending:
+            break
+        stream = SectionStream("cv_data")
+        completed: List[str] = []
+
+        async def _on_text(text: str) -> None:
+            for key, value in stream.feed(text):
+                if key not in pending:
+                    continue  # unknown key, or already delivered before a retry
+                if not _same_shape(pending[key], value):
+                    logger.warning(
+                        "[translation] CV %s -> %s: section %r has the wrong shape", source_lang, target_lang, key
+                    )
+                    continue
+                translated[key] = value
+                del pending[key]
+                completed.append(key)
+                if on_section is not None:
+                    await on_section(key, value)
+
+        logger.info(
+            f"[translation] [Gemini ADK] Initiating async run for CV {source_lang} -> {target_lang} "
+            f"({len(pending)} section(s), round {round_no})"
+        )
+        try:
+            await _run_agent(
+                system_prompt, model, json.dumps(pending, ensure_ascii=False), on_text=_on_text
+            )
+            logger.info(f"[translation] [Gemini ADK] async run succeeded for CV {source_lang} -> {target_lang}")
+        except Exception as e:
+            if not completed:
+                if "RESOURCE_EXHAUSTED" in str(e) or "429" in str(e):
+                    logger.error(f"[translation] Gemini API 429 Quota Exhausted: {e}")
+                else:
+                    logger.error(f"[translation] Gemini API Error during CV translation: {e}")
+                raise
+            logger.warning(
+                f"[translation] CV {source_lang} -> {target_lang} failed after {len(completed)} "
+                f"section(s), re-requesting the rest: {e}"
+            )
+            continue
+        if pending:
+            logger.warning(
+                f"[translation] CV {source_lang} -> {target_lang}: response lacks section(s) {sorted(pending)}"
+            )
+
+    if pending:
+        raise ValueError(f"Model returned no translation for CV section(s): {sorted(pending)}")
+    return {key: translated[key] for key in source_data}
+
+
+# CV keys copied verbatim into every language: organisations, dates, links,
+# media and names of people / projects / skills / awards.
+_CV_VERBATIM_KEYS = frozenset({
+    "id", "position", "company", "institution", "organization", "awardingBody",
+    "period", "date", "url", "logo", "profileImage", "platform", "name",
+})
+
+
+def _cv_needs_translation(path: Path, value: str) -> bool:
+    """Whether the CV string leaf at *path* is translated (see the CV prompt rules)."""
+    key = path[-1]
+    if key == "name":
+        # Spoken languages are the one list whose names get translated
+        return path[0] == "languages"
+    if key in _CV_VERBATIM_KEYS:
+        return False
+    return not value.startswith(("http://", "https://", "mailto:"))
+
+
+async def translate_cv_fields(
+    texts: Dict[str, str],
+    source_lang: str,
+    target_lang: str,
+    model: str,
+) -> Dict[str, str]:
+    """Translate individual CV text fields, keyed by their path in the CV JSON."""
+    src = _LANG_NAMES.get(source_lang, source_lang)
+    tgt = _LANG_NAMES.get(target_lang, target_lang)
+
+    system_prompt = (
+        f"You are a professional CV/resume translator.\n"
+        f"Translate the values of the following JSON object from {src} to {tgt}.\n\n"
+        "Rules:\n"
+        "- Every key is the path of a text field in a CV (e.g. 'experience/id=3/details'); "
+        "use it as context and return exactly the same keys.\n"
+        "- DO NOT translate: company names, institution names, organisation names, "
+        "project names, people's names, dates, URLs, skill names, programming languages, "
+        "technology names - keep them as they are inside the translated text.\n"
+        "Please return a valid JSON object with exactly one key 'translations', containing the "
+        "object of translated fields."
+    )
+
+    logger.info(
+        "[translation] [Gemini ADK] Initiating async run for %d CV field(s) %s -> %s",
+        len(texts), source_lang, target_lang,
+    )
     try:
-        from google.adk.runners import Runner
-        from google.adk.sessions import InMemorySessionService
-        from google.genai import types
+        final_text = await _run_agent(system_prompt, model, json.dumps(texts, ensure_ascii=False))
+        logger.info("[translation] [Gemini ADK] async run succeeded for CV fields %s -> %s", source_lang, target_lang)
 
-        session_service = InMemorySessionService()
-        try:
-            await session_service.create_session(app_name="transl", user_id="system", session_id="cv_translation")
-        except Exception:
-            # InMemorySessionService might raise if session already exists, though Docs state we can just get or create
-            pass
-        
-        runner = Runner(agent=agent, app_name="transl", session_service=session_service)
-        content = types.Content(role="user", parts=[types.Part(text=json.dumps(source_data, ensure_ascii=False))])
-        
-        final_text = ""
-        # Native async loop for ADK
-        async for event in runner.run_async(user_id="system", session_id="cv_translation", new_message=content):
-            if event.is_final_response() and event.content and event.content.parts:
-                final_text = event.content.parts[0].text.strip()
-                
-        if not final_text:
-            raise ValueError("No final response text received from ADK runner.")
-            
-        logger.info(f"[translation] [Gemini ADK] async run succeeded for CV {source_lang} -> {target_lang}")
-        
-        stripped_text = final_text.strip()
-        if stripped_text.startswith("```json"):
-            stripped_text = stripped_text[7:]
-        if stripped_text.endswith("```"):
-            stripped_text = stripped_text[:-3]
-        parsed = json.loads(stripped_text.strip())
-        # Model may wrap the result in {"cv_data": {...}} or return the dict directly.
+        parsed = _parse_json_response(final_text)
         if isinstance(parsed, dict):
-            return parsed.get("cv_data", parsed)
-        return parsed
+            return parsed.get("translations", parsed)
+        return {}
 
     except Exception as e:
         if "RESOURCE_EXHAUSTED" in str(e) or "429" in str(e):
-            logger.error(f"[translation] Gemini API 429 Quota Exhausted: {e}")
+            logger.error("[translation] Gemini API 429 Quota Exhausted: %s", e)
             raise
-        logger.error(f"[translation] Gemini API Error during CV translation: {e}")
+        logger.error("[translation] Gemini API Error during CV field translation: %s", e)
         raise
 
 
-
-
-
 # ---------------------------------------------------------------------------
 # CV import – parse an uploaded CV/resume file into the CV JSON structure
 # ---------------------------------------------------------------------------
@@ -231,20 +459,8 @@ async def generate_cv_from_file(
     )
 
     logger.info("[translation] [Gemini ADK] Initiating CV import run (merge=%s)", bool(existing_data))
-    agent = _get_agent(system_prompt, model)
     try:
-        from google.adk.runners import Runner
-        from google.adk.sessions import InMemorySessionService
-        from google.genai import types
-
-        session_service = InMemorySessionService()
-        try:
-            await session_service.create_session(app_name="transl", user_id="system", session_id="cv_import")
-        except Exception:
-            pass
-
-        runner = Runner(agent=agent, app_name="transl", session_service=session_service)
-
+        types = _adk().types
         parts = []
         if existing_data:
             parts.append(types.Part(
@@ -253,24 +469,10 @@ async def generate_cv_from_file(
         parts.append(types.Part.from_bytes(data=file_bytes, mime_type=mime_type))
         parts.append(types.Part(text="Extract the CV data from the attached document as instructed."))
 
-        content = types.Content(role="user", parts=parts)
-
-        final_text = ""
-        async for event in runner.run_async(user_id="system", session_id="cv_import", new_message=content):
-            if event.is_final_response() and event.content and event.content.parts:
-                final_text = event.content.parts[0].text.strip()
-
-        if not final_text:
-            raise ValueError("No final response text received from ADK runner.")
-
+        final_text = await _run_agent(system_prompt, model, parts, lane=INTERACTIVE)
         logger.info("[translation] [Gemini ADK] CV import run succeeded")
 
-        stripped_text = final_text.strip()
-        if stripped_text.startswith("```json"):
-            stripped_text = stripped_text[7:]
-        if stripped_text.endswith("```"):
-            stripped_text = stripped_text[:-3]
-        parsed = json.loads(stripped_text.strip())
+        parsed = _parse_json_response(final_text)
         if isinstance(parsed, dict):
             return parsed.get("cv_data", parsed)
         return parsed
@@ -316,37 +518,11 @@ async def generate_project_from_readme(
     )
 
     logger.info("[translation] [Gemini ADK] Initiating GitHub README import run (language=%s)", language)
-    agent = _get_agent(system_prompt, model)
     try:
-        from google.adk.runners import Runner
-        from google.adk.sessions import InMemorySessionService
-        from google.genai import types
-
-        session_service = InMemorySessionService()
-        try:
-            await session_service.create_session(app_name="transl", user_id="system", session_id="github_import")
-        except Exception:
-            pass
-
-        runner = Runner(agent=agent, app_name="transl", session_service=session_service)
-        content = types.Content(role="user", parts=[types.Part(text=user_message)])
-
-        final_text = ""
-        async for event in runner.run_async(user_id="system", session_id="github_import", new_message=content):
-            if event.is_final_response() and event.content and event.content.parts:
-                final_text = event.content.parts[0].text.strip()
-
-        if not final_text:
-            raise ValueError("No final response text received from ADK runner.")
-
+        final_text = await _run_agent(system_prompt, model, user_message, lane=INTERACTIVE)
         logger.info("[translation] [Gemini ADK] GitHub README import run succeeded")
 
-        stripped_text = final_text.strip()
-        if stripped_text.startswith("```json"):
-            stripped_text = stripped_text[7:]
-        if stripped_text.endswith("```"):
-            stripped_text = stripped_text[:-3]
-        parsed = json.loads(stripped_text.strip())
+        parsed = _parse_json_response(final_text)
         if isinstance(parsed, dict):
             return parsed.get("project", parsed)
         return parsed
@@ -370,12 +546,9 @@ async def translate_projects_batch(
     src = _LANG_NAMES.get(source_lang, source_lang)
     tgt = _LANG_NAMES.get(target_lang, target_lang)
 
+    # Only the fields present on each item are sent (and billed)
     items = [
-        {
-            "id": p["id"],
-            "title": p["title"],
-            "description": p["description"] or "",
-        }
+        {"id": p["id"], **{field: p[field] or "" for field in ("title", "description") if field in p}}
         for p in projects
     ]
 
@@ -383,44 +556,17 @@ async def translate_projects_batch(
         f"You are a professional translator for software project descriptions.\n"
         f"Translate the following project data from {src} to {tgt}.\n\n"
         "Rules:\n"
-        "- Translate the \"title\" and \"description\" fields.\n"
+        "- Translate the \"title\" and \"description\" fields wherever an item has them.\n"
         "- Keep the \"id\" of each item unchanged (same integer value as the input).\n"
         "Please return a valid JSON object with exactly one key 'projects', containing the array of translated items."
     )
 
     logger.info(f"[translation] [Gemini ADK] Initiating async run for {len(projects)} Projects {source_lang} -> {target_lang}")
-    agent = _get_agent(system_prompt, model)
     try:
-        from google.adk.runners import Runner
-        from google.adk.sessions import InMemorySessionService
-        from google.genai import types
-
-        session_service = InMemorySessionService()
-        try:
-            await session_service.create_session(app_name="transl", user_id="system", session_id="project_translation")
-        except Exception:
-            pass
-        
-        runner = Runner(agent=agent, app_name="transl", session_service=session_service)
-        content = types.Content(role="user", parts=[types.Part(text=json.dumps(items, ensure_ascii=False))])
-        
-        final_text = ""
-        # Native async loop for ADK
-        async for event in runner.run_async(user_id="system", session_id="project_translation", new_message=content):
-            if event.is_final_response() and event.content and event.content.parts:
-                final_text = event.content.parts[0].text.strip()
-                
-        if not final_text:
-            raise ValueError("No final response text received from ADK runner.")
-        
+        final_text = await _run_agent(system_prompt, model, json.dumps(items, ensure_ascii=False))
         logger.info(f"[translation] [Gemini ADK] async run succeeded for {len(projects)} Projects {source_lang} -> {target_lang}")
-        
-        stripped_text = final_text.strip()
-        if stripped_text.startswith("```json"):
-            stripped_text = stripped_text[7:]
-        if stripped_text.endswith("```"):
-            stripped_text = stripped_text[:-3]
-        parsed = json.loads(stripped_text.strip())
+
+        parsed = _parse_json_response(final_text)
         # Model may return {"projects": [...]} or a bare [...] array.
         if isinstance(parsed, dict):
             return parsed.get("projects", [])
@@ -437,214 +583,317 @@ async def translate_projects_batch(
 
 
 # ---------------------------------------------------------------------------
-# Main scheduler routine
+# Translation memory – identical segments are translated only once
 # ---------------------------------------------------------------------------
 
-async def run_translation_sync() -> None:
-    """Check for pending changes and translate them.
+_INLINE_WS_RE = re.compile(r"[ \t\u00a0]+")
+
+
+def _normalize_segment(text: str) -> str:
+    """NFC, unified line endings, collapsed runs of spaces, no outer whitespace."""
+    text = unicodedata.normalize("NFC", text).replace("\r\n", "\n").strip()
+    return "\n".join(_INLINE_WS_RE.sub(" ", line).strip() for line in text.split("\n"))
+
+
+def _memory_key(text: str, source_lang: str, target_lang: str, model: str) -> str:
+    raw = "\x00".join((model, source_lang, target_lang, _normalize_segment(text)))
+    return hashlib.sha256(raw.encode()).hexdigest()
+
 
-    Called by APScheduler every N minutes (see ``lifespan.py``).
+def _memory_row(key: str, text: str, value: str, source_lang: str, target_lang: str, model: str) -> dict:
+    return {
+        "key": key,
+        "model": model,
+        "source_language": source_lang,
+        "target_language": target_lang,
+        "source_text": text,
+        "translated_text": value,
+    }
+
+
+async def _translate_with_memory(
+    texts: Dict[str, str],
+    source_lang: str,
+    target_lang: str,
+    model: str,
+    translate: Callable[..., Awaitable[Dict[str, str]]],
+    *,
+    progressive: bool = False,
+) -> Dict[str, str]:
+    """Translate ``{segment_id: text}``; only segments not in memory reach *translate*.
+
+    Segments *translate* leaves out are missing from the result. With
+    *progressive*, *translate* also receives a ``remember(segment_id, value)``
+    coroutine to store each segment as soon as it is translated, so the
+    segments it finished survive a later failure of the same call.
     """
-    if not settings.gemini.api_key:
-        logger.warning("[translation] Gemini API key not configured, skipping translation sync.")
-        return
+    if not settings.translation.memory_enabled:
+        if progressive:
+            async def _forget(seg_id: str, value: str) -> None:
+                return None
 
-    # Respect the admin toggle. When auto-translation is off, skip the whole run
-    # so nothing flagged just before disabling gets propagated to other languages.
+            return await translate(texts, _forget)
+        return await translate(texts)
+
+    keys = {seg_id: _memory_key(text, source_lang, target_lang, model) for seg_id, text in texts.items()}
     async with AsyncSessionLocal() as db:
-        if not await app_setting_crud.is_auto_translation_enabled(db):
-            logger.info("[translation] Auto-translation disabled in settings, skipping run.")
-            return
-
-    supported = settings.translation.supported_languages
-    logger.info("[translation] Starting translation sync …")
-
-    # Advisory lock on a DEDICATED connection, held for the whole run.
-    # Session-level advisory locks are bound to one physical connection; the
-    # sessions below commit repeatedly (which can return their connection to the
-    # pool), so the lock must live on its own connection that we never reuse for
-    # queries. pg_try_advisory_lock is non-blocking: if another uvicorn instance
-    # already holds it, we skip this run instead of piling up.
-    lock_conn = await async_engine.connect()
-    got_lock = await lock_conn.scalar(text("SELECT pg_try_advisory_lock(1234567890)"))
-    if not got_lock:
-        logger.info("[translation] Another instance holds the translation lock, skipping this run.")
-        await lock_conn.close()
-        return
-    logger.info("[translation] Advisory lock acquired.")
+        remembered = await memory_crud.get_translations(db, list(set(keys.values())))
+    result = {seg_id: remembered[key] for seg_id, key in keys.items() if key in remembered}
+    misses = {seg_id: text for seg_id, text in texts.items() if seg_id not in result}
+    logger.info(
+        "[translation] %s -> %s: %d/%d segment(s) from translation memory",
+        source_lang, target_lang, len(result), len(texts),
+    )
+    if not misses:
+        return result
+
+    stored: set = set()
+
+    async def _remember(seg_id: str, value: str) -> None:
+        row = _memory_row(keys[seg_id], misses[seg_id], value, source_lang, target_lang, model)
+        async with AsyncSessionLocal() as db:
+            await memory_crud.store_translations(db, [row])
+        stored.add(seg_id)
+
+    translated = await (translate(misses, _remember) if progressive else translate(misses))
+    rows: Dict[str, dict] = {}
+    for seg_id, text in misses.items():
+        value = translated.get(seg_id)
+        if not isinstance(value, str) or not value:
+            continue
+        result[seg_id] = value
+        if seg_id not in stored:
+            rows[keys[seg_id]] = _memory_row(keys[seg_id], text, value, source_lang, target_lang, model)
+    async with AsyncSessionLocal() as db:
+        await memory_crud.store_translations(db, list(rows.values()))
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Queue jobs – one entity translated into one target language
+# ---------------------------------------------------------------------------
+
+CV_JOB = "cv"
+PROJECT_JOB = "project"
+
+
+def _project_source(project) -> dict:
+    """Scalar copy of the fields a project translation needs (no lazy loads later)."""
+    return {
+        "id": project.id,
+        "title": project.title,
+        "description": project.description,
+        "translation_group_id": project.translation_group_id,
+        "link": project.link,
+        "github_link": project.github_link,
+        "image_object_name": project.image_object_name,
+        "image_external_url": project.image_external_url,
+        "position": project.position,
+        "owner_id": project.owner_id,
+        "health_check_urls": project.health_check_urls,
+    }
+
 
+def _json_tokens(value: Any) -> int:
+    return estimate_tokens(json.dumps(value, ensure_ascii=False))
+
+
+async def _translate_cv_chunk(
+    chunk: List[Piece],
+    source_lang: str,
+    target_lang: str,
+    model: str,
+    remember: Callable[[str, str], Awaitable[None]],
+) -> Dict[str, str]:
+    """Translate one chunk of CV pieces; returns ``{piece.id: translated JSON}``."""
+    ids = {piece.section: piece.id for piece in chunk}
+
+    async def _on_section(section: str, value: Any) -> None:
+        await remember(ids[section], json.dumps(value, ensure_ascii=False))
+
+    translated = await translate_cv_data(
+        {piece.section: piece.value for piece in chunk}, source_lang, target_lang, model,
+        on_section=_on_section,
+    )
+    return {ids[section]: json.dumps(value, ensure_ascii=False) for section, value in translated.items()}
+
+
+async def translate_cv_target(source_lang: str, target_lang: str) -> bool:
+    """Translate the CV in *source_lang* into *target_lang* and store it.
+
+    If the target is a translation of an earlier version of the same source,
+    only the text fields that changed since then are sent to the model and
+    patched into the existing translation; otherwise the whole CV is
+    translated, in section chunks that run in parallel. Returns ``False``
+    if there is no CV in *source_lang*.
+    """
     async with AsyncSessionLocal() as db:
-        try:
-            # Admin-configurable model (falls back to env/config default)
-            active_model = await get_active_model(db)
-            logger.info("[translation] Using Gemini model: %s", active_model)
-
-            # Nach Lock: Nochmals prüfen, ob Übersetzungen ausstehen
-            changed_cvs = await cv_crud.get_cvs_with_changes(db)
-            logger.info(f"[translation] Found {len(changed_cvs) if changed_cvs else 0} CVs with changes.")
-            
-            changed_projects: Sequence = await project_crud.get_projects_with_changes(db)
-            logger.info(f"[translation] Found {len(changed_projects) if changed_projects else 0} projects with changes.")
-            
-            if not changed_cvs and not changed_projects:
-                logger.info("[translation] No pending translations after lock.")
-                return
-
-            # ── CV translation ──────────────────────────────────────────
-            async def _process_cv_target(cv_data: dict, owner_id: int, src: str, tgt: str):
-                translated_data = await translate_cv_data(cv_data, src, tgt, active_model)
-                async with AsyncSessionLocal() as db_session:
-                    await cv_crud.upsert_cv(
-                        db_session,
-                        data=translated_data,
-                        owner_id=owner_id,
-                        language=tgt,
-                        has_changes=False,
-                    )
-                logger.info("[translation] CV translated %s → %s", src, tgt)
-                return True
-
-            for cv in changed_cvs:
-                source_lang = cv.language
-                logger.info("[translation] Translating CV from '%s' concurrently", source_lang)
-
-                tasks = []
-                for target_lang in supported:
-                    if target_lang == source_lang:
-                        continue
-                    # Pass extracted scalar values instead of the detached ORM model to prevent lazy loading errors in other thread
-                    tasks.append(_process_cv_target(cv.data, cv.owner_id, source_lang, target_lang))
-
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-
-                cv_translation_success = True
-                for res in results:
-                    if isinstance(res, Exception):
-                        cv_translation_success = False
-                        logger.error("[translation] CV translation failed: %s", res)
-
-                if cv_translation_success:
-                    # Reset flag on the source record
-                    cv.has_changes = False
-                await db.commit()
-
-            # ── Project translation ─────────────────────────────────────
-            if changed_projects:
-                # Group by source language so we batch per target language
-                by_lang: Dict[str, list] = {}
-                for proj in changed_projects:
-                    by_lang.setdefault(proj.language, []).append(proj)
-
-                # Pass a list of dictionaries containing only the scalar data we need instead of detached ORM models
-                async def _process_projects_target(projs_data: list, src: str, tgt: str):
-                    batch_data = [
-                        {
-                            "id": p["id"],
-                            "title": p["title"],
-                            "description": p["description"],
-                        }
-                        for p in projs_data
-                    ]
-                    translated_items = await translate_projects_batch(batch_data, src, tgt, active_model)
-                    # Key by str(id) so an int/str type mismatch in the model
-                    # output never silently drops a translation.
-                    translated_map = {
-                        str(item.get("id")): item for item in translated_items if "id" in item
-                    }
-
-                    async with AsyncSessionLocal() as db_session:
-                        for source_proj_data in projs_data:
-                            trans = translated_map.get(str(source_proj_data["id"]), {})
-                            if not trans:
-                                continue
-
-                            # Find (or create) the matching project in the target language
-                            target_proj = (
-                                await project_crud.get_project_by_group_and_language(
-                                    db_session,
-                                    source_proj_data["translation_group_id"],
-                                    tgt,
-                                )
-                            )
-
-                            if target_proj:
-                                target_proj.title = trans.get("title", source_proj_data["title"])
-                                target_proj.description = trans.get(
-                                    "description", source_proj_data["description"]
-                                )
-                                target_proj.link = source_proj_data["link"]
-                                target_proj.github_link = source_proj_data["github_link"]
-                                target_proj.image_object_name = source_proj_data["image_object_name"]
-                                target_proj.image_external_url = source_proj_data["image_external_url"]
-                                target_proj.position = source_proj_data["position"]
-                                target_proj.health_check_urls = source_proj_data["health_check_urls"] or []
-                                target_proj.has_changes = False
-                            else:
-                                await project_crud.create_project(
-                                    db_session,
-                                    title=trans.get("title", source_proj_data["title"]),
-                                    description=trans.get(
-                                        "description", source_proj_data["description"]
-                                    ),
-                                    link=source_proj_data["link"],
-                                    github_link=source_proj_data["github_link"],
-                                    image_object_name=source_proj_data["image_object_name"],
-                                    image_external_url=source_proj_data["image_external_url"],
-                                    position=source_proj_data["position"],
-                                    owner_id=source_proj_data["owner_id"],
-                                    language=tgt,
-                                    health_check_urls=source_proj_data["health_check_urls"] or [],
-                                    translation_group_id=source_proj_data["translation_group_id"],
-                                    has_changes=False,
-                                )
-                        await db_session.commit()
-
-                    logger.info("[translation] %d projects translated %s → %s", len(projs_data), src, tgt)
-                    return True
-
-                for source_lang, projects in by_lang.items():
-                    logger.info("[translation] Translating %d projects from '%s' concurrently", len(projects), source_lang)
-                    
-                    # Pre-serialize project data so threaded tasks don't touch unattached ORM models
-                    projs_data = [
-                        {
-                            "id": p.id,
-                            "title": p.title,
-                            "description": p.description,
-                            "translation_group_id": p.translation_group_id,
-                            "link": p.link,
-                            "github_link": p.github_link,
-                            "image_object_name": p.image_object_name,
-                            "image_external_url": p.image_external_url,
-                            "position": p.position,
-                            "owner_id": p.owner_id,
-                            "health_check_urls": p.health_check_urls
-                        }
-                        for p in projects
-                    ]
-                    
-                    tasks = []
-                    for target_lang in supported:
-                        if target_lang == source_lang:
-                            continue
-                        tasks.append(_process_projects_target(projs_data, source_lang, target_lang))
-                        
-                    results = await asyncio.gather(*tasks, return_exceptions=True)
-                    
-                    projects_translation_success = True
-                    for res in results:
-                        if isinstance(res, Exception):
-                            projects_translation_success = False
-                            logger.error("[translation] Project translation failed: %s", res)
-
-                    if projects_translation_success:
-                        # Reset flags for source projects in this language batch
-                        for proj in projects:
-                            proj.has_changes = False
-                    await db.commit()
-        finally:
-            await lock_conn.execute(text("SELECT pg_advisory_unlock(1234567890)"))
-            await lock_conn.close()
-            logger.info("[translation] Advisory lock released.")
+        cv = await cv_crud.get_cv(db, language=source_lang)
+        if cv is None:
+            return False
+        cv_data, owner_id = cv.data, cv.owner_id
+        target = await cv_crud.get_cv(db, language=target_lang)
+        snapshot = None
+        if target is not None and target.source_language == source_lang:
+            snapshot, target_data = target.source_snapshot, target.data
+        model = await get_active_model(db)
+
+    if snapshot is None:
+        # Sections (long lists cut into item slices) are the memory segments;
+        # the untranslated ones are packed into chunks that run in parallel.
+        # Each segment is stored as soon as it has streamed in, so a retry
+        # after a failed job only pays for the segments that were not finished.
+        budget = settings.translation.chunk_tokens
+        pieces = split_sections(cv_data, budget, _json_tokens)
+        by_id = {piece.id: piece for piece in pieces}
+        segments = {
+            piece.id: json.dumps(piece.value, ensure_ascii=False, sort_keys=True) for piece in pieces
+        }
 
-    logger.info("[translation] Translation sync complete.")
+        async def _translate_chunks(texts: Dict[str, str], remember) -> Dict[str, str]:
+            chunks = pack_pieces([by_id[piece_id] for piece_id in texts], budget)
+            logger.info(
+                "[translation] CV %s → %s: %d segment(s) in %d chunk(s)",
+                source_lang, target_lang, len(texts), len(chunks),
+            )
+            results = await asyncio.gather(
+                *(
+                    _translate_cv_chunk(chunk, source_lang, target_lang, model, remember)
+                    for chunk in chunks
+                ),
+                return_exceptions=True,
+            )
+            translated: Dict[str, str] = {}
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+                translated.update(result)
+            return translated
+
+        translations = await _translate_with_memory(
+            segments, source_lang, target_lang, model, _translate_chunks, progressive=True
+        )
+        translated_data = reassemble(
+            cv_data, pieces, {piece_id: json.loads(text) for piece_id, text in translations.items()}
+        )
+    else:
+        patch = plan_patch(cv_data, snapshot, target_data, _cv_needs_translation)
+        if patch.pending:
+            logger.info(
+                "[translation] CV %s → %s: %d of %d text field(s) changed",
+                source_lang, target_lang, len(patch.pending),
+                count_text_leaves(cv_data, _cv_needs_translation),
+            )
+            translations = await _translate_with_memory(
+                patch.texts, source_lang, target_lang, model,
+                lambda texts: translate_cv_fields(texts, source_lang, target_lang, model),
+            )
+            missing = apply_translations(patch, translations)
+            if missing:
+                raise ValueError(f"Model returned no translation for {len(missing)} CV field(s): {missing[:5]}")
+        translated_data = patch.result
+
+    async with AsyncSessionLocal() as db:
+        await cv_crud.upsert_cv(
+            db,
+            data=translated_data,
+            owner_id=owner_id,
+            language=target_lang,
+            has_changes=False,
+            source_language=source_lang,
+            source_snapshot=cv_data,
+        )
+    await cache_service.invalidate_cv(target_lang)
+    logger.info("[translation] CV translated %s → %s", source_lang, target_lang)
+    return True
+
+
+async def translate_project_target(project_id: int, target_lang: str) -> bool:
+    """Translate project *project_id* into *target_lang*, creating the copy if needed.
+
+    Returns ``False`` if the project no longer exists.
+    """
+    async with AsyncSessionLocal() as db:
+        project = await project_crud.get_project_by_id(db, project_id)
+        if project is None:
+            return False
+        source = _project_source(project)
+        source_lang = project.language
+        model = await get_active_model(db)
+
+    async def _translate_fields(texts: Dict[str, str]) -> Dict[str, str]:
+        # Only the fields translation memory could not answer
+        item = {"id": project_id, **texts}
+        translated_items = await translate_projects_batch([item], source_lang, target_lang, model)
+        # Match by str(id) so an int/str type mismatch in the model output never
+        # silently drops the translation.
+        trans = next(
+            (item for item in translated_items if str(item.get("id")) == str(project_id)), {}
+        )
+        return {field: trans.get(field) for field in texts}
+
+    texts = {"title": source["title"]}
+    if source["description"]:
+        texts["description"] = source["description"]
+    trans = await _translate_with_memory(texts, source_lang, target_lang, model, _translate_fields)
+    if "title" not in trans:
+        raise ValueError(f"Model returned no translation for project {project_id}")
+
+    async with AsyncSessionLocal() as db:
+        target_proj = await project_crud.get_project_by_group_and_language(
+            db, source["translation_group_id"], target_lang
+        )
+        title = trans["title"]
+        description = trans.get("description", source["description"])
+        if target_proj:
+            target_proj.title = title
+            target_proj.description = description
+            target_proj.link = source["link"]
+            target_proj.github_link = source["github_link"]
+            target_proj.image_object_name = source["image_object_name"]
+            target_proj.image_external_url = source["image_external_url"]
+            target_proj.position = source["position"]
+            target_proj.health_check_urls = source["health_check_urls"] or []
+            target_proj.has_changes = False
+            await db.commit()
+        else:
+            await project_crud.create_project(
+                db,
+                title=title,
+                description=description,
+                link=source["link"],
+                github_link=source["github_link"],
+                image_object_name=source["image_object_name"],
+                image_external_url=source["image_external_url"],
+                position=source["position"],
+                owner_id=source["owner_id"],
+                language=target_lang,
+                health_check_urls=source["health_check_urls"] or [],
+                translation_group_id=source["translation_group_id"],
+                has_changes=False,
+            )
+    await cache_service.bump_projects_version()
+    logger.info("[translation] Project %d translated %s → %s", project_id, source_lang, target_lang)
+    return True
+
+
+async def run_translation_job(kind: str, entity_id: str, target_lang: str) -> bool:
+    """Execute one queued job. Returns ``False`` if its source record is gone."""
+    if kind == CV_JOB:
+        return await translate_cv_target(entity_id, target_lang)
+    if kind == PROJECT_JOB:
+        return await translate_project_target(int(entity_id), target_lang)
+    raise ValueError(f"Unknown translation job kind: {kind!r}")
+
+
+async def mark_source_translated(kind: str, entity_id: str) -> None:
+    """Reset ``has_changes`` on the source once every target language is done."""
+    async with AsyncSessionLocal() as db:
+        if kind == CV_JOB:
+            await cv_crud.clear_changes(db, language=entity_id)
+        else:
+            await project_crud.clear_changes(db, project_id=int(entity_id))
+    if kind == PROJECT_JOB:
+        # ``has_changes`` is part of the public project list payload
+        await cache_service.bump_projects_version()
+    logger.info("[translation] All target languages done for %s %s.", kind, entity_id)
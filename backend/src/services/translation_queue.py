@@ -0,0 +1,427 @@
+"""
+Durable translation job queue on a Redis stream.
+
+Every admin edit enqueues one job per (entity, target language):
+
+* ``translation:jobs``             - stream read by the ``translators``
+                                     consumer group; an entry is acked and
+                                     deleted once its job succeeded, was
+                                     rescheduled or dead-lettered
+* ``translation:delayed``          - zset of failed jobs scored by their retry
+                                     time (exponential backoff); due jobs are
+                                     moved back onto the stream atomically
+* ``translation:dead``             - list of jobs that failed
+                                     ``TRANSLATION_MAX_ATTEMPTS`` times
+* ``translation:pending:<entity>`` - hash target language → job token. A new
+                                     edit replaces the tokens, so jobs of an
+                                     older revision are skipped; the source's
+                                     ``has_changes`` flag is reset once the
+                                     hash runs empty.
+
+Entries of a consumer that died mid-job are taken over with ``XAUTOCLAIM``
+after ``TRANSLATION_CLAIM_IDLE_SECONDS``. ``reconcile_pending_translations``
+(run at startup and every ``TRANSLATION_RECONCILE_MINUTES``) re-enqueues
+flagged records that have no queued jobs, e.g. after an enqueue failed.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import random
+import socket
+import time
+import uuid
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Iterable, Optional
+
+import redis.asyncio as aioredis
+from redis.exceptions import ResponseError
+
+from ..core.config import get_settings
+from ..db import redis as redis_mod
+from ..db.crud import app_setting as app_setting_crud
+from ..db.crud import cv as cv_crud
+from ..db.crud import project as project_crud
+from ..db.session import AsyncSessionLocal
+from . import translation as translation_service
+from .translation import CV_JOB, PROJECT_JOB
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+STREAM_KEY = "translation:jobs"
+GROUP = "translators"
+_DELAYED_KEY = "translation:delayed"
+_DEAD_KEY = "translation:dead"
+_PENDING_PREFIX = "translation:pending:"
+_DEAD_MAXLEN = 1000
+_BLOCK_MS = 5000
+_PROMOTE_BATCH = 100
+
+# Move due jobs from the delayed zset back onto the stream in one step, so a
+# crash between ZREM and XADD can never lose a job.
+_PROMOTE_SCRIPT = """
+local due = redis.call('zrangebyscore', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+for _, member in ipairs(due) do
+    redis.call('zrem', KEYS[1], member)
+    redis.call('xadd', KEYS[2], '*', 'job', member)
+end
+return #due
+"""
+# Remove the job's token if it is still current; returns the number of
+# targets left for the entity, or -1 if a newer edit replaced the token.
+_FINISH_SCRIPT = """
+if redis.call('hget', KEYS[1], ARGV[1]) == ARGV[2] then
+    redis.call('hdel', KEYS[1], ARGV[1])
+    return redis.call('hlen', KEYS[1])
+end
+return -1
+"""
+# Take one dead letter off the list and, if its revision is still current,
+# put the job back onto the stream - both or neither. Returns 1 if requeued,
+# 0 if dropped as outdated, -1 if the entry was already gone.
+_REQUEUE_SCRIPT = """
+if redis.call('lrem', KEYS[1], 1, ARGV[1]) == 0 then return -1 end
+if redis.call('hget', KEYS[3], ARGV[2]) ~= ARGV[3] then return 0 end
+redis.call('xadd', KEYS[2], '*', 'job', ARGV[4])
+return 1
+"""
+
+
+@dataclass
+class TranslationJob:
+    kind: str  # CV_JOB | PROJECT_JOB
+    entity_id: str  # CV: source language, project: source project id
+    source: str
+    target: str
+    token: str
+    attempt: int = 0
+
+    @property
+    def pending_key(self) -> str:
+        return pending_key(self.kind, self.entity_id)
+
+    def dumps(self) -> str:
+        return json.dumps(asdict(self))
+
+    @classmethod
+    def loads(cls, raw: str) -> "TranslationJob":
+        return cls(**json.loads(raw))
+
+
+def pending_key(kind: str, entity_id) -> str:
+    return f"{_PENDING_PREFIX}{kind}:{entity_id}"
+
+
+def _client() -> Optional[aioredis.Redis]:
+    if redis_mod.redis_pool is None:
+        return None
+    return aioredis.Redis(connection_pool=redis_mod.redis_pool)
+
+
+def queue_enabled() -> bool:
+    """Jobs are only queued when a consumer will run them."""
+    return settings.translation.enabled and bool(settings.gemini.api_key)
+
+
+# ---------------------------------------------------------------------------
+# Producer
+# ---------------------------------------------------------------------------
+
+async def enqueue_translation(
+    kind: str, entity_id, source_lang: str, targets: Optional[Iterable[str]] = None
+) -> int:
+    """Queue one job per target language for *entity_id*. Returns the number queued.
+
+    Replaces any queued jobs of the same entity, so only the latest edit is
+    translated. Failures are logged, not raised: the record keeps its
+    ``has_changes`` flag and the reconcile job queues it later.
+    """
+    if not queue_enabled():
+        return 0
+    client = _client()
+    if client is None:
+        logger.warning("[translation] Redis pool not initialised, %s %s not queued.", kind, entity_id)
+        return 0
+
+    if targets is None:
+        targets = settings.translation.supported_languages
+    jobs = [
+        TranslationJob(kind, str(entity_id), source_lang, target, uuid.uuid4().hex)
+        for target in dict.fromkeys(targets)
+        if target != source_lang
+    ]
+    if not jobs:
+        return 0
+
+    key = pending_key(kind, entity_id)
+    try:
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            pipe.hset(key, mapping={job.target: job.token for job in jobs})
+            for job in jobs:
+                pipe.xadd(STREAM_KEY, {"job": job.dumps()})
+            await pipe.execute()
+    except Exception as exc:
+        logger.error("[translation] Failed to queue %s %s: %s", kind, entity_id, exc)
+        return 0
+    logger.info("[translation] Queued %d job(s) for %s %s (%s).", len(jobs), kind, entity_id, source_lang)
+    return len(jobs)
+
+
+async def discard_pending() -> int:
+    """Forget every queued job (its stream entry is skipped when consumed)."""
+    client = _client()
+    if client is None:
+        return 0
+    keys = [key async for key in client.scan_iter(match=f"{_PENDING_PREFIX}*")]
+    if keys:
+        await client.delete(*keys)
+    return len(keys)
+
+
+async def reconcile_pending_translations() -> int:
+    """Queue flagged CVs / projects that have no queued jobs. Returns the number queued."""
+    if not queue_enabled():
+        return 0
+    client = _client()
+    if client is None:
+        return 0
+
+    async with AsyncSessionLocal() as db:
+        if not await app_setting_crud.is_auto_translation_enabled(db):
+            return 0
+        flagged = [(CV_JOB, cv.language, cv.language) for cv in await cv_crud.get_cvs_with_changes(db)]
+        flagged += [
+            (PROJECT_JOB, p.id, p.language) for p in await project_crud.get_projects_with_changes(db)
+        ]
+
+    queued = 0
+    for kind, entity_id, source_lang in flagged:
+        if await client.exists(pending_key(kind, entity_id)):
+            continue
+        if await enqueue_translation(kind, entity_id, source_lang):
+            queued += 1
+    if queued:
+        logger.info("[translation] Reconcile queued %d flagged record(s).", queued)
+    return queued
+
+
+async def requeue_dead_letters() -> int:
+    """Move every dead-lettered job whose revision is still current back onto the stream."""
+    client = _client()
+    if client is None:
+        return 0
+    requeued = 0
+    # Oldest first; the list is capped at _DEAD_MAXLEN entries
+    for raw in reversed(await client.lrange(_DEAD_KEY, 0, -1)):
+        try:
+            job = TranslationJob(**json.loads(raw)["job"])
+        except (ValueError, KeyError, TypeError) as exc:
+            logger.warning("[translation] Skipping malformed dead letter %.200s: %s", raw, exc)
+            continue
+        job.attempt = 0
+        moved = await client.eval(
+            _REQUEUE_SCRIPT, 3, _DEAD_KEY, STREAM_KEY, job.pending_key,
+            raw, job.target, job.token, job.dumps(),
+        )
+        if moved == 1:
+            requeued += 1
+    if requeued:
+        logger.info("[translation] Re-queued %d dead-lettered job(s).", requeued)
+    return requeued
+
+
+async def get_queue_stats() -> dict:
+    client = _client()
+    if client is None:
+        return {"available": False, "queued": 0, "in_progress": 0, "delayed": 0, "dead": 0}
+    async with client.pipeline(transaction=False) as pipe:
+        pipe.xlen(STREAM_KEY)
+        pipe.zcard(_DELAYED_KEY)
+        pipe.llen(_DEAD_KEY)
+        queued, delayed, dead = await pipe.execute()
+    try:
+        in_progress = (await client.xpending(STREAM_KEY, GROUP))["pending"]
+    except ResponseError:  # group not created yet
+        in_progress = 0
+    return {
+        "available": True,
+        "queued": max(queued - in_progress, 0),
+        "in_progress": in_progress,
+        "delayed": delayed,
+        "dead": dead,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Consumer
+# ---------------------------------------------------------------------------
+
+def _retry_delay(attempt: int) -> float:
+    cfg = settings.translation
+    delay = min(cfg.retry_base_seconds * 2 ** (attempt - 1), cfg.retry_max_seconds)
+    return delay * random.uniform(0.8, 1.2)
+
+
+class _TranslationConsumer:
+    """Reads the job stream as one consumer of the group, up to N jobs at a time."""
+
+    def __init__(self) -> None:
+        cfg = settings.translation
+        self._name = f"{socket.gethostname()}-{os.getpid()}"
+        self._concurrency = max(cfg.concurrency, 1)
+        self._claim_idle_ms = cfg.claim_idle_seconds * 1000
+        self._inflight: set[asyncio.Task] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="translation-consumer")
+
+    async def stop(self) -> None:
+        """Stop reading; unfinished jobs stay pending and are reclaimed later."""
+        tasks = [t for t in (self._task, *self._inflight) if t is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._task = None
+        self._inflight.clear()
+
+    async def _ensure_group(self, client: aioredis.Redis) -> None:
+        try:
+            await client.xgroup_create(STREAM_KEY, GROUP, id="0", mkstream=True)
+        except ResponseError as exc:
+            if "BUSYGROUP" not in str(exc):
+                raise
+
+    async def _run(self) -> None:
+        logger.info("[translation] Queue consumer %s started (concurrency %d).", self._name, self._concurrency)
+        last_claim = 0.0
+        while True:
+            try:
+                client = _client()
+                if client is None:
+                    await asyncio.sleep(_BLOCK_MS / 1000)
+                    continue
+                await self._ensure_group(client)
+                await client.eval(_PROMOTE_SCRIPT, 2, _DELAYED_KEY, STREAM_KEY, time.time(), _PROMOTE_BATCH)
+
+                free = self._concurrency - len(self._inflight)
+                if free <= 0:
+                    await asyncio.wait(self._inflight, return_when=asyncio.FIRST_COMPLETED)
+                    continue
+
+                entries: list = []
+                if time.monotonic() - last_claim >= self._claim_idle_ms / 2000:
+                    last_claim = time.monotonic()
+                    claimed = await client.xautoclaim(
+                        STREAM_KEY, GROUP, self._name,
+                        min_idle_time=self._claim_idle_ms, start_id="0-0", count=free,
+                    )
+                    entries = [e for e in claimed[1] if e and e[1]]
+                    if entries:
+                        logger.info("[translation] Reclaimed %d stalled job(s).", len(entries))
+                if not entries:
+                    response = await client.xreadgroup(
+                        GROUP, self._name, {STREAM_KEY: ">"}, count=free, block=_BLOCK_MS
+                    )
+                    entries = response[0][1] if response else []
+
+                for message_id, fields in entries:
+                    task = asyncio.create_task(self._handle(client, message_id, fields))
+                    self._inflight.add(task)
+                    task.add_done_callback(self._inflight.discard)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.error("[translation] Queue consumer error: %s", exc)
+                await asyncio.sleep(_BLOCK_MS / 1000)
+
+    async def _handle(self, client: aioredis.Redis, message_id: str, fields: dict) -> None:
+        try:
+            await self._process(client, message_id, fields)
+        except Exception as exc:
+            # Left pending: reclaimed after TRANSLATION_CLAIM_IDLE_SECONDS
+            logger.error("[translation] Failed to handle queue entry %s: %s", message_id, exc)
+
+    async def _process(self, client: aioredis.Redis, message_id: str, fields: dict) -> None:
+        try:
+            job = TranslationJob.loads(fields["job"])
+        except (KeyError, TypeError, ValueError):
+            logger.error("[translation] Dropping malformed queue entry %s: %r", message_id, fields)
+            await self._settle(client, message_id)
+            return
+
+        if await client.hget(job.pending_key, job.target) != job.token:
+            logger.debug("[translation] Skipping superseded job %s %s → %s.", job.kind, job.entity_id, job.target)
+            await self._settle(client, message_id)
+            return
+
+        try:
+            async with AsyncSessionLocal() as db:
+                enabled = await app_setting_crud.is_auto_translation_enabled(db)
+            if enabled:
+                await translation_service.run_translation_job(job.kind, job.entity_id, job.target)
+            else:
+                logger.info("[translation] Auto-translation disabled, dropping job %s %s → %s.",
+                            job.kind, job.entity_id, job.target)
+        except Exception as exc:
+            await self._fail(client, message_id, job, exc)
+            return
+
+        remaining = await client.eval(_FINISH_SCRIPT, 1, job.pending_key, job.target, job.token)
+        await self._settle(client, message_id)
+        if remaining == 0 and enabled:
+            await translation_service.mark_source_translated(job.kind, job.entity_id)
+
+    async def _fail(self, client: aioredis.Redis, message_id: str, job: TranslationJob, exc: Exception) -> None:
+        job.attempt += 1
+        async with client.pipeline(transaction=True) as pipe:
+            if job.attempt >= settings.translation.max_attempts:
+                logger.error("[translation] Job %s %s → %s failed %d times, dead-lettered: %s",
+                             job.kind, job.entity_id, job.target, job.attempt, exc)
+                entry = {
+                    "job": asdict(job),
+                    "error": str(exc)[:500],
+                    "failed_at": datetime.now(timezone.utc).isoformat(),
+                }
+                pipe.lpush(_DEAD_KEY, json.dumps(entry))
+                pipe.ltrim(_DEAD_KEY, 0, _DEAD_MAXLEN - 1)
+            else:
+                delay = _retry_delay(job.attempt)
+                logger.warning("[translation] Job %s %s → %s failed (attempt %d), retrying in %.0f s: %s",
+                               job.kind, job.entity_id, job.target, job.attempt, delay, exc)
+                pipe.zadd(_DELAYED_KEY, {job.dumps(): time.time() + delay})
+            pipe.xack(STREAM_KEY, GROUP, message_id)
+            pipe.xdel(STREAM_KEY, message_id)
+            await pipe.execute()
+
+    async def _settle(self, client: aioredis.Redis, message_id: str) -> None:
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.xack(STREAM_KEY, GROUP, message_id)
+            pipe.xdel(STREAM_KEY, message_id)
+            await pipe.execute()
+
+
+_consumer: Optional[_TranslationConsumer] = None
+
+
+def start_translation_consumer() -> None:
+    """Start consuming translation jobs in this process (no-op if translation is off)."""
+    global _consumer
+    if not queue_enabled():
+        logger.info("[translation] Queue consumer disabled (TRANSLATION_ENABLED=false or no GOOGLE_API_KEY).")
+        return
+    if _consumer is None:
+        _consumer = _TranslationConsumer()
+        _consumer.start()
+
+
+async def stop_translation_consumer() -> None:
+    global _consumer
+    if _consumer is not None:
+        await _consumer.stop()
+        _consumer = None
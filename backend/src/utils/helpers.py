@@ -1,8 +1,31 @@
 """Misc utility helpers."""
 
+import hashlib
+from typing import Optional
+
 
 def truncate(text: str, max_length: int = 100) -> str:
     """Truncate text to *max_length* chars, appending '…' if needed."""
     if len(text) <= max_length:
         return text
     return text[: max_length - 1] + "…"
+
+
+def make_etag(body: str) -> str:
+    """Strong ETag derived from the response body's content hash."""
+    return f'"{hashlib.sha256(body.encode()).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Evaluate an ``If-None-Match`` header against *etag* (weak comparison, RFC 9110)."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
@@ -0,0 +1,82 @@
+"""
+Size-bounded chunking of a JSON document made of independent sections.
+
+``split_sections(data, budget, size)`` cuts a dict such as ``CVData`` into
+pieces: every top-level section is one piece, except list sections larger
+than *budget* (as measured by *size*), which are cut into consecutive item
+slices of at most *budget* each (a single oversized item is a slice of its
+own). Piece boundaries depend only on *data*, so the same document always
+yields the same pieces.
+
+``pack_pieces`` groups pieces into chunks of at most *budget* in document
+order (never two slices of one section in the same chunk), and
+``reassemble`` puts translated pieces back together in the original key
+and item order.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+
+@dataclass(frozen=True)
+class Piece:
+    section: str
+    value: Any
+    size: int
+    # Item slice ``[start:stop]`` of a list section; ``None`` = whole section
+    start: Optional[int] = None
+    stop: Optional[int] = None
+
+    @property
+    def id(self) -> str:
+        if self.start is None:
+            return self.section
+        return f"{self.section}[{self.start}:{self.stop}]"
+
+
+def split_sections(data: dict, budget: int, size: Callable[[Any], int]) -> list[Piece]:
+    pieces = []
+    for section, value in data.items():
+        total = size(value)
+        if not isinstance(value, list) or total <= budget or len(value) < 2:
+            pieces.append(Piece(section, value, total))
+            continue
+        start, used = 0, 0
+        for i, item in enumerate(value):
+            item_size = size(item)
+            if i > start and used + item_size > budget:
+                pieces.append(Piece(section, value[start:i], used, start, i))
+                start, used = i, 0
+            used += item_size
+        pieces.append(Piece(section, value[start:], used, start, len(value)))
+    return pieces
+
+
+def pack_pieces(pieces: list[Piece], budget: int) -> list[list[Piece]]:
+    chunks: list[list[Piece]] = []
+    used = 0
+    for piece in pieces:
+        current = chunks[-1] if chunks else None
+        if (
+            current is None
+            or used + piece.size > budget
+            or any(other.section == piece.section for other in current)
+        ):
+            chunks.append([piece])
+            used = piece.size
+        else:
+            current.append(piece)
+            used += piece.size
+    return chunks
+
+
+def reassemble(data: dict, pieces: list[Piece], values: dict[str, Any]) -> dict:
+    """Rebuild *data*'s layout from ``{piece.id: translated value}``."""
+    result: dict = {}
+    for piece in sorted(pieces, key=lambda p: p.start or 0):
+        value = values[piece.id]
+        if piece.start is None:
+            result[piece.section] = value
+        else:
+            result.setdefault(piece.section, []).extend(value)
+    return {section: result[section] for section in data}
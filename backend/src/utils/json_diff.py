@@ -0,0 +1,127 @@
+"""
+Structural diff for translated JSON documents.
+
+``plan_patch(source, snapshot, target, needs_translation)`` rebuilds a
+target-language copy of *source* (the freshly edited document):
+
+* the result always has *source*'s structure - added, removed and reordered
+  list items follow the source; items of a list are matched by their ``id``
+  when they have one, by index otherwise
+* leaves that need no translation (``needs_translation(path, value)`` is
+  false: numbers, URLs, names, …) are copied from *source*
+* translatable string leaves whose source text equals the *snapshot* (the
+  source the target was last translated from) keep the existing *target*
+  text
+* every other translatable leaf is returned as pending, keyed by a readable
+  path (``experience/id=17/details``); ``apply_translations`` writes the
+  translated strings into the result
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional, Union
+
+PathKey = Union[str, int]
+Path = tuple[PathKey, ...]
+
+
+@dataclass
+class Patch:
+    result: Any
+    # path string → (container in ``result``, key in container, source text)
+    pending: dict[str, tuple[Any, PathKey, str]] = field(default_factory=dict)
+    reused: int = 0
+
+    @property
+    def texts(self) -> dict[str, str]:
+        return {path: text for path, (_, _, text) in self.pending.items()}
+
+
+def _item_key(item: Any, index: int) -> PathKey:
+    if isinstance(item, dict) and item.get("id") is not None:
+        return f"id={item['id']}"
+    return index
+
+
+def _keyed(items: Any) -> dict[PathKey, Any]:
+    if not isinstance(items, list):
+        return {}
+    return {_item_key(item, i): item for i, item in enumerate(items)}
+
+
+def path_str(path: Path) -> str:
+    return "/".join(str(part) for part in path)
+
+
+def plan_patch(
+    source: Any,
+    snapshot: Any,
+    target: Any,
+    needs_translation: Callable[[Path, Any], bool],
+) -> Patch:
+    patch = Patch(result=None)
+    holder = [None]
+    _walk(source, snapshot, target, (), holder, 0, needs_translation, patch)
+    patch.result = holder[0]
+    return patch
+
+
+def _walk(
+    source: Any,
+    snapshot: Any,
+    target: Any,
+    path: Path,
+    parent: Any,
+    key: PathKey,
+    needs_translation: Callable[[Path, Any], bool],
+    patch: Patch,
+) -> None:
+    if isinstance(source, dict):
+        node: dict = {}
+        parent[key] = node
+        snap = snapshot if isinstance(snapshot, dict) else {}
+        tgt = target if isinstance(target, dict) else {}
+        for k, value in source.items():
+            _walk(value, snap.get(k), tgt.get(k), path + (k,), node, k, needs_translation, patch)
+        return
+
+    if isinstance(source, list):
+        items: list = [None] * len(source)
+        parent[key] = items
+        snap_items = _keyed(snapshot)
+        tgt_items = _keyed(target)
+        for i, value in enumerate(source):
+            item_key = _item_key(value, i)
+            _walk(
+                value, snap_items.get(item_key), tgt_items.get(item_key),
+                path + (item_key,), items, i, needs_translation, patch,
+            )
+        return
+
+    if not isinstance(source, str) or not source.strip() or not needs_translation(path, source):
+        parent[key] = source
+        return
+
+    if snapshot == source and isinstance(target, str) and target:
+        parent[key] = target
+        patch.reused += 1
+        return
+
+    parent[key] = source  # placeholder until ``apply_translations``
+    patch.pending[path_str(path)] = (parent, key, source)
+
+
+def apply_translations(patch: Patch, translations: dict[str, Any]) -> list[str]:
+    """Write *translations* into ``patch.result``. Returns the paths left untranslated."""
+    missing = []
+    for path, (container, key, _) in patch.pending.items():
+        value = translations.get(path)
+        if isinstance(value, str) and value:
+            container[key] = value
+        else:
+            missing.append(path)
+    return missing
+
+
+def count_text_leaves(data: Any, needs_translation: Optional[Callable[[Path, Any], bool]] = None) -> int:
+    """Number of (translatable) non-empty string leaves in *data*."""
+    return len(plan_patch(data, None, None, needs_translation or (lambda path, value: True)).pending)
@@ -0,0 +1,113 @@
+"""
+Incremental extraction of top-level members from a streamed JSON object.
+
+``SectionStream.feed(text)`` takes the response text received so far and
+returns every ``(key, value)`` member of the *section object* that has
+completed since the previous call - long before the closing brace of the
+whole document arrives. The section object is the top-level object, or the
+object under *wrapper_key* when the model wraps its answer
+(``{"cv_data": {...}}``). Anything before the first ``{`` (e.g. a
+```json fence) is ignored.
+
+Feeding a text that does not continue the previous one (a retried request)
+starts over; callers de-duplicate keys they already have.
+"""
+
+import json
+from typing import Any, Optional
+
+
+class SectionStream:
+    def __init__(self, wrapper_key: Optional[str] = None) -> None:
+        self._wrapper = wrapper_key
+        self._reset()
+
+    def _reset(self) -> None:
+        self._text = ""
+        self._pos = 0
+        self._depth = 0
+        self._done = False
+        self._in_string = False
+        self._escape = False
+        self._top_start: Optional[int] = None
+        self._first_key_start: Optional[int] = None
+        self._first_key: Optional[str] = None
+        self._awaiting_wrapper_value = False
+        self._section_depth: Optional[int] = None
+        self._member_start: Optional[int] = None
+
+    def _emit(self, end: int) -> list[tuple[str, Any]]:
+        member = self._text[self._member_start:end].strip()
+        if not member:
+            return []
+        try:
+            parsed = json.loads("{" + member + "}")
+        except ValueError:
+            return []
+        return list(parsed.items())
+
+    def _use_top_level(self) -> None:
+        self._section_depth = 1
+        self._member_start = self._top_start
+
+    def feed(self, text: str) -> list[tuple[str, Any]]:
+        if not text.startswith(self._text):
+            self._reset()
+        self._text = text
+        members: list[tuple[str, Any]] = []
+
+        while self._pos < len(text) and not self._done:
+            pos = self._pos
+            ch = text[pos]
+            self._pos += 1
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._first_key_start is not None and self._first_key is None:
+                        self._first_key = json.loads(text[self._first_key_start:pos + 1])
+                continue
+
+            if self._depth == 0:
+                if ch == "{":
+                    self._depth = 1
+                    self._top_start = pos + 1
+                continue
+
+            if self._awaiting_wrapper_value and not ch.isspace() and ch != ":":
+                self._awaiting_wrapper_value = False
+                if ch == "{":
+                    self._section_depth = 2
+                    self._member_start = pos + 1
+                    self._depth += 1
+                    continue
+                self._use_top_level()
+
+            if ch == '"':
+                self._in_string = True
+                if self._depth == 1 and self._first_key_start is None:
+                    self._first_key_start = pos
+            elif ch == ":":
+                if self._depth == 1 and self._section_depth is None and self._first_key is not None:
+                    if self._wrapper is not None and self._first_key == self._wrapper:
+                        self._awaiting_wrapper_value = True
+                    else:
+                        self._use_top_level()
+            elif ch in "{[":
+                self._depth += 1
+            elif ch in "}]":
+                if self._depth == self._section_depth and self._member_start is not None:
+                    members += self._emit(pos)
+                    self._member_start = None
+                self._depth -= 1
+                if self._depth == 0:
+                    self._done = True
+            elif ch == ",":
+                if self._depth == self._section_depth and self._member_start is not None:
+                    members += self._emit(pos)
+                    self._member_start = pos + 1
+        return members
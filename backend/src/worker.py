@@ -0,0 +1,52 @@
+"""
+Background worker entry-point: ``python -m src.worker``.
+
+Runs the scheduler and its periodic jobs (health sweeps, IP geolocation,
+partition maintenance) plus the translation queue consumer in a process of
+its own, so slow background work never shares an event loop with API
+requests. Start the API with ``JOBS_SCHEDULER_ENABLED=false`` when this
+worker is deployed.
+"""
+
+import asyncio
+import logging
+import signal
+
+from .core.http import close_http_clients, init_http_clients
+from .core.scheduler import shutdown_scheduler, start_scheduler
+from .db.redis import close_redis_pool, init_redis_pool
+from .db.session import async_engine
+from .services.translation_queue import start_translation_consumer, stop_translation_consumer
+
+logging.basicConfig(level=logging.INFO)
+
+logger = logging.getLogger(__name__)
+
+
+async def main() -> None:
+    logger.info("[worker] Initialising resources…")
+    await init_redis_pool()
+    await init_http_clients()
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    start_scheduler()
+    start_translation_consumer()
+    logger.info("[worker] Running - waiting for jobs.")
+    await stop.wait()
+
+    # ── Shutdown ──
+    logger.info("[worker] Shutting down…")
+    shutdown_scheduler()
+    await stop_translation_consumer()
+    await close_http_clients()
+    await close_redis_pool()
+    await async_engine.dispose()
+    logger.info("[worker] Resources cleaned up.")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
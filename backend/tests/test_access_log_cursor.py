@@ -0,0 +1,49 @@
+"""Opaque keyset cursors of the access-log listing."""
+
+import base64
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from src.services.access_log import decode_cursor, encode_cursor
+
+
+@pytest.mark.parametrize(
+    "timestamp",
+    [
+        datetime(2024, 3, 1, 12, 30, 5, 123456, tzinfo=timezone.utc),
+        datetime(2024, 3, 1, 14, 30, tzinfo=timezone(timedelta(hours=2))),
+    ],
+)
+def test_round_trip(timestamp):
+    cursor = encode_cursor(timestamp, 4711)
+    assert decode_cursor(cursor) == (timestamp, 4711)
+
+
+def test_cursor_is_url_safe():
+    cursor = encode_cursor(datetime(2024, 3, 1, tzinfo=timezone.utc), 1)
+    assert "=" not in cursor
+    assert set(cursor) <= set("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_")
+
+
+def _b64(raw: str) -> str:
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "",
+        "not a cursor!",
+        "A",
+        _b64("2024-03-01T00:00:00+00:00"),  # no id
+        _b64("2024-03-01T00:00:00+00:00|abc"),  # id not an integer
+        _b64("yesterday|17"),  # bad timestamp
+        base64.urlsafe_b64encode(b"\xff\xfe|1").decode(),  # not UTF-8
+    ],
+)
+def test_rejects_malformed_cursor(cursor):
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor)
+    assert exc_info.value.status_code == 400
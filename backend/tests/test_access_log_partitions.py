@@ -0,0 +1,123 @@
+"""
+Monthly access_logs partitions against a real PostgreSQL.
+
+Set ``TEST_DATABASE_URL`` (``postgresql+asyncpg://…``) to run; every test
+works in its own throw-away schema.
+"""
+
+import asyncio
+import os
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.db.crud import access_log as access_crud
+from src.db.models.access_log import DEFAULT_PARTITION, month_start, partition_name
+
+DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+pytestmark = pytest.mark.skipif(not DATABASE_URL, reason="TEST_DATABASE_URL not set")
+
+_SCHEMA_DDL = """
+CREATE TABLE access_logs (
+    id SERIAL NOT NULL,
+    ip_address VARCHAR(45) NOT NULL,
+    city VARCHAR(255),
+    region VARCHAR(255),
+    country VARCHAR(10),
+    latitude FLOAT,
+    longitude FLOAT,
+    org VARCHAR(512),
+    timezone VARCHAR(100),
+    range_minutes INTEGER NOT NULL DEFAULT 10,
+    timestamp TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+    CONSTRAINT access_logs_pkey PRIMARY KEY (id, timestamp)
+) PARTITION BY RANGE (timestamp)
+"""
+
+_MONTH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+_NEXT = month_start(_MONTH, 1)
+
+
+def _run(scenario):
+    async def main():
+        schema = f"test_{uuid.uuid4().hex[:12]}"
+        engine = create_async_engine(DATABASE_URL)
+        async with engine.begin() as conn:
+            await conn.execute(text(f"CREATE SCHEMA {schema}"))
+        scoped = create_async_engine(
+            DATABASE_URL, connect_args={"server_settings": {"search_path": schema}}
+        )
+        try:
+            async with scoped.begin() as conn:
+                await conn.execute(text(_SCHEMA_DDL))
+                await conn.execute(text(
+                    f"CREATE TABLE {partition_name(_MONTH)} PARTITION OF access_logs "
+                    f"FOR VALUES FROM ('{_MONTH.isoformat()}') TO ('{_NEXT.isoformat()}')"
+                ))
+                await conn.execute(text(f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF access_logs DEFAULT"))
+            async with async_sessionmaker(scoped, expire_on_commit=False)() as db:
+                await scenario(db)
+        finally:
+            await scoped.dispose()
+            async with engine.begin() as conn:
+                await conn.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+            await engine.dispose()
+
+    asyncio.run(main())
+
+
+async def _insert(db, *timestamps: datetime) -> None:
+    await db.execute(
+        text("INSERT INTO access_logs (ip_address, timestamp) VALUES (:ip, :ts)"),
+        [{"ip": f"198.51.100.{i}", "ts": ts} for i, ts in enumerate(timestamps)],
+    )
+    await db.commit()
+
+
+async def _count(db, table: str) -> int:
+    return await db.scalar(text(f"SELECT count(*) FROM ONLY {table}"))
+
+
+def test_partition_creation_moves_rows_stranded_in_default():
+    async def scenario(db):
+        # The run that should have created next month's partition was missed
+        await _insert(db, _MONTH.replace(day=15), _NEXT.replace(day=2), _NEXT.replace(day=20))
+        assert await _count(db, DEFAULT_PARTITION) == 2
+        assert await access_crud.list_default_partition_months(db) == [_NEXT]
+
+        # A plain CREATE … PARTITION OF is rejected in this state
+        with pytest.raises(Exception, match="default partition"):
+            await db.execute(text(
+                f"CREATE TABLE {partition_name(_NEXT)} PARTITION OF access_logs "
+                f"FOR VALUES FROM ('{_NEXT.isoformat()}') TO ('{month_start(_NEXT, 1).isoformat()}')"
+            ))
+        await db.rollback()
+
+        assert await access_crud.create_access_log_partition(db, month=_NEXT) == 2
+        assert await _count(db, DEFAULT_PARTITION) == 0
+        assert await _count(db, partition_name(_NEXT)) == 2
+        assert await access_crud.list_default_partition_months(db) == []
+        assert partition_name(_NEXT) in await access_crud.list_access_log_partitions(db)
+
+        # The attached partition takes new rows and keeps the primary key
+        await _insert(db, _NEXT.replace(day=25))
+        assert await _count(db, partition_name(_NEXT)) == 3
+        assert await db.scalar(text("SELECT count(*) FROM access_logs")) == 4
+
+    _run(scenario)
+
+
+def test_partition_creation_is_idempotent_and_works_on_empty_default():
+    async def scenario(db):
+        later = month_start(_MONTH, 2)
+        assert await access_crud.create_access_log_partition(db, month=later) == 0
+        assert await access_crud.create_access_log_partition(db, month=later) == 0
+        await _insert(db, later.replace(day=3))
+        assert await _count(db, partition_name(later)) == 1
+        assert await _count(db, DEFAULT_PARTITION) == 0
+
+    _run(scenario)
@@ -0,0 +1,105 @@
+"""Rate-limit backoff parsing and lane priority of the Gemini governor."""
+
+import asyncio
+import time
+from email.utils import formatdate
+from types import SimpleNamespace
+
+import pytest
+
+from src.db import redis as redis_mod
+from src.services.gemini_governor import BACKGROUND, INTERACTIVE, _Governor, rate_limit_delay, settings
+
+
+class _ApiError(Exception):
+    def __init__(self, message: str, code=None, headers=None) -> None:
+        super().__init__(message)
+        self.code = code
+        self.response = SimpleNamespace(headers=headers) if headers is not None else None
+
+
+def test_not_a_rate_limit():
+    assert rate_limit_delay(ValueError("boom")) is None
+    assert rate_limit_delay(_ApiError("server error", code=500)) is None
+
+
+@pytest.mark.parametrize(
+    "exc",
+    [
+        ValueError("Expecting value: line 1 column 4290 (char 4289)"),
+        RuntimeError("session a429f1 not found"),
+        _ApiError("HTTP 429 mentioned in a 500 body", code=500),
+    ],
+)
+def test_429_in_unrelated_message_is_not_a_rate_limit(exc):
+    assert rate_limit_delay(exc) is None
+
+
+def test_status_code_of_response():
+    exc = _ApiError("Too Many Requests", headers={"retry-after": "3"})
+    exc.response.status_code = 429
+    assert rate_limit_delay(exc) == 3.0
+
+
+def test_retry_after_seconds():
+    assert rate_limit_delay(_ApiError("quota", code=429, headers={"retry-after": "7"})) == 7.0
+
+
+def test_retry_after_http_date():
+    header = formatdate(time.time() + 30, usegmt=True)
+    delay = rate_limit_delay(_ApiError("quota", code=429, headers={"retry-after": header}))
+    assert 28 <= delay <= 30
+
+
+def test_retry_after_in_the_past_is_zero():
+    header = formatdate(time.time() - 60, usegmt=True)
+    assert rate_limit_delay(_ApiError("quota", code=429, headers={"retry-after": header})) == 0.0
+
+
+@pytest.mark.parametrize(
+    "message, expected",
+    [
+        ("429 RESOURCE_EXHAUSTED. {'retryDelay': '23s'}", 23.0),
+        ('429 RESOURCE_EXHAUSTED {"retryDelay": "1.5s"}', 1.5),
+        ("RESOURCE_EXHAUSTED retry_delay=4s", 4.0),
+    ],
+)
+def test_retry_delay_in_error_body(message, expected):
+    assert rate_limit_delay(Exception(message)) == expected
+
+
+def test_unparseable_retry_after_falls_back_to_body():
+    exc = _ApiError("429 {'retryDelay': '12s'}", code=429, headers={"retry-after": "soon"})
+    assert rate_limit_delay(exc) == 12.0
+
+
+def test_default_cooldown():
+    expected = settings.gemini_limits.default_cooldown_seconds
+    assert rate_limit_delay(_ApiError("quota exceeded", code=429, headers={})) == expected
+    assert rate_limit_delay(Exception("RESOURCE_EXHAUSTED")) == expected
+
+
+def test_interactive_call_skips_exhausted_background_budget(monkeypatch):
+    monkeypatch.setattr(redis_mod, "redis_pool", None)
+    monkeypatch.setattr(settings.gemini_limits, "max_concurrency", 2)
+    monkeypatch.setattr(settings.gemini_limits, "requests_per_minute", 5)
+    monkeypatch.setattr(settings.gemini_limits, "background_share", 0.4)  # 2 background requests
+
+    async def call():
+        return "done", None
+
+    async def scenario():
+        governor = _Governor()
+        for _ in range(2):
+            await governor.run(BACKGROUND, 10, call)
+        # More background work than the budget allows: these wait for the next minute
+        waiting = [asyncio.create_task(governor.run(BACKGROUND, 10, call)) for _ in range(2)]
+        await asyncio.sleep(0.05)
+        try:
+            return await asyncio.wait_for(governor.run(INTERACTIVE, 10, call), 1)
+        finally:
+            for task in waiting:
+                task.cancel()
+            await asyncio.gather(*waiting, return_exceptions=True)
+
+    assert asyncio.run(scenario()) == "done"
@@ -0,0 +1,57 @@
+"""HyperLogLog sketch used for the unique-visitor rollups."""
+
+import pytest
+
+from src.utils.hyperloglog import DEFAULT_PRECISION, HyperLogLog
+
+# ~1.6 % standard error at precision 12; allow a generous 4 sigma
+_TOLERANCE = 4 * 1.04 / (2 ** DEFAULT_PRECISION) ** 0.5
+
+
+def _sketch(values) -> HyperLogLog:
+    hll = HyperLogLog()
+    hll.update(values)
+    return hll
+
+
+def _ips(start: int, stop: int) -> list[str]:
+    return [f"11.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}" for i in range(start, stop)]
+
+
+def test_empty_sketch_counts_zero():
+    assert HyperLogLog().count() == 0
+    assert HyperLogLog.from_bytes(None).count() == 0
+
+
+@pytest.mark.parametrize("n", [10, 1_000, 50_000])
+def test_estimate_within_error(n):
+    estimate = _sketch(_ips(0, n)).count()
+    assert abs(estimate - n) <= max(n * _TOLERANCE, 1)
+
+
+def test_duplicates_are_counted_once():
+    assert _sketch(_ips(0, 100) * 5).count() == _sketch(_ips(0, 100)).count()
+
+
+def test_merge_is_the_union():
+    left, right = _sketch(_ips(0, 30_000)), _sketch(_ips(20_000, 50_000))
+    left.merge(right)
+    assert left.to_bytes() == _sketch(_ips(0, 50_000)).to_bytes()
+    assert abs(left.count() - 50_000) <= 50_000 * _TOLERANCE
+
+
+def test_merge_rejects_other_precision():
+    with pytest.raises(ValueError):
+        HyperLogLog().merge(HyperLogLog(precision=10))
+
+
+def test_bytes_round_trip():
+    hll = _sketch(_ips(0, 500))
+    restored = HyperLogLog.from_bytes(hll.to_bytes())
+    assert restored.precision == hll.precision
+    assert restored.count() == hll.count()
+
+
+def test_from_bytes_rejects_wrong_register_count():
+    with pytest.raises(ValueError):
+        HyperLogLog(registers=b"\x00" * 10)
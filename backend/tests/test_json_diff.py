@@ -0,0 +1,79 @@
+"""Structural patching of translated JSON documents."""
+
+from src.utils.json_diff import apply_translations, plan_patch
+
+
+def _translatable(path, value) -> bool:
+    return path[-1] != "url"
+
+
+SNAPSHOT = {
+    "summary": "Developer",
+    "experience": [
+        {"id": 1, "title": "Engineer", "url": "https://a.example"},
+        {"id": 2, "title": "Intern", "url": "https://b.example"},
+    ],
+    "skills": ["Python", "Go"],
+}
+TARGET = {
+    "summary": "Entwickler",
+    "experience": [
+        {"id": 1, "title": "Ingenieur", "url": "https://a.example"},
+        {"id": 2, "title": "Praktikant", "url": "https://b.example"},
+    ],
+    "skills": ["Python (de)", "Go (de)"],
+}
+
+
+def test_unchanged_document_reuses_every_translation():
+    patch = plan_patch(SNAPSHOT, SNAPSHOT, TARGET, _translatable)
+    assert patch.pending == {}
+    assert patch.result == TARGET
+    assert patch.reused == 5
+
+
+def test_added_item_is_pending():
+    added = {"id": 3, "title": "Lead", "url": "https://c.example"}
+    source = dict(SNAPSHOT, experience=SNAPSHOT["experience"] + [added])
+    patch = plan_patch(source, SNAPSHOT, TARGET, _translatable)
+    assert patch.texts == {"experience/id=3/title": "Lead"}
+    assert patch.result["experience"][2] == added
+
+    assert apply_translations(patch, {"experience/id=3/title": "Leitung"}) == []
+    assert patch.result["experience"][2]["title"] == "Leitung"
+    assert patch.result["experience"][0]["title"] == "Ingenieur"
+
+
+def test_removed_item_is_dropped():
+    source = dict(SNAPSHOT, experience=SNAPSHOT["experience"][1:])
+    patch = plan_patch(source, SNAPSHOT, TARGET, _translatable)
+    assert patch.pending == {}
+    assert patch.result["experience"] == [{"id": 2, "title": "Praktikant", "url": "https://b.example"}]
+
+
+def test_reordered_items_follow_source_by_id():
+    source = dict(SNAPSHOT, experience=SNAPSHOT["experience"][::-1])
+    patch = plan_patch(source, SNAPSHOT, TARGET, _translatable)
+    assert patch.pending == {}
+    assert [item["title"] for item in patch.result["experience"]] == ["Praktikant", "Ingenieur"]
+
+
+def test_items_without_id_match_by_index():
+    source = dict(SNAPSHOT, skills=["Go", "Python"])
+    patch = plan_patch(source, SNAPSHOT, TARGET, _translatable)
+    # Swapped plain items no longer match their snapshot text at that index
+    assert patch.texts == {"skills/0": "Go", "skills/1": "Python"}
+
+
+def test_edited_text_and_untranslatable_leaves():
+    source = {
+        "summary": "Senior developer",
+        "experience": [{"id": 1, "title": "Engineer", "url": "https://new.example"}],
+        "skills": [],
+    }
+    patch = plan_patch(source, SNAPSHOT, TARGET, _translatable)
+    assert patch.texts == {"summary": "Senior developer"}
+    assert patch.result["experience"][0]["url"] == "https://new.example"
+
+    assert apply_translations(patch, {}) == ["summary"]
+    assert patch.result["summary"] == "Senior developer"
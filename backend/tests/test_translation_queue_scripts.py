@@ -0,0 +1,133 @@
+"""Lua scripts of the translation queue, run against fakeredis."""
+
+import asyncio
+import json
+
+import fakeredis
+import pytest
+
+from src.db import redis as redis_mod
+from src.services.translation_queue import (
+    _FINISH_SCRIPT,
+    _PROMOTE_SCRIPT,
+    _REQUEUE_SCRIPT,
+    TranslationJob,
+    requeue_dead_letters,
+)
+
+DELAYED = "translation:delayed"
+STREAM = "translation:jobs"
+PENDING = "translation:pending:cv:en"
+DEAD = "translation:dead"
+
+
+@pytest.fixture
+def client():
+    return fakeredis.aioredis.FakeRedis(decode_responses=True)
+
+
+def test_promote_moves_only_due_jobs(client):
+    async def scenario():
+        await client.zadd(DELAYED, {"job-a": 100, "job-b": 200, "job-c": 300})
+        moved = await client.eval(_PROMOTE_SCRIPT, 2, DELAYED, STREAM, 250, 100)
+        entries = await client.xrange(STREAM)
+        return moved, [fields["job"] for _, fields in entries], await client.zrange(DELAYED, 0, -1)
+
+    moved, streamed, left = asyncio.run(scenario())
+    assert moved == 2
+    assert streamed == ["job-a", "job-b"]
+    assert left == ["job-c"]
+
+
+def test_promote_respects_batch_limit(client):
+    async def scenario():
+        await client.zadd(DELAYED, {f"job-{i}": i for i in range(5)})
+        first = await client.eval(_PROMOTE_SCRIPT, 2, DELAYED, STREAM, 10, 3)
+        second = await client.eval(_PROMOTE_SCRIPT, 2, DELAYED, STREAM, 10, 3)
+        return first, second, await client.xlen(STREAM), await client.zcard(DELAYED)
+
+    assert asyncio.run(scenario()) == (3, 2, 5, 0)
+
+
+def test_promote_with_nothing_due(client):
+    async def scenario():
+        await client.zadd(DELAYED, {"job-a": 500})
+        moved = await client.eval(_PROMOTE_SCRIPT, 2, DELAYED, STREAM, 100, 100)
+        return moved, await client.exists(STREAM)
+
+    assert asyncio.run(scenario()) == (0, 0)
+
+
+def test_finish_removes_current_token(client):
+    async def scenario():
+        await client.hset(PENDING, mapping={"de": "tok-1", "fr": "tok-2"})
+        first = await client.eval(_FINISH_SCRIPT, 1, PENDING, "de", "tok-1")
+        last = await client.eval(_FINISH_SCRIPT, 1, PENDING, "fr", "tok-2")
+        return first, last, await client.exists(PENDING)
+
+    assert asyncio.run(scenario()) == (1, 0, 0)
+
+
+def test_finish_ignores_superseded_token(client):
+    async def scenario():
+        await client.hset(PENDING, "de", "tok-new")
+        result = await client.eval(_FINISH_SCRIPT, 1, PENDING, "de", "tok-old")
+        return result, await client.hget(PENDING, "de")
+
+    assert asyncio.run(scenario()) == (-1, "tok-new")
+
+
+def test_finish_on_missing_target(client):
+    assert asyncio.run(client.eval(_FINISH_SCRIPT, 1, PENDING, "de", "tok-1")) == -1
+
+
+def _dead_letter(token: str, target: str = "de", attempt: int = 5) -> str:
+    job = TranslationJob(kind="cv", entity_id="en", source="en", target=target, token=token, attempt=attempt)
+    return json.dumps({"job": json.loads(job.dumps()), "error": "boom", "failed_at": "2024-03-01T00:00:00+00:00"})
+
+
+def test_requeue_script_moves_current_entry(client):
+    async def scenario():
+        raw = _dead_letter("tok-1")
+        await client.hset(PENDING, "de", "tok-1")
+        await client.lpush(DEAD, raw)
+        moved = await client.eval(_REQUEUE_SCRIPT, 3, DEAD, STREAM, PENDING, raw, "de", "tok-1", "job-payload")
+        again = await client.eval(_REQUEUE_SCRIPT, 3, DEAD, STREAM, PENDING, raw, "de", "tok-1", "job-payload")
+        entries = await client.xrange(STREAM)
+        return moved, again, [fields["job"] for _, fields in entries], await client.llen(DEAD)
+
+    assert asyncio.run(scenario()) == (1, -1, ["job-payload"], 0)
+
+
+def test_requeue_script_drops_outdated_entry(client):
+    async def scenario():
+        raw = _dead_letter("tok-old")
+        await client.hset(PENDING, "de", "tok-new")
+        await client.lpush(DEAD, raw)
+        moved = await client.eval(_REQUEUE_SCRIPT, 3, DEAD, STREAM, PENDING, raw, "de", "tok-old", "job-payload")
+        return moved, await client.exists(STREAM), await client.llen(DEAD)
+
+    assert asyncio.run(scenario()) == (0, 0, 0)
+
+
+def test_requeue_dead_letters_skips_malformed_entries(client, monkeypatch):
+    monkeypatch.setattr(redis_mod, "redis_pool", client.connection_pool)
+
+    async def scenario():
+        await client.hset(PENDING, mapping={"de": "tok-1", "fr": "tok-2", "it": "tok-new"})
+        await client.lpush(
+            DEAD,
+            _dead_letter("tok-1", "de"),
+            "not json",
+            json.dumps({"job": {"kind": "cv"}}),
+            _dead_letter("tok-old", "it"),
+            _dead_letter("tok-2", "fr"),
+        )
+        requeued = await requeue_dead_letters()
+        jobs = [TranslationJob.loads(fields["job"]) for _, fields in await client.xrange(STREAM)]
+        return requeued, jobs, await client.lrange(DEAD, 0, -1)
+
+    requeued, jobs, left = asyncio.run(scenario())
+    assert requeued == 2
+    assert [(job.target, job.attempt) for job in jobs] == [("de", 0), ("fr", 0)]
+    assert left == [json.dumps({"job": {"kind": "cv"}}), "not json"]
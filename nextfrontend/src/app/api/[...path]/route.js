@@ -79,6 +79,10 @@ async function proxyRequest(request, { params }) {
     const accept = request.headers.get("accept");
     if (accept) headers.set("Accept", accept);
 
+    // Let the backend answer 304 for unchanged snapshots (e.g. /projects/ ETag)
+    const ifNoneMatch = request.headers.get("if-none-match");
+    if (ifNoneMatch) headers.set("If-None-Match", ifNoneMatch);
+
     // Forward client IP / proto info from nginx so the backend's
     // IPTrackingMiddleware sees the real visitor, not the proxy hop.
     for (const name of ["x-forwarded-for", "x-real-ip", "x-forwarded-proto", "x-forwarded-host"]) {